@@ -1,16 +1,19 @@
 """
-Configuration module - Credentials and constants management.
+SnapFlow Core - Shared Library
+==============================
+Multi-provider photo enhancement pipeline for DigitalOcean Functions.
+
+Re-exports the public API of the config, providers, notifications and
+utils subpackages so functions can simply `from shared import ...`.
 """
 
-from .credentials import (
+from .config import (
     get_client_encryption_key,
     decrypt_credential,
+    decrypt_credential_bytes,
     decrypt_credentials,
     mask_credentials,
     generate_fernet_key,
-)
-
-from .constants import (
     SHARED_VERSION,
     FILE_TYPE_CONFIG,
     SUPPORTED_EXTENSIONS,
@@ -18,6 +21,7 @@ from .constants import (
     RAW_HEADER_SIZE,
     DEFAULT_TIME_DELTA_SECONDS,
     DJI_TIME_DELTA_SECONDS,
+    DOWNLOAD_CHUNK_SIZE,
     # Provider identifiers
     STORAGE_PROVIDER_DROPBOX,
     STORAGE_PROVIDER_GOOGLE_DRIVE,
@@ -28,10 +32,38 @@ from .constants import (
     AUTOHDR_BASE_URL,
 )
 
+from .providers import (
+    BaseStorageProvider,
+    StorageFactory,
+    DropboxProvider,
+    BaseEnhancementProvider,
+    EnhancementFactory,
+    FotelloProvider,
+    AutoHDRProvider,
+)
+
+from .notifications import WebhookNotifier, NotificationLevel
+
+from .utils import (
+    normalize_dropbox_path,
+    validate_dropbox_path,
+    sanitize_filename_prefix,
+    get_content_type_for_file,
+    get_file_type_info,
+    validate_file_size,
+    prepare_upload,
+    get_file_extension,
+    get_memory_info,
+    force_garbage_collection,
+    clear_large_object,
+    get_http_session,
+)
+
 __all__ = [
     # Credentials
     "get_client_encryption_key",
     "decrypt_credential",
+    "decrypt_credential_bytes",
     "decrypt_credentials",
     "mask_credentials",
     "generate_fernet_key",
@@ -43,6 +75,7 @@ __all__ = [
     "RAW_HEADER_SIZE",
     "DEFAULT_TIME_DELTA_SECONDS",
     "DJI_TIME_DELTA_SECONDS",
+    "DOWNLOAD_CHUNK_SIZE",
     # Provider identifiers
     "STORAGE_PROVIDER_DROPBOX",
     "STORAGE_PROVIDER_GOOGLE_DRIVE",
@@ -51,4 +84,28 @@ __all__ = [
     # API endpoints
     "FOTELLO_BASE_URL",
     "AUTOHDR_BASE_URL",
+    # Providers
+    "BaseStorageProvider",
+    "StorageFactory",
+    "DropboxProvider",
+    "BaseEnhancementProvider",
+    "EnhancementFactory",
+    "FotelloProvider",
+    "AutoHDRProvider",
+    # Notifications
+    "WebhookNotifier",
+    "NotificationLevel",
+    # Utilities
+    "normalize_dropbox_path",
+    "validate_dropbox_path",
+    "sanitize_filename_prefix",
+    "get_content_type_for_file",
+    "get_file_type_info",
+    "validate_file_size",
+    "prepare_upload",
+    "get_file_extension",
+    "get_memory_info",
+    "force_garbage_collection",
+    "clear_large_object",
+    "get_http_session",
 ]
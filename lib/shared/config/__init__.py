@@ -5,6 +5,7 @@ Configuration module - Credentials and constants management.
 from .credentials import (
     get_client_encryption_key,
     decrypt_credential,
+    decrypt_credential_bytes,
     decrypt_credentials,
     mask_credentials,
     generate_fernet_key,
@@ -18,6 +19,7 @@ from .constants import (
     RAW_HEADER_SIZE,
     DEFAULT_TIME_DELTA_SECONDS,
     DJI_TIME_DELTA_SECONDS,
+    DOWNLOAD_CHUNK_SIZE,
     # Provider identifiers
     STORAGE_PROVIDER_DROPBOX,
     STORAGE_PROVIDER_GOOGLE_DRIVE,
@@ -32,6 +34,7 @@ __all__ = [
     # Credentials
     "get_client_encryption_key",
     "decrypt_credential",
+    "decrypt_credential_bytes",
     "decrypt_credentials",
     "mask_credentials",
     "generate_fernet_key",
@@ -43,6 +46,7 @@ __all__ = [
     "RAW_HEADER_SIZE",
     "DEFAULT_TIME_DELTA_SECONDS",
     "DJI_TIME_DELTA_SECONDS",
+    "DOWNLOAD_CHUNK_SIZE",
     # Provider identifiers
     "STORAGE_PROVIDER_DROPBOX",
     "STORAGE_PROVIDER_GOOGLE_DRIVE",
@@ -127,6 +127,15 @@ RETRY_DELAY_SECONDS: int = 2
 # Delay between finalize retry attempts (seconds)
 FINALIZE_RETRY_DELAY_SECONDS: int = 180  # 3 minutes
 
+# Shared provider HTTP session: hosts kept alive and connections per host
+HTTP_POOL_CONNECTIONS: int = 16
+HTTP_POOL_MAXSIZE: int = 32
+
+# Transport-level retries on the shared session (idempotent requests only)
+HTTP_RETRY_TOTAL: int = 3
+HTTP_RETRY_BACKOFF_FACTOR: float = 0.2
+HTTP_RETRY_STATUS_CODES: tuple = (429, 500, 502, 503, 504)
+
 # =============================================================================
 # UPLOAD CONFIGURATION
 # =============================================================================
@@ -140,6 +149,10 @@ MAX_UPLOAD_TIMEOUT: int = 900
 # Chunk size for large file uploads (bytes)
 UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # 8MB
 
+# Read size when streaming downloads (bytes); small reads inflate
+# per-chunk allocation and syscall overhead on multi-MB images
+DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024  # 1MB
+
 # =============================================================================
 # PROVIDER IDENTIFIERS
 # =============================================================================
@@ -13,9 +13,15 @@ Or use: generate_fernet_key() from this module.
 """
 
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Union
 from cryptography.fernet import Fernet
 
+try:
+    import rfernet as _rfernet
+except ImportError:  # pragma: no cover - optional speedup
+    _rfernet = None
+
 
 def generate_fernet_key() -> str:
     """
@@ -31,6 +37,39 @@ def generate_fernet_key() -> str:
     return Fernet.generate_key().decode()
 
 
+@lru_cache(maxsize=128)
+def _cached_client_key(client_id: str) -> str:
+    """
+    Look up a client's key once per warm container.
+    
+    Keyed by the client_id as given, so repeat calls skip upper-casing;
+    each spelling ("abc", "ABC") just gets its own entry for the same key.
+    
+    Raises KeyError when the variable is unset or empty; lru_cache does
+    not store exceptions, so a missing key is looked up again next call.
+    """
+    encryption_key = os.environ.get(f"CLIENT_{client_id.upper()}_ENCRYPTION_KEY")
+    if not encryption_key:
+        raise KeyError(client_id)
+    return encryption_key
+
+
+@lru_cache(maxsize=1)
+def _available_clients() -> Tuple[str, ...]:
+    """Client ids with a key configured, scanned from os.environ once."""
+    return tuple(
+        env_var.replace('CLIENT_', '').replace('_ENCRYPTION_KEY', '')
+        for env_var in os.environ
+        if env_var.endswith('_ENCRYPTION_KEY') and env_var.startswith('CLIENT_')
+    )
+
+
+def _clear_key_cache() -> None:
+    """Forget cached client keys and ids (for tests that change os.environ)."""
+    _cached_client_key.cache_clear()
+    _available_clients.cache_clear()
+
+
 def get_client_encryption_key(client_id: str) -> str:
     """
     Get encryption key for specific client from environment variables.
@@ -47,22 +86,81 @@ def get_client_encryption_key(client_id: str) -> str:
     if not client_id:
         raise ValueError("client_id is required for multi-client setup")
     
-    key_env_var = f"CLIENT_{client_id.upper()}_ENCRYPTION_KEY"
-    encryption_key = os.getenv(key_env_var)
-    
-    if not encryption_key:
-        available_clients = []
-        for env_var in os.environ:
-            if env_var.endswith('_ENCRYPTION_KEY') and env_var.startswith('CLIENT_'):
-                client_name = env_var.replace('CLIENT_', '').replace('_ENCRYPTION_KEY', '')
-                available_clients.append(client_name)
-        
+    try:
+        return _cached_client_key(client_id)
+    except KeyError:
         raise ValueError(
             f"No encryption key found for client '{client_id}'. "
-            f"Available clients: {available_clients}"
-        )
+            f"Available clients: {list(_available_clients())}"
+        ) from None
+
+
+class _NativeFernet:
+    """
+    Decrypt-only wrapper giving rfernet's Rust Fernet the cryptography API.
     
-    return encryption_key
+    rfernet uses the same key and token format but takes str tokens, so
+    bytes tokens are decoded first; plaintext is returned as bytes.
+    """
+    
+    __slots__ = ('_fernet',)
+    
+    def __init__(self, encryption_key: str):
+        self._fernet = _rfernet.Fernet(encryption_key)
+    
+    def decrypt(self, token: Union[bytes, str]) -> bytes:
+        if isinstance(token, bytes):
+            token = token.decode()
+        return self._fernet.decrypt(token)
+
+
+_Decryptor = Union[Fernet, _NativeFernet]
+
+
+@lru_cache(maxsize=32)
+def _get_fernet(encryption_key: str) -> _Decryptor:
+    """
+    Get a Fernet instance for a key, reusing it across decrypt calls.
+    
+    Uses rfernet (several times faster per decrypt) when it is installed,
+    otherwise cryptography's Fernet. Instances are immutable, so one per
+    client key can be shared for the lifetime of a warm container.
+    """
+    if _rfernet is not None:
+        return _NativeFernet(encryption_key)
+    return Fernet(encryption_key.encode())
+
+
+def _decrypt_bytes(token: Union[bytes, str], fernet: _Decryptor) -> bytes:
+    """
+    Decrypt a token to plaintext bytes.
+    
+    str tokens from JSON go straight to rfernet, which takes str natively;
+    only cryptography's Fernet needs them encoded first.
+    """
+    if isinstance(token, str) and not isinstance(fernet, _NativeFernet):
+        token = token.encode()
+    return fernet.decrypt(token)
+
+
+def decrypt_credential_bytes(encrypted_value: bytes, encryption_key: str) -> bytes:
+    """
+    Decrypt a single encrypted credential value held as bytes.
+    
+    Args:
+        encrypted_value: Fernet token bytes
+        encryption_key: Fernet key string
+        
+    Returns:
+        Decrypted bytes value
+        
+    Raises:
+        ValueError: If decryption fails
+    """
+    try:
+        return _decrypt_bytes(encrypted_value, _get_fernet(encryption_key))
+    except Exception as e:
+        raise ValueError(f"Failed to decrypt credential: {e}")
 
 
 def decrypt_credential(encrypted_value: str, encryption_key: str) -> str:
@@ -80,9 +178,8 @@ def decrypt_credential(encrypted_value: str, encryption_key: str) -> str:
         ValueError: If decryption fails
     """
     try:
-        fernet = Fernet(encryption_key.encode())
-        decrypted = fernet.decrypt(encrypted_value.encode()).decode()
-        return decrypted
+        fernet = _get_fernet(encryption_key)
+        return _decrypt_bytes(encrypted_value, fernet).decode()
     except Exception as e:
         raise ValueError(f"Failed to decrypt credential: {e}")
 
@@ -127,13 +224,15 @@ def decrypt_credentials(data: Dict[str, Any], client_id: str) -> Dict[str, Any]:
     """
     encryption_key = get_client_encryption_key(client_id)
     
+    # Plain legacy payloads (e.g. already decrypted) need no Fernet or rebuild
+    if not any(key in _PAYLOAD_ENCRYPTED_MARKERS for key in data):
+        return dict(data)
+    
     try:
-        fernet = Fernet(encryption_key.encode())
+        fernet = _get_fernet(encryption_key)
     except Exception as e:
         raise ValueError(f"Invalid encryption key format for client {client_id}: {e}")
     
-    decrypted_data = data.copy()
-    
     # Check if new format (has storage_credentials or enhancement_credentials)
     if 'storage_credentials' in data or 'enhancement_credentials' in data:
         decrypted_data = _decrypt_new_format(data, fernet, client_id)
@@ -143,7 +242,27 @@ def decrypt_credentials(data: Dict[str, Any], client_id: str) -> Dict[str, Any]:
     return decrypted_data
 
 
-def _decrypt_legacy_format(data: Dict[str, Any], fernet: Fernet, client_id: str) -> Dict[str, Any]:
+# Legacy flat field names: encrypted field -> decrypted field
+_LEGACY_ENCRYPTED_FIELDS: Dict[str, str] = {
+    # Storage providers
+    'dropbox_app_key_encrypted': 'dropbox_app_key',
+    'dropbox_app_secret_encrypted': 'dropbox_app_secret',
+    'dropbox_refresh_token_encrypted': 'dropbox_refresh_token',
+    'google_drive_client_id_encrypted': 'google_drive_client_id',
+    'google_drive_client_secret_encrypted': 'google_drive_client_secret',
+    'google_drive_refresh_token_encrypted': 'google_drive_refresh_token',
+    # Enhancement providers
+    'fotello_api_key_encrypted': 'fotello_api_key',
+    'autohdr_api_key_encrypted': 'autohdr_api_key',
+}
+
+# Top-level keys that mean a payload has something to decrypt
+_PAYLOAD_ENCRYPTED_MARKERS = frozenset(_LEGACY_ENCRYPTED_FIELDS) | {
+    'storage_credentials', 'enhancement_credentials',
+}
+
+
+def _decrypt_legacy_format(data: Dict[str, Any], fernet: _Decryptor, client_id: str) -> Dict[str, Any]:
     """
     Decrypt legacy format with flat encrypted fields.
     
@@ -157,48 +276,27 @@ def _decrypt_legacy_format(data: Dict[str, Any], fernet: Fernet, client_id: str)
         
     Note: autohdr_email is NOT encrypted (plain text field)
     """
-    decrypted_data = data.copy()
+    # One bulk copy, then swap only the encrypted fields that are present
+    decrypted_data = dict(data)
     
-    # Storage provider encrypted fields
-    storage_encrypted_fields = {
-        # Dropbox
-        'dropbox_app_key_encrypted': 'dropbox_app_key',
-        'dropbox_app_secret_encrypted': 'dropbox_app_secret',
-        'dropbox_refresh_token_encrypted': 'dropbox_refresh_token',
-        # Google Drive (future)
-        'google_drive_client_id_encrypted': 'google_drive_client_id',
-        'google_drive_client_secret_encrypted': 'google_drive_client_secret',
-        'google_drive_refresh_token_encrypted': 'google_drive_refresh_token',
-    }
-    
-    # Enhancement provider encrypted fields
-    enhancement_encrypted_fields = {
-        'fotello_api_key_encrypted': 'fotello_api_key',
-        'autohdr_api_key_encrypted': 'autohdr_api_key',
-    }
-    
-    # Combine all encrypted fields
-    all_encrypted_fields = {**storage_encrypted_fields, **enhancement_encrypted_fields}
-    
-    for encrypted_field, decrypted_field in all_encrypted_fields.items():
-        if encrypted_field in data and data[encrypted_field]:
-            try:
-                encrypted_value = data[encrypted_field].encode()
-                decrypted_value = fernet.decrypt(encrypted_value).decode()
-                decrypted_data[decrypted_field] = decrypted_value
-                del decrypted_data[encrypted_field]
-            except Exception as e:
-                raise ValueError(
-                    f"Failed to decrypt {encrypted_field} for client {client_id}: {e}"
-                )
+    for field, decrypted_field in _LEGACY_ENCRYPTED_FIELDS.items():
+        value = decrypted_data.get(field)
+        if not value:
+            continue
+        try:
+            decrypted_data[decrypted_field] = _decrypt_bytes(value, fernet).decode()
+        except Exception as e:
+            raise ValueError(
+                f"Failed to decrypt {field} for client {client_id}: {e}"
+            )
+        del decrypted_data[field]
     
     # Note: autohdr_email is NOT encrypted - it's passed through as-is
-    # The field is already in decrypted_data from the copy() above
     
     return decrypted_data
 
 
-def _decrypt_new_format(data: Dict[str, Any], fernet: Fernet, client_id: str) -> Dict[str, Any]:
+def _decrypt_new_format(data: Dict[str, Any], fernet: _Decryptor, client_id: str) -> Dict[str, Any]:
     """
     Decrypt new multi-provider format with nested credentials.
     """
@@ -213,7 +311,7 @@ def _decrypt_new_format(data: Dict[str, Any], fernet: Fernet, client_id: str) ->
             if key.endswith('_encrypted') and value:
                 try:
                     decrypted_key = key.replace('_encrypted', '')
-                    decrypted_storage[decrypted_key] = fernet.decrypt(value.encode()).decode()
+                    decrypted_storage[decrypted_key] = _decrypt_bytes(value, fernet).decode()
                 except Exception as e:
                     raise ValueError(
                         f"Failed to decrypt storage credential {key} for client {client_id}: {e}"
@@ -232,7 +330,7 @@ def _decrypt_new_format(data: Dict[str, Any], fernet: Fernet, client_id: str) ->
             if key.endswith('_encrypted') and value:
                 try:
                     decrypted_key = key.replace('_encrypted', '')
-                    decrypted_enhancement[decrypted_key] = fernet.decrypt(value.encode()).decode()
+                    decrypted_enhancement[decrypted_key] = _decrypt_bytes(value, fernet).decode()
                 except Exception as e:
                     raise ValueError(
                         f"Failed to decrypt enhancement credential {key} for client {client_id}: {e}"
@@ -245,6 +343,34 @@ def _decrypt_new_format(data: Dict[str, Any], fernet: Fernet, client_id: str) ->
     return decrypted_data
 
 
+# Field names whose values are masked for logging
+_SENSITIVE_FIELDS = frozenset({
+    'dropbox_app_key', 'dropbox_app_secret', 'dropbox_refresh_token',
+    'fotello_api_key', 'autohdr_api_key',
+    'google_drive_client_id', 'google_drive_client_secret', 'google_drive_refresh_token',
+    'api_key', 'access_token', 'refresh_token', 'client_secret',
+})
+
+# Nested credential dicts that are masked recursively
+_NESTED_CREDENTIAL_FIELDS = frozenset({'storage_credentials', 'enhancement_credentials'})
+
+# Every key _mask_value may change; all other values are copied as-is
+_MASKED_FIELDS = _SENSITIVE_FIELDS | _NESTED_CREDENTIAL_FIELDS
+
+
+def _mask_value(key: str, value: Any) -> Any:
+    """Mask a single entry of a credentials dict."""
+    if key in _SENSITIVE_FIELDS:
+        if not value:
+            return value
+        if isinstance(value, str) and len(value) > 8:
+            return f"{value[:4]}...{value[-4:]}"
+        return "***"
+    if key in _NESTED_CREDENTIAL_FIELDS and isinstance(value, dict):
+        return mask_credentials(value)
+    return value
+
+
 def mask_credentials(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a masked copy of data for safe logging.
@@ -258,25 +384,7 @@ def mask_credentials(data: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return data
     
-    masked = data.copy()
-    sensitive_fields = [
-        'dropbox_app_key', 'dropbox_app_secret', 'dropbox_refresh_token',
-        'fotello_api_key', 'autohdr_api_key',
-        'google_drive_client_id', 'google_drive_client_secret', 'google_drive_refresh_token',
-        'api_key', 'access_token', 'refresh_token', 'client_secret',
-    ]
-    
-    for field in sensitive_fields:
-        if field in masked and masked[field]:
-            value = masked[field]
-            if isinstance(value, str) and len(value) > 8:
-                masked[field] = f"{value[:4]}...{value[-4:]}"
-            else:
-                masked[field] = "***"
-    
-    # Handle nested credentials
-    for nested_key in ['storage_credentials', 'enhancement_credentials']:
-        if nested_key in masked and isinstance(masked[nested_key], dict):
-            masked[nested_key] = mask_credentials(masked[nested_key])
-    
-    return masked
+    return {
+        key: _mask_value(key, value) if key in _MASKED_FIELDS else value
+        for key, value in data.items()
+    }
@@ -4,10 +4,11 @@ Webhook Notifier
 Centralized webhook notification management with configurable verbosity levels.
 """
 
+import threading
 import time
 import requests
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 
 
 class NotificationLevel(Enum):
@@ -35,6 +36,12 @@ class WebhookNotifier:
         
         notifier.send_debug("process_started", {"files": 10})
         notifier.send_business("job_completed", {...})
+        
+        # With batch_debug=True, low-priority progress events are
+        # coalesced into one POST (a JSON array); otherwise they are sent
+        # one object per POST like send_debug()
+        notifier.send_debug_buffered("bracket_processing_started", {...})
+        notifier.flush()
     """
     
     # Critical notifications always sent regardless of level
@@ -52,6 +59,11 @@ class WebhookNotifier:
         'bracket_processing_started', 'process_completed_success',
     ])
     
+    # With batch_debug, buffered debug events are POSTed as one JSON array
+    # once this many are queued or the oldest has waited this long
+    DEBUG_BATCH_SIZE = 16
+    DEBUG_BATCH_INTERVAL_SECONDS = 2.0
+    
     # Verbose-only notifications (skip in standard mode)
     VERBOSE_ONLY = frozenset([
         'status_checked', 'upload_attempt_details', 'upload_result_details',
@@ -63,10 +75,12 @@ class WebhookNotifier:
         callback_webhook: str,
         job_id: str = None,
         listing_id: str = None,
+        client_id: str = None,
         correlation_id: str = None,
-        notification_level: str = "minimal",
+        notification_level: Union[str, NotificationLevel] = "minimal",
         function_name: str = "unknown",
         version: str = "unknown",
+        batch_debug: bool = False,
     ):
         """
         Initialize webhook notifier.
@@ -75,21 +89,40 @@ class WebhookNotifier:
             callback_webhook: URL to send notifications to
             job_id: Job identifier
             listing_id: Listing identifier
+            client_id: Client identifier (included in debug payloads when set)
             correlation_id: Request correlation ID for tracing
-            notification_level: One of 'errors_only', 'minimal', 'standard', 'verbose'
+            notification_level: One of 'errors_only', 'minimal', 'standard',
+                'verbose', or a NotificationLevel
             function_name: Name of the calling function
             version: Version string for tracking
+            batch_debug: Opt in to send_debug_buffered() batching, which
+                POSTs debug events as JSON arrays instead of one object each
         """
         self.callback_webhook = callback_webhook
         self.job_id = job_id
         self.listing_id = listing_id
+        self.client_id = client_id
         self.correlation_id = correlation_id
         self.function_name = function_name
         self.version = version
+        self.batch_debug = batch_debug
+        
+        # Debug events queued by send_debug_buffered(); bracket workers
+        # send from their own threads
+        self._debug_buffer: List[Dict[str, Any]] = []
+        self._buffer_started = 0.0
+        self._buffer_lock = threading.Lock()
+        # Held by flush() while draining the queue and POSTing, so a batch
+        # taken by one thread is delivered before anything another thread
+        # sends; single-object POSTs never hold it
+        self._send_lock = threading.Lock()
         
         # Parse notification level
         try:
-            self.notification_level = NotificationLevel(notification_level.lower())
+            if isinstance(notification_level, NotificationLevel):
+                self.notification_level = notification_level
+            else:
+                self.notification_level = NotificationLevel(notification_level.lower())
         except (ValueError, AttributeError):
             self.notification_level = NotificationLevel.MINIMAL
     
@@ -149,19 +182,11 @@ class WebhookNotifier:
             return False
         
         try:
-            payload = {
-                'debug_status': status,
-                'function_name': self.function_name,
-                'log_level': log_level,
-                'job_id': self.job_id,
-                'listing_id': self.listing_id,
-                'timestamp': time.time(),
-                'version': self.version,
-                'correlation_id': self.correlation_id,
-            }
+            payload = self._debug_payload(status, extra_data, log_level)
             
-            if extra_data:
-                payload.update(extra_data)
+            # Keep webhook order: anything buffered earlier goes out first
+            if self.batch_debug:
+                self.flush()
             
             response = requests.post(
                 self.callback_webhook,
@@ -177,6 +202,116 @@ class WebhookNotifier:
             print(f"Failed to send debug notification '{status}': {e}")
             return False
     
+    def send_debug_buffered(
+        self,
+        status: str,
+        extra_data: Dict[str, Any] = None,
+        log_level: str = "INFO",
+    ) -> bool:
+        """
+        Queue a debug notification to be sent in a batch.
+        
+        Only batches when the notifier was created with batch_debug=True;
+        otherwise this is send_debug(), one JSON object per POST.
+        
+        Queued events are POSTed together as a JSON array (each element is
+        the payload send_debug() would send) once DEBUG_BATCH_SIZE events
+        are queued or DEBUG_BATCH_INTERVAL_SECONDS have passed since the
+        first one. Errors and critical notifications are not queued: they
+        flush the queue and are sent immediately. Call flush() before the
+        function returns.
+        
+        Args:
+            status: Status identifier (e.g., 'bracket_processing_started')
+            extra_data: Additional data to include
+            log_level: Log level (INFO, ERROR, WARNING, DEBUG)
+            
+        Returns:
+            True if the notification was queued or sent
+        """
+        if (
+            not self.batch_debug
+            or log_level == "ERROR"
+            or status in self.CRITICAL_NOTIFICATIONS
+        ):
+            return self.send_debug(status, extra_data, log_level)
+        
+        if not self.callback_webhook:
+            return False
+        
+        if not self._should_send(status, log_level):
+            return False
+        
+        payload = self._debug_payload(status, extra_data, log_level)
+        with self._buffer_lock:
+            if not self._debug_buffer:
+                self._buffer_started = time.monotonic()
+            self._debug_buffer.append(payload)
+            due = (
+                len(self._debug_buffer) >= self.DEBUG_BATCH_SIZE
+                or time.monotonic() - self._buffer_started >= self.DEBUG_BATCH_INTERVAL_SECONDS
+            )
+        
+        if due:
+            self.flush()
+        return True
+    
+    def flush(self) -> bool:
+        """
+        Send all queued debug notifications as one JSON array.
+        
+        Returns:
+            True if the queue was empty or the batch was sent successfully
+        """
+        with self._send_lock:
+            with self._buffer_lock:
+                batch = self._debug_buffer
+                self._debug_buffer = []
+            
+            if not batch:
+                return True
+            
+            try:
+                response = requests.post(
+                    self.callback_webhook,
+                    json=batch,
+                    timeout=10,
+                    headers={'Content-Type': 'application/json'}
+                )
+                
+                print(f"Debug notifications sent: {len(batch)} batched")
+                return response.status_code < 400
+                
+            except Exception as e:
+                print(f"Failed to send {len(batch)} batched debug notifications: {e}")
+                return False
+    
+    def _debug_payload(
+        self,
+        status: str,
+        extra_data: Optional[Dict[str, Any]],
+        log_level: str,
+    ) -> Dict[str, Any]:
+        """Build the JSON body of a debug notification."""
+        payload = {
+            'debug_status': status,
+            'function_name': self.function_name,
+            'log_level': log_level,
+            'job_id': self.job_id,
+            'listing_id': self.listing_id,
+            'timestamp': time.time(),
+            'version': self.version,
+            'correlation_id': self.correlation_id,
+        }
+        
+        if self.client_id:
+            payload['client_id'] = self.client_id
+        
+        if extra_data:
+            payload.update(extra_data)
+        
+        return payload
+    
     def send_business(
         self,
         notification_type: str,
@@ -205,6 +340,9 @@ class WebhookNotifier:
             job_data['correlation_id'] = self.correlation_id
             job_data['version'] = self.version
             
+            if self.batch_debug:
+                self.flush()
+            
             response = requests.post(
                 self.callback_webhook,
                 json=job_data,
@@ -311,4 +449,5 @@ def create_notifier_from_event(
         notification_level=event_data.get('notification_level', 'minimal'),
         function_name=function_name,
         version=version,
+        batch_debug=bool(event_data.get('batch_debug_notifications', False)),
     )
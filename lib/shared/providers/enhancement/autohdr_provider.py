@@ -16,9 +16,11 @@ import uuid
 import mimetypes
 import requests
 import gc
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Dict, Any, Optional, Tuple, Union
 
 from .base import BaseEnhancementProvider, EnhancementStatus
+from ...utils.http_utils import get_http_session
 
 
 class AutoHDRProvider(BaseEnhancementProvider):
@@ -37,6 +39,16 @@ class AutoHDRProvider(BaseEnhancementProvider):
     
     API_BASE_URL = "https://quantumreachadvertising.com/external-api"
     
+    # A bracket is uploaded as one photoshoot via upload_images()
+    supports_batch_upload = True
+    
+    # Results arrive via the status_callback_url webhook, never by polling
+    webhook_based = True
+    
+    # Presigned S3 PUTs go to independent objects, so a bracket's files are
+    # uploaded concurrently (bounded well below the shared pool size)
+    S3_UPLOAD_WORKERS = 8
+    
     # AutoHDR-specific status mapping
     STATUS_MAPPING = {
         'pending': EnhancementStatus.PENDING,
@@ -48,21 +60,30 @@ class AutoHDRProvider(BaseEnhancementProvider):
         'error': EnhancementStatus.FAILED
     }
     
-    def __init__(self, api_key: str, email: str = None):
+    def __init__(
+        self,
+        api_key: str,
+        email: str = None,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize AutoHDR provider.
         
         Args:
             api_key: AutoHDR API key (Bearer token)
             email: AutoHDR account email (required for all API calls)
+            session: HTTP session to send requests through (defaults to
+                the shared pooled session)
         """
         self.api_key = api_key.strip() if api_key else ""
         self.email = email
-        self.session = requests.Session()
-        self.session.headers.update({
+        # The session may be shared with other providers, so auth headers
+        # are sent per request rather than set on the session
+        self.session = session or get_http_session()
+        self._headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Accept': 'application/json'
-        })
+        }
         self._connected = False
         
         # Track active photoshoots for batch operations
@@ -92,7 +113,7 @@ class AutoHDRProvider(BaseEnhancementProvider):
         if credentials:
             if 'api_key' in credentials:
                 self.api_key = credentials['api_key'].strip()
-                self.session.headers['Authorization'] = f'Bearer {self.api_key}'
+                self._headers['Authorization'] = f'Bearer {self.api_key}'
             if 'email' in credentials:
                 self.email = credentials['email']
         
@@ -101,6 +122,7 @@ class AutoHDRProvider(BaseEnhancementProvider):
         try:
             response = self.session.get(
                 f"{self.API_BASE_URL}/v1/user/profile",
+                headers=self._headers,
                 timeout=10
             )
             
@@ -134,7 +156,7 @@ class AutoHDRProvider(BaseEnhancementProvider):
     def upload_image(
         self,
         filename: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO],
         content_type: Optional[str] = None,
     ) -> str:
         """
@@ -145,7 +167,7 @@ class AutoHDRProvider(BaseEnhancementProvider):
         
         Args:
             filename: Original filename
-            data: Image bytes
+            data: Image bytes or a seekable binary file
             content_type: MIME type (auto-detected if not provided)
             
         Returns:
@@ -169,9 +191,52 @@ class AutoHDRProvider(BaseEnhancementProvider):
         # Return listing_id as the upload identifier
         return result.get('listing_id', unique_id)
     
+    def upload_images(self, images: List[Tuple[str, Union[bytes, BinaryIO]]]) -> List[str]:
+        """
+        Upload a bracket as a single AutoHDR photoshoot.
+        
+        One presigned-URL request covers every file in the bracket,
+        instead of one photoshoot per file as with upload_image().
+        
+        Args:
+            images: List of (filename, data) tuples
+            
+        Returns:
+            The photoshoot listing_id, once per file
+            
+        Raises:
+            IOError: If any file in the bracket failed to upload; the
+                photoshoot is already finalized, so a partial bracket is
+                not reported as uploaded
+        """
+        if not images:
+            return []
+        
+        if not self.email:
+            raise ValueError("AutoHDR email required for uploads. Set email on provider.")
+        
+        result = self.upload_batch(
+            images=images,
+            unique_identifier=str(uuid.uuid4()),
+            address=f"Bracket upload {images[0][0]}"
+        )
+        
+        listing_id = result.get('listing_id')
+        if not listing_id:
+            raise IOError(f"Upload failed: {result.get('error', 'Unknown error')}")
+        
+        successful_uploads = result.get('successful_uploads', 0)
+        if successful_uploads < len(images):
+            raise IOError(
+                f"Bracket upload incomplete: {successful_uploads}/{len(images)} files "
+                f"uploaded to photoshoot {listing_id}"
+            )
+        
+        return [listing_id] * successful_uploads
+    
     def upload_batch(
         self,
-        images: List[Tuple[str, bytes]],
+        images: List[Tuple[str, Union[bytes, BinaryIO]]],
         unique_identifier: str,
         address: str,
         twilight: bool = False,
@@ -186,7 +251,8 @@ class AutoHDRProvider(BaseEnhancementProvider):
         This is the recommended method for AutoHDR uploads.
         
         Args:
-            images: List of (filename, file_bytes) tuples
+            images: List of (filename, file_bytes) tuples; file_bytes may
+                also be a seekable binary file, which is streamed to S3
             unique_identifier: UUID for grouping files into photoshoot
             address: Property address (photoshoot identifier)
             twilight: Enable twilight processing
@@ -220,6 +286,7 @@ class AutoHDRProvider(BaseEnhancementProvider):
             response = self.session.post(
                 f"{self.API_BASE_URL}/v1/create-photoshoot-with-presigned-urls",
                 json=presigned_request,
+                headers=self._headers,
                 timeout=30
             )
             
@@ -249,48 +316,16 @@ class AutoHDRProvider(BaseEnhancementProvider):
             # Step 2: Upload each file to S3
             print(f"→ Uploading {len(images)} files to S3...")
             
-            upload_results = []
-            failed_uploads = []
+            workers = max(1, min(self.S3_UPLOAD_WORKERS, len(images)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="autohdr-s3") as executor:
+                filenames, payloads = zip(*images)
+                upload_results = list(executor.map(
+                    self._put_presigned, filenames, payloads, presigned_urls
+                ))
             
-            for i, ((filename, file_bytes), presigned_url) in enumerate(zip(images, presigned_urls), 1):
-                try:
-                    detected_content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
-                    
-                    s3_response = requests.put(
-                        presigned_url,
-                        data=file_bytes,
-                        headers={'Content-Type': detected_content_type},
-                        timeout=300  # 5 minutes per file
-                    )
-                    
-                    if s3_response.status_code in [200, 204]:
-                        upload_results.append({
-                            'filename': filename,
-                            'status': 'success',
-                            's3_status': s3_response.status_code
-                        })
-                        self._active_photoshoots[unique_identifier]['uploaded'] += 1
-                    else:
-                        failed_uploads.append(filename)
-                        upload_results.append({
-                            'filename': filename,
-                            'status': 'failed',
-                            's3_status': s3_response.status_code,
-                            'error': s3_response.text[:200]
-                        })
-                        self._active_photoshoots[unique_identifier]['failed'] += 1
-                        
-                except Exception as e:
-                    failed_uploads.append(filename)
-                    upload_results.append({
-                        'filename': filename,
-                        'status': 'failed',
-                        'error': str(e)
-                    })
-                    self._active_photoshoots[unique_identifier]['failed'] += 1
-                
-                # Clear file bytes from memory immediately
-                file_bytes = None
+            failed_uploads = [r['filename'] for r in upload_results if r['status'] != 'success']
+            self._active_photoshoots[unique_identifier]['uploaded'] += len(images) - len(failed_uploads)
+            self._active_photoshoots[unique_identifier]['failed'] += len(failed_uploads)
             
             # Force garbage collection after batch
             gc.collect()
@@ -317,6 +352,48 @@ class AutoHDRProvider(BaseEnhancementProvider):
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _put_presigned(
+        self,
+        filename: str,
+        file_bytes: Union[bytes, BinaryIO],
+        presigned_url: str
+    ) -> Dict[str, Any]:
+        """
+        PUT one file to its presigned S3 URL.
+        
+        Returns:
+            Upload result dict with filename, status and s3_status/error
+        """
+        try:
+            detected_content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            
+            s3_response = self.session.put(
+                presigned_url,
+                data=file_bytes,
+                headers={'Content-Type': detected_content_type},
+                timeout=300  # 5 minutes per file
+            )
+            
+            if s3_response.status_code in [200, 204]:
+                return {
+                    'filename': filename,
+                    'status': 'success',
+                    's3_status': s3_response.status_code
+                }
+            return {
+                'filename': filename,
+                'status': 'failed',
+                's3_status': s3_response.status_code,
+                'error': s3_response.text[:200]
+            }
+            
+        except Exception as e:
+            return {
+                'filename': filename,
+                'status': 'failed',
+                'error': str(e)
+            }
+    
     def finalize_photoshoot(self, unique_identifier: str) -> bool:
         """
         Finalize a photoshoot upload to trigger processing.
@@ -340,6 +417,7 @@ class AutoHDRProvider(BaseEnhancementProvider):
                     'email': self.email,
                     'unique_identifier': unique_identifier
                 },
+                headers=self._headers,
                 timeout=30
             )
             
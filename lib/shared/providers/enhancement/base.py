@@ -7,10 +7,14 @@ All enhancement providers (Fotello, AutoHDR, etc.) must implement
 this interface to be usable with the SnapFlow EnhancementFactory.
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Dict, Any, Optional, Tuple, Union
 from enum import Enum
 
+from ...config.constants import DOWNLOAD_CHUNK_SIZE
+
 
 class EnhancementStatus(Enum):
     """Standard enhancement status values across all providers."""
@@ -54,11 +58,20 @@ class BaseEnhancementProvider(ABC):
             time.sleep(30)
     """
     
+    # Providers that can upload a whole bracket in one request set this
+    # and override upload_images()
+    supports_batch_upload: bool = False
+    
+    # Providers that push results to a status callback instead of exposing
+    # a status endpoint set this; check_status() then makes no API call and
+    # polling it is pointless
+    webhook_based: bool = False
+    
     @abstractmethod
     def upload_image(
         self,
         filename: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO],
         content_type: Optional[str] = None,
     ) -> str:
         """
@@ -66,7 +79,8 @@ class BaseEnhancementProvider(ABC):
         
         Args:
             filename: Original filename (used for content-type detection)
-            data: Image data as bytes
+            data: Image data as bytes, or a seekable binary file positioned
+                at the start of the image
             content_type: Optional MIME type override
             
         Returns:
@@ -78,6 +92,28 @@ class BaseEnhancementProvider(ABC):
         """
         pass
     
+    def upload_images(self, images: List[Tuple[str, Union[bytes, BinaryIO]]]) -> List[str]:
+        """
+        Upload the images of one bracket.
+        
+        Default implementation calls upload_image() for each image and
+        skips images that fail. Providers with a batch endpoint override
+        this and set supports_batch_upload.
+        
+        Args:
+            images: List of (filename, data) tuples; data as in upload_image()
+            
+        Returns:
+            One upload ID per successfully uploaded image
+        """
+        upload_ids = []
+        for filename, data in images:
+            try:
+                upload_ids.append(self.upload_image(filename, data))
+            except Exception as e:
+                print(f"Failed to upload {filename}: {e}")
+        return upload_ids
+    
     @abstractmethod
     def request_enhancement(
         self,
@@ -128,6 +164,67 @@ class BaseEnhancementProvider(ABC):
         """
         pass
     
+    def check_statuses(
+        self,
+        enhancement_ids: List[str],
+        max_workers: int = 10,
+        failure_threshold: int = 5,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Check the status of several enhancement requests at once.
+        
+        Providers whose API accepts multiple IDs per request should
+        override this. The default fans check_status() out over a small
+        thread pool so one polling round costs ~1 round trip, not N.
+        
+        Acts as a simple circuit breaker: after failure_threshold
+        consecutive failed lookups the status endpoint is treated as down
+        and the remaining IDs are reported as errors without being
+        requested, instead of each waiting out its own timeout.
+        
+        Args:
+            enhancement_ids: Enhancement IDs from request_enhancement()
+            max_workers: Maximum concurrent status requests
+            failure_threshold: Consecutive failures that open the breaker
+            
+        Returns:
+            Dict mapping enhancement_id to its check_status() result.
+            Lookups that raise map to {'status': 'error', 'error': str}.
+        """
+        unique_ids = list(dict.fromkeys(enhancement_ids))
+        if not unique_ids:
+            return {}
+        
+        lock = threading.Lock()
+        breaker = {'failures': 0, 'last_error': None}
+        
+        def _check(enhancement_id: str) -> Dict[str, Any]:
+            with lock:
+                if breaker['failures'] >= failure_threshold:
+                    return {
+                        'status': 'error',
+                        'enhancement_id': enhancement_id,
+                        'error': f"Status checks skipped after repeated failures: {breaker['last_error']}",
+                    }
+            try:
+                result = self.check_status(enhancement_id)
+            except Exception as e:
+                with lock:
+                    breaker['failures'] += 1
+                    breaker['last_error'] = str(e)
+                return {
+                    'status': 'error',
+                    'enhancement_id': enhancement_id,
+                    'error': str(e),
+                }
+            with lock:
+                breaker['failures'] = 0
+            return result
+        
+        workers = max(1, min(max_workers, len(unique_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique_ids, executor.map(_check, unique_ids)))
+    
     @abstractmethod
     def get_provider_type(self) -> str:
         """
@@ -186,9 +283,13 @@ class BaseEnhancementProvider(ABC):
             return None
         
         try:
-            response = requests.get(url, timeout=300)
-            response.raise_for_status()
-            return response.content
+            with requests.get(url, stream=True, timeout=300) as response:
+                response.raise_for_status()
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        buf.extend(chunk)
+            return bytes(buf)
         except Exception as e:
             print(f"Failed to download enhanced image: {e}")
             return None
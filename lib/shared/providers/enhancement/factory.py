@@ -8,6 +8,8 @@ Supports both legacy credential format (flat fields) and new multi-provider form
 
 from typing import Dict, Any, Optional
 
+import requests
+
 from .base import BaseEnhancementProvider
 from .fotello_provider import FotelloProvider
 from .autohdr_provider import AutoHDRProvider
@@ -50,6 +52,7 @@ class EnhancementFactory:
         provider_type: str,
         api_key: str,
         email: Optional[str] = None,
+        session: Optional[requests.Session] = None,
         **kwargs
     ) -> BaseEnhancementProvider:
         """
@@ -59,6 +62,7 @@ class EnhancementFactory:
             provider_type: Provider type ('fotello', 'autohdr')
             api_key: API key for the provider
             email: Email address (required for AutoHDR)
+            session: HTTP session to share (defaults to the pooled session)
             **kwargs: Additional provider-specific arguments
             
         Returns:
@@ -86,16 +90,17 @@ class EnhancementFactory:
             # AutoHDR requires email for API calls
             if not email:
                 raise ValueError("AutoHDR provider requires 'email' parameter")
-            return provider_class(api_key, email)
+            return provider_class(api_key, email, session=session)
         else:
             # Standard provider (Fotello)
-            return provider_class(api_key)
+            return provider_class(api_key, session=session)
     
     @classmethod
     def create_from_credentials(
         cls,
         decrypted_data: Dict[str, Any],
         provider_type: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ) -> BaseEnhancementProvider:
         """
         Create enhancement provider from decrypted credential data.
@@ -125,6 +130,7 @@ class EnhancementFactory:
         Args:
             decrypted_data: Decrypted credential dictionary
             provider_type: Override provider type (auto-detected if None)
+            session: HTTP session to share (defaults to the pooled session)
             
         Returns:
             Configured enhancement provider instance
@@ -149,7 +155,7 @@ class EnhancementFactory:
         api_key = cls._extract_api_key(decrypted_data, detected_type)
         email = cls._extract_email(decrypted_data, detected_type)
         
-        return cls.create(detected_type, api_key, email=email)
+        return cls.create(detected_type, api_key, email=email, session=session)
     
     @classmethod
     def _extract_api_key(
@@ -10,8 +10,9 @@ Features:
 - Content-type detection for RAW files
 """
 
+import os
 import requests
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, List, Dict, Any, Optional, Union
 
 from .base import BaseEnhancementProvider, EnhancementStatus
 from ...config.constants import (
@@ -26,6 +27,17 @@ from ...utils.file_utils import (
     get_file_type_info,
     calculate_upload_timeout,
 )
+from ...utils.http_utils import get_http_session
+
+
+def _payload_size(data: Union[bytes, BinaryIO]) -> int:
+    """Size in bytes of upload data given as bytes or a seekable binary file"""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return len(data)
+    position = data.tell()
+    size = data.seek(0, os.SEEK_END) - position
+    data.seek(position)
+    return size
 
 
 class FotelloProvider(BaseEnhancementProvider):
@@ -44,14 +56,17 @@ class FotelloProvider(BaseEnhancementProvider):
     - getEnhance: Check enhancement status
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize Fotello provider.
         
         Args:
             api_key: Fotello API key for authentication
+            session: HTTP session to send requests through (defaults to
+                the shared pooled session)
         """
         self.api_key = api_key
+        self._http = session or get_http_session()
         self._headers = {
             'Content-Type': 'application/json',
             'Authorization': api_key,
@@ -60,7 +75,7 @@ class FotelloProvider(BaseEnhancementProvider):
     def upload_image(
         self,
         filename: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO],
         content_type: Optional[str] = None,
     ) -> str:
         """
@@ -73,13 +88,14 @@ class FotelloProvider(BaseEnhancementProvider):
         
         Args:
             filename: Original filename
-            data: Image data as bytes
+            data: Image data as bytes, or a seekable binary file that is
+                streamed to the presigned URL without loading it into memory
             content_type: Optional MIME type (auto-detected if not provided)
             
         Returns:
             Upload ID string
         """
-        file_size = len(data)
+        file_size = _payload_size(data)
         file_size_mb = file_size / (1024 * 1024)
         
         # Get file type info for timeout calculation
@@ -107,7 +123,7 @@ class FotelloProvider(BaseEnhancementProvider):
         # Step 3: Upload to presigned URL
         # Note: Fotello presigned URLs expect application/octet-stream
         try:
-            upload_response = requests.put(
+            upload_response = self._http.put(
                 presigned_url,
                 data=data,
                 headers={'Content-Type': 'application/octet-stream'},
@@ -140,7 +156,7 @@ class FotelloProvider(BaseEnhancementProvider):
             Response dict with 'url' and 'id' fields
         """
         try:
-            response = requests.post(
+            response = self._http.post(
                 FOTELLO_UPLOAD_ENDPOINT,
                 json={'filename': filename},
                 headers=self._headers,
@@ -179,7 +195,7 @@ class FotelloProvider(BaseEnhancementProvider):
         }
         
         try:
-            response = requests.post(
+            response = self._http.post(
                 FOTELLO_ENHANCE_ENDPOINT,
                 json=payload,
                 headers=self._headers,
@@ -214,7 +230,7 @@ class FotelloProvider(BaseEnhancementProvider):
             - error: Error message when failed
         """
         try:
-            response = requests.get(
+            response = self._http.get(
                 f"{FOTELLO_GET_ENHANCE_ENDPOINT}?id={enhancement_id}",
                 headers={'Authorization': self.api_key},
                 timeout=30,
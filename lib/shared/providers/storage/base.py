@@ -11,7 +11,9 @@ Unlike desktop applications, serverless storage providers need to:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+
+from ...config.constants import DOWNLOAD_CHUNK_SIZE
 
 
 class BaseStorageProvider(ABC):
@@ -28,6 +30,10 @@ class BaseStorageProvider(ABC):
     - Progress callbacks are logging-only (no UI)
     """
     
+    # Providers built on requests set this and accept a `session` argument
+    # so StorageFactory can hand them a shared connection pool
+    supports_http_session: bool = False
+    
     @abstractmethod
     def connect(self, credentials: Dict[str, Any]) -> bool:
         """
@@ -205,6 +211,23 @@ class BaseStorageProvider(ABC):
         """
         return False
     
+    def download_stream(self, path: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Download file content as a sequence of chunks.
+        
+        Default implementation downloads the whole file and yields it as
+        one chunk. Subclasses should override to stream from the API so
+        callers never hold the full file in memory.
+        
+        Args:
+            path: Full path to file in storage
+            chunk_size: Preferred chunk size in bytes
+            
+        Yields:
+            File content chunks in order
+        """
+        yield self.download_file(path)
+    
     def create_folder(self, folder_path: str) -> bool:
         """
         Create a folder in storage.
@@ -220,6 +243,21 @@ class BaseStorageProvider(ABC):
         """
         raise NotImplementedError("Folder creation not supported by this provider")
     
+    def delete_files_batch(self, paths: List[str]) -> int:
+        """
+        Delete several files in as few API round-trips as possible.
+        
+        Default implementation raises NotImplementedError.
+        Subclasses should override if deletion is supported.
+        
+        Args:
+            paths: Paths (or file IDs) of files to delete
+            
+        Returns:
+            Number of files deleted
+        """
+        raise NotImplementedError("Deletion not supported by this provider")
+    
     def file_exists(self, path: str) -> bool:
         """
         Check if a file exists in storage.
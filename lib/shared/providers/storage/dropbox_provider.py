@@ -11,8 +11,9 @@ Features:
 - Chunked uploads for large files
 """
 
+import time
 import requests
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 import dropbox
 import dropbox.common
@@ -23,9 +24,23 @@ from .base import BaseStorageProvider
 from ...config.constants import (
     DROPBOX_TOKEN_URL,
     DROPBOX_CONTENT_URL,
+    DOWNLOAD_CHUNK_SIZE,
     UPLOAD_CHUNK_SIZE,
 )
 from ...utils.file_utils import normalize_dropbox_path, validate_dropbox_path
+from ...utils.http_utils import get_http_session
+
+
+def _rechunk(chunks: Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Regroup an iterable of byte chunks into pieces of exactly `size` (last may be shorter)."""
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk
+        while len(pending) >= size:
+            yield bytes(pending[:size])
+            del pending[:size]
+    if pending:
+        yield bytes(pending)
 
 
 class DropboxProvider(BaseStorageProvider):
@@ -41,12 +56,34 @@ class DropboxProvider(BaseStorageProvider):
     - Uses as_admin() for team-wide access
     """
     
-    def __init__(self):
-        """Initialize Dropbox provider (credentials set via connect())."""
+    # The SDK client and direct content requests share one pooled session
+    supports_http_session = True
+    
+    # /files/delete_batch accepts at most 1000 entries per call and runs
+    # asynchronously; poll its job at this interval until it finishes
+    DELETE_BATCH_MAX_ENTRIES = 1000
+    DELETE_BATCH_POLL_SECONDS = 0.5
+    DELETE_BATCH_MAX_POLLS = 120  # ~60s per batch before giving up
+    
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize Dropbox provider (credentials set via connect()).
+        
+        Args:
+            session: HTTP session for API and content requests (defaults to
+                the shared pooled session)
+        """
         self.client: Optional[dropbox.Dropbox] = None
         self._connected = False
         self._access_token: Optional[str] = None
         self._user_info: Optional[Dict[str, Any]] = None
+        self._http: Optional[requests.Session] = session
+    
+    def _get_http_session(self) -> requests.Session:
+        """Return the pooled HTTP session used for API and content requests."""
+        if self._http is None:
+            self._http = get_http_session()
+        return self._http
     
     def connect(self, credentials: Dict[str, Any]) -> bool:
         """
@@ -83,7 +120,10 @@ class DropboxProvider(BaseStorageProvider):
                 print(f"Connected to Dropbox Team as member: {member_id}")
             else:
                 # Personal account
-                self.client = dropbox.Dropbox(oauth2_access_token=access_token)
+                self.client = dropbox.Dropbox(
+                    oauth2_access_token=access_token,
+                    session=self._get_http_session(),
+                )
                 print("Connected to Dropbox (personal account)")
             
             # Verify connection and get user info
@@ -119,7 +159,7 @@ class DropboxProvider(BaseStorageProvider):
         
         try:
             print("Refreshing Dropbox token...")
-            response = requests.post(DROPBOX_TOKEN_URL, data=data, timeout=30)
+            response = self._get_http_session().post(DROPBOX_TOKEN_URL, data=data, timeout=30)
             response.raise_for_status()
             token_data = response.json()
             
@@ -139,7 +179,10 @@ class DropboxProvider(BaseStorageProvider):
     def _create_team_client(self, access_token: str, member_id: str) -> dropbox.Dropbox:
         """Create team client with admin impersonation and namespace root."""
         # Create team client
-        dbx_team = dropbox.DropboxTeam(oauth2_access_token=access_token)
+        dbx_team = dropbox.DropboxTeam(
+            oauth2_access_token=access_token,
+            session=self._get_http_session(),
+        )
         
         # Impersonate team member
         client = dbx_team.as_admin(member_id)
@@ -229,6 +272,23 @@ class DropboxProvider(BaseStorageProvider):
                 raise FileNotFoundError(f"File not found: {normalized_path}")
             raise IOError(f"Download failed: {e}")
     
+    def download_stream(self, path: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Stream file content from Dropbox in chunks."""
+        if not self._connected:
+            raise ConnectionError("Not connected to Dropbox")
+        
+        normalized_path = normalize_dropbox_path(path)
+        
+        try:
+            _, response = self.client.files_download(normalized_path)
+        except ApiError as e:
+            if e.error.is_path() and e.error.get_path().is_not_found():
+                raise FileNotFoundError(f"File not found: {normalized_path}")
+            raise IOError(f"Download failed: {e}")
+        
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
+    
     def download_file_partial(self, path: str, start: int = 0, end: int = None) -> bytes:
         """Download partial file (byte range) from Dropbox."""
         if not self._connected:
@@ -249,7 +309,7 @@ class DropboxProvider(BaseStorageProvider):
                 "Range": range_header,
             }
             
-            response = requests.post(DROPBOX_CONTENT_URL, headers=headers, timeout=30)
+            response = self._get_http_session().post(DROPBOX_CONTENT_URL, headers=headers, timeout=30)
             response.raise_for_status()
             return response.content
             
@@ -288,6 +348,62 @@ class DropboxProvider(BaseStorageProvider):
             print(f"Upload failed: {e}")
             raise IOError(f"Upload failed: {e}")
     
+    def upload_stream(
+        self,
+        remote_path: str,
+        chunks: Iterable[bytes],
+        overwrite: bool = True,
+    ) -> bool:
+        """
+        Upload content from an iterable of chunks without buffering it all.
+        
+        Chunks are regrouped into UPLOAD_CHUNK_SIZE pieces and sent through
+        an upload session as they arrive, so a streamed download can be
+        piped straight into Dropbox. Content that fits in one piece uses a
+        simple upload.
+        
+        Args:
+            remote_path: Destination path in Dropbox
+            chunks: Iterable of content chunks, e.g. response.iter_content()
+            overwrite: Replace an existing file instead of renaming
+            
+        Returns:
+            True if uploaded
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to Dropbox")
+        
+        normalized_path = normalize_dropbox_path(remote_path)
+        mode = WriteMode('overwrite') if overwrite else WriteMode('add')
+        pieces = _rechunk(chunks, UPLOAD_CHUNK_SIZE)
+        
+        try:
+            piece = next(pieces, b'')
+            next_piece = next(pieces, None)
+            
+            if next_piece is None:
+                self.client.files_upload(piece, normalized_path, mode=mode)
+            else:
+                session = self.client.files_upload_session_start(piece)
+                cursor = dropbox.files.UploadSessionCursor(
+                    session_id=session.session_id,
+                    offset=len(piece)
+                )
+                piece = next_piece
+                for next_piece in pieces:
+                    self.client.files_upload_session_append_v2(piece, cursor)
+                    cursor.offset += len(piece)
+                    piece = next_piece
+                commit = dropbox.files.CommitInfo(path=normalized_path, mode=mode)
+                self.client.files_upload_session_finish(piece, cursor, commit)
+            
+            print(f"Uploaded: {normalized_path}")
+            return True
+            
+        except ApiError as e:
+            print(f"Upload failed: {e}")
+            raise IOError(f"Upload failed: {e}")
+    
     def _chunked_upload(self, content: bytes, remote_path: str, mode: WriteMode) -> None:
         """Upload large file using chunked session."""
         file_size = len(content)
@@ -335,6 +451,54 @@ class DropboxProvider(BaseStorageProvider):
                 return True
             raise IOError(f"Failed to create folder: {e}")
     
+    def delete_files_batch(self, paths: List[str]) -> int:
+        """
+        Delete files with /files/delete_batch instead of one call per file.
+        
+        Args:
+            paths: Dropbox paths of files to delete
+            
+        Returns:
+            Number of files deleted (missing files are counted as failures)
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to Dropbox")
+        
+        deleted = 0
+        for start in range(0, len(paths), self.DELETE_BATCH_MAX_ENTRIES):
+            entries = [
+                dropbox.files.DeleteArg(normalize_dropbox_path(path))
+                for path in paths[start:start + self.DELETE_BATCH_MAX_ENTRIES]
+            ]
+            
+            try:
+                launch = self.client.files_delete_batch(entries)
+                if launch.is_complete():
+                    result = launch.get_complete()
+                else:
+                    job_id = launch.get_async_job_id()
+                    status = self.client.files_delete_batch_check(job_id)
+                    polls = 0
+                    while status.is_in_progress():
+                        if polls >= self.DELETE_BATCH_MAX_POLLS:
+                            raise IOError(
+                                f"Batch delete job {job_id} still in progress "
+                                f"after {polls} status checks"
+                            )
+                        time.sleep(self.DELETE_BATCH_POLL_SECONDS)
+                        status = self.client.files_delete_batch_check(job_id)
+                        polls += 1
+                    if status.is_failed():
+                        raise IOError(f"Batch delete failed: {status.get_failed()}")
+                    result = status.get_complete()
+            except ApiError as e:
+                raise IOError(f"Failed to delete files: {e}")
+            
+            deleted += sum(1 for entry in result.entries if entry.is_success())
+        
+        print(f"Deleted {deleted}/{len(paths)} files")
+        return deleted
+    
     def file_exists(self, path: str) -> bool:
         """Check if file exists in Dropbox."""
         if not self._connected:
@@ -8,6 +8,8 @@ Supports both legacy credential format (flat fields) and new multi-provider form
 
 from typing import Dict, Any, Optional
 
+import requests
+
 from .base import BaseStorageProvider
 from .dropbox_provider import DropboxProvider
 from .google_drive_provider import GoogleDriveProvider
@@ -47,6 +49,7 @@ class StorageFactory:
         provider_type: str,
         credentials: Dict[str, Any],
         auto_connect: bool = True,
+        session: Optional[requests.Session] = None,
     ) -> BaseStorageProvider:
         """
         Create a storage provider instance.
@@ -55,6 +58,8 @@ class StorageFactory:
             provider_type: Provider type ('dropbox', 'google_drive')
             credentials: Provider-specific credentials dictionary
             auto_connect: Whether to automatically connect after creation
+            session: HTTP session for providers that support one (ignored
+                by others, e.g. Google Drive's httplib2 transport)
             
         Returns:
             Configured storage provider instance
@@ -74,7 +79,10 @@ class StorageFactory:
         
         # Create provider instance
         provider_class = cls._providers[provider_type]
-        provider = provider_class()
+        if session is not None and provider_class.supports_http_session:
+            provider = provider_class(session=session)
+        else:
+            provider = provider_class()
         
         # Connect if requested
         if auto_connect:
@@ -88,6 +96,7 @@ class StorageFactory:
         decrypted_data: Dict[str, Any],
         provider_type: Optional[str] = None,
         auto_connect: bool = True,
+        session: Optional[requests.Session] = None,
     ) -> BaseStorageProvider:
         """
         Create storage provider from decrypted credential data.
@@ -115,6 +124,7 @@ class StorageFactory:
             decrypted_data: Decrypted credential dictionary
             provider_type: Override provider type (auto-detected if None)
             auto_connect: Whether to automatically connect
+            session: HTTP session for providers that support one
             
         Returns:
             Configured storage provider instance
@@ -140,7 +150,7 @@ class StorageFactory:
         # Extract credentials based on format
         credentials = cls._extract_credentials(decrypted_data, detected_type)
         
-        return cls.create(detected_type, credentials, auto_connect)
+        return cls.create(detected_type, credentials, auto_connect, session=session)
     
     @classmethod
     def _extract_credentials(
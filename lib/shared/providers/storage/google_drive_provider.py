@@ -16,11 +16,15 @@ Features:
 
 import io
 import re
+import logging
 import mimetypes
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple, Callable
 
 from .base import BaseStorageProvider
 
+logger = logging.getLogger(__name__)
+
 # Lazy import Google libraries
 _google_imported = False
 _Credentials = None
@@ -29,12 +33,14 @@ _build = None
 _MediaIoBaseDownload = None
 _MediaIoBaseUpload = None
 _RefreshError = None
+_HttpError = None
+_json_model = None
 
 
 def _import_google_libs():
     """Lazy import Google libraries only when needed"""
     global _google_imported, _Credentials, _Request, _build
-    global _MediaIoBaseDownload, _MediaIoBaseUpload, _RefreshError
+    global _MediaIoBaseDownload, _MediaIoBaseUpload, _RefreshError, _HttpError, _json_model
     
     if _google_imported:
         return
@@ -44,6 +50,7 @@ def _import_google_libs():
         from google.auth.transport.requests import Request
         from googleapiclient.discovery import build
         from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+        from googleapiclient.errors import HttpError
         from google.auth.exceptions import RefreshError
         
         _Credentials = Credentials
@@ -52,6 +59,8 @@ def _import_google_libs():
         _MediaIoBaseDownload = MediaIoBaseDownload
         _MediaIoBaseUpload = MediaIoBaseUpload
         _RefreshError = RefreshError
+        _HttpError = HttpError
+        _json_model = _build_json_model()
         _google_imported = True
         
     except ImportError:
@@ -61,76 +70,159 @@ def _import_google_libs():
         )
 
 
-# Supported image MIME types for Google Drive
-SUPPORTED_MIME_TYPES = [
-    # Standard image formats
-    'image/jpeg', 'image/jpg', 'image/png', 'image/gif',
-    'image/bmp', 'image/webp', 'image/tiff', 'image/svg+xml',
-    
-    # Apple formats
-    'image/heic', 'image/heif',
-    
-    # Canon RAW formats
-    'image/x-canon-cr2', 'image/x-canon-cr3', 'image/x-canon-crw',
-    
-    # Nikon RAW formats
-    'image/x-nikon-nef', 'image/x-nikon-nrw',
-    
-    # Sony RAW formats
-    'image/x-sony-arw', 'image/x-sony-sr2', 'image/x-sony-srf',
-    
-    # Adobe/Universal RAW
-    'image/x-adobe-dng', 'image/dng', 'image/x-dng',
-    'application/octet-stream',  # Fallback for unrecognized RAW
-    
-    # Panasonic RAW formats
-    'image/x-panasonic-raw', 'image/x-panasonic-rw2',
-    
-    # Olympus RAW formats
-    'image/x-olympus-orf',
-    
-    # Fujifilm RAW formats
-    'image/x-fuji-raf',
-    
-    # Pentax RAW formats
-    'image/x-pentax-pef', 'image/x-pentax-dng',
-    
-    # Other RAW formats
-    'image/x-phaseone-iiq',
-    'image/x-hasselblad-3fr', 'image/x-hasselblad-fff',
-    'image/x-leica-rwl', 'image/x-leica-raw',
-    'image/x-sigma-x3f',
-    'image/x-mamiya-mef',
-    'image/x-samsung-srw',
-    'image/x-epson-erf',
-    'image/x-kodak-dcr', 'image/x-kodak-kdc',
-    'image/x-minolta-mrw',
-    'image/x-leaf-mos',
-]
+def _build_json_model():
+    """
+    Build a googleapiclient JsonModel that decodes responses with orjson.
+    
+    Large listings return megabytes of JSON per page; orjson parses them
+    several times faster than the stdlib decoder used by the default model.
+    
+    Returns:
+        JsonModel instance, or None to keep the client default
+    """
+    try:
+        import orjson
+        from googleapiclient.model import JsonModel
+    except ImportError:
+        return None
+    
+    class OrjsonModel(JsonModel):
+        """JsonModel using orjson for response deserialization"""
+        
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+                body = body['data']
+            return body
+    
+    return OrjsonModel()
+
+
+def _build_mime_types() -> List[str]:
+    """Supported image MIME types for Google Drive"""
+    return [
+        # Standard image formats
+        'image/jpeg', 'image/jpg', 'image/png', 'image/gif',
+        'image/bmp', 'image/webp', 'image/tiff', 'image/svg+xml',
+    
+        # Apple formats
+        'image/heic', 'image/heif',
+    
+        # Canon RAW formats
+        'image/x-canon-cr2', 'image/x-canon-cr3', 'image/x-canon-crw',
+    
+        # Nikon RAW formats
+        'image/x-nikon-nef', 'image/x-nikon-nrw',
+    
+        # Sony RAW formats
+        'image/x-sony-arw', 'image/x-sony-sr2', 'image/x-sony-srf',
+    
+        # Adobe/Universal RAW
+        'image/x-adobe-dng', 'image/dng', 'image/x-dng',
+        'application/octet-stream',  # Fallback for unrecognized RAW
+    
+        # Panasonic RAW formats
+        'image/x-panasonic-raw', 'image/x-panasonic-rw2',
+    
+        # Olympus RAW formats
+        'image/x-olympus-orf',
+    
+        # Fujifilm RAW formats
+        'image/x-fuji-raf',
+    
+        # Pentax RAW formats
+        'image/x-pentax-pef', 'image/x-pentax-dng',
+    
+        # Other RAW formats
+        'image/x-phaseone-iiq',
+        'image/x-hasselblad-3fr', 'image/x-hasselblad-fff',
+        'image/x-leica-rwl', 'image/x-leica-raw',
+        'image/x-sigma-x3f',
+        'image/x-mamiya-mef',
+        'image/x-samsung-srw',
+        'image/x-epson-erf',
+        'image/x-kodak-dcr', 'image/x-kodak-kdc',
+        'image/x-minolta-mrw',
+        'image/x-leaf-mos',
+    ]
+
+
+def _build_supported_extensions() -> Tuple[str, ...]:
+    """Supported file extensions (for fallback filtering)"""
+    return (
+        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.svg',
+        '.heic', '.heif',
+        '.cr2', '.cr3', '.crw',
+        '.nef', '.nrw',
+        '.arw', '.sr2', '.srf',
+        '.dng',
+        '.raw', '.rw2',
+        '.orf',
+        '.raf',
+        '.pef',
+        '.iiq',
+        '.3fr', '.fff',
+        '.rwl',
+        '.x3f',
+        '.mef',
+        '.srw',
+        '.erf',
+        '.dcr', '.kdc',
+        '.mrw',
+        '.mos'
+    )
+
+
+# Module constants built on first access (PEP 562) rather than at import
+_LAZY_CONSTANTS = {
+    'SUPPORTED_MIME_TYPES': _build_mime_types,
+    'GDRIVE_SUPPORTED_EXTENSIONS': _build_supported_extensions,
+}
+
 
-# Supported file extensions (for fallback filtering)
-GDRIVE_SUPPORTED_EXTENSIONS = (
-    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.tif', '.svg',
-    '.heic', '.heif',
-    '.cr2', '.cr3', '.crw',
-    '.nef', '.nrw',
-    '.arw', '.sr2', '.srf',
-    '.dng',
-    '.raw', '.rw2',
-    '.orf',
-    '.raf',
-    '.pef',
-    '.iiq',
-    '.3fr', '.fff',
-    '.rwl',
-    '.x3f',
-    '.mef',
-    '.srw',
-    '.erf',
-    '.dcr', '.kdc',
-    '.mrw',
-    '.mos'
-)
+def __getattr__(name: str) -> Any:
+    """Build lazy module constants on first attribute access"""
+    builder = _LAZY_CONSTANTS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    globals()[name] = value
+    return value
+
+
+def _lazy_constant(name: str) -> Any:
+    """Resolve a lazy module constant from inside this module"""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+# Server-side MIME filter for list_files. Every supported type is image/*
+# except the octet-stream fallback used for unrecognized RAW files; the
+# client-side extension filter stays authoritative and rejects any
+# non-image octet-stream files this lets through.
+_MIME_QUERY_CLAUSE = "(mimeType contains 'image/' or mimeType='application/octet-stream')"
+
+# Metadata kept for every cached file, matching get_file_by_name's API fields
+_FILE_FIELDS = ('id', 'name', 'mimeType', 'size', 'createdTime', 'modifiedTime')
+_FILE_FIELDS_QUERY = ', '.join(_FILE_FIELDS)
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a value for use inside a single-quoted Drive query string"""
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+
+def _name_query(folder_id: str, filename: str) -> str:
+    """Build the Drive query that finds a file by name within a folder"""
+    return (
+        f"'{_escape_query_value(folder_id)}' in parents and "
+        f"name='{_escape_query_value(filename)}' and trashed=false"
+    )
 
 
 class GoogleDriveProvider(BaseStorageProvider):
@@ -161,6 +253,12 @@ class GoogleDriveProvider(BaseStorageProvider):
     SCOPES_WRITE = ['https://www.googleapis.com/auth/drive.file']
     TOKEN_URI = 'https://oauth2.googleapis.com/token'
     
+    # Maximum entries kept in the (folder_id, name) -> file metadata cache
+    NAME_CACHE_SIZE = 10000
+    
+    # Drive's batch endpoint accepts at most 100 calls per HTTP request
+    BATCH_MAX_REQUESTS = 100
+    
     def __init__(self):
         """Initialize Google Drive provider"""
         self.credentials = None
@@ -175,6 +273,11 @@ class GoogleDriveProvider(BaseStorageProvider):
         
         # Token refresh callback (optional)
         self._token_refresh_callback: Optional[Callable] = None
+        
+        # LRU cache of file metadata seen by list_files/uploads, keyed by
+        # (folder_id, exact name); hits are re-checked with a files.get so
+        # files trashed, deleted or renamed elsewhere are not returned
+        self._name_cache: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
     
     def connect(self, credentials: Dict[str, Any]) -> bool:
         """
@@ -196,7 +299,7 @@ class GoogleDriveProvider(BaseStorageProvider):
         """
         _import_google_libs()
         
-        print("Connecting to Google Drive...")
+        logger.info("Connecting to Google Drive...")
         
         # Extract credentials
         client_id = credentials.get('client_id')
@@ -217,6 +320,7 @@ class GoogleDriveProvider(BaseStorageProvider):
         
         # Store optional settings
         self._shared_drive_id = shared_drive_id
+        self._name_cache.clear()
         self._token_refresh_callback = credentials.get('token_refresh_callback')
         
         try:
@@ -233,11 +337,16 @@ class GoogleDriveProvider(BaseStorageProvider):
             # Check if token needs refresh
             if not self.credentials.valid:
                 if self.credentials.expired or self.credentials.token is None:
-                    print("Access token expired or missing, refreshing...")
+                    logger.info("Access token expired or missing, refreshing...")
                     self._refresh_token()
             
             # Build Drive service
-            self.service = _build('drive', 'v3', credentials=self.credentials)
+            if _json_model is not None:
+                self.service = _build(
+                    'drive', 'v3', credentials=self.credentials, model=_json_model
+                )
+            else:
+                self.service = _build('drive', 'v3', credentials=self.credentials)
             
             # Verify connection by getting user info
             about = self.service.about().get(fields='user').execute()
@@ -251,7 +360,7 @@ class GoogleDriveProvider(BaseStorageProvider):
             }
             
             self._connected = True
-            print(f"Connected to Google Drive as: {self._user_info['email']}")
+            logger.info("Connected to Google Drive as: %s", self._user_info['email'])
             return True
             
         except _RefreshError as e:
@@ -267,7 +376,7 @@ class GoogleDriveProvider(BaseStorageProvider):
         
         try:
             self.credentials.refresh(_Request())
-            print("Token refreshed successfully")
+            logger.info("Token refreshed successfully")
             
             # Mark token as refreshed
             self._token_refreshed = True
@@ -287,9 +396,9 @@ class GoogleDriveProvider(BaseStorageProvider):
             if self._token_refresh_callback:
                 try:
                     self._token_refresh_callback(self._refreshed_token_data)
-                    print("Token refresh callback executed")
+                    logger.debug("Token refresh callback executed")
                 except Exception as e:
-                    print(f"Token refresh callback failed: {e}")
+                    logger.warning("Token refresh callback failed: %s", e)
                     
         except _RefreshError as e:
             raise Exception(f"Token refresh failed: {str(e)}")
@@ -307,6 +416,22 @@ class GoogleDriveProvider(BaseStorageProvider):
         """Check if token was refreshed during this session"""
         return self._token_refreshed
     
+    def _cache_file(self, folder_id: str, item: Dict[str, Any]) -> None:
+        """Remember file metadata for later get_file_by_name lookups"""
+        key = (folder_id, item['name'])
+        self._name_cache[key] = {field: item.get(field) for field in _FILE_FIELDS}
+        self._name_cache.move_to_end(key)
+        if len(self._name_cache) > self.NAME_CACHE_SIZE:
+            self._name_cache.popitem(last=False)
+    
+    def _get_cached_file(self, folder_id: str, filename: str) -> Optional[Dict[str, Any]]:
+        """Look up cached file metadata by folder ID and name"""
+        key = (folder_id, filename)
+        item = self._name_cache.get(key)
+        if item is not None:
+            self._name_cache.move_to_end(key)
+        return item
+    
     def list_files(
         self,
         folder: str,
@@ -337,11 +462,12 @@ class GoogleDriveProvider(BaseStorageProvider):
             raise Exception("Not connected to Google Drive. Call connect() first.")
         
         folder_id = folder  # In GDrive, folder is identified by ID
-        print(f"Listing files in folder: {folder_id}")
+        logger.info("Listing files in folder: %s", folder_id)
         
-        # Build MIME type query
-        mime_query = " or ".join([f"mimeType='{mt}'" for mt in SUPPORTED_MIME_TYPES])
-        query = f"'{folder_id}' in parents and trashed=false and ({mime_query})"
+        query = (
+            f"'{_escape_query_value(folder_id)}' in parents and trashed=false "
+            f"and {_MIME_QUERY_CLAUSE}"
+        )
         
         files = []
         page_token = None
@@ -362,7 +488,7 @@ class GoogleDriveProvider(BaseStorageProvider):
                 items = results.get('files', [])
                 
                 # Filter by extension if specified, or use default supported extensions
-                filter_extensions = extensions if extensions else GDRIVE_SUPPORTED_EXTENSIONS
+                filter_extensions = extensions if extensions else _lazy_constant('GDRIVE_SUPPORTED_EXTENSIONS')
                 
                 for item in items:
                     file_name_lower = item['name'].lower()
@@ -374,9 +500,11 @@ class GoogleDriveProvider(BaseStorageProvider):
                     )
                     
                     if has_valid_extension:
+                        self._cache_file(folder_id, item)
+                        
                         # Log misidentified files (DNG files often detected as octet-stream)
                         if mime_type == 'application/octet-stream':
-                            print(f"  Detected misidentified file: {item['name']} (MIME: {mime_type})")
+                            logger.debug("Misidentified file %s (%s)", item['name'], mime_type)
                         
                         # Normalize to match Dropbox format for compatibility
                         files.append({
@@ -392,14 +520,14 @@ class GoogleDriveProvider(BaseStorageProvider):
                         
                         # Check max_files limit
                         if max_files and len(files) >= max_files:
-                            print(f"Reached file limit: {len(files)}/{max_files}")
+                            logger.info("Reached file limit: %d/%d", len(files), max_files)
                             return files
                 
                 page_token = results.get('nextPageToken')
                 if not page_token:
                     break
             
-            print(f"Found {len(files)} image files in folder")
+            logger.info("Found %d image files in folder", len(files))
             return files
             
         except Exception as e:
@@ -433,7 +561,7 @@ class GoogleDriveProvider(BaseStorageProvider):
             
             file_buffer.seek(0)
             content = file_buffer.read()
-            print(f"Downloaded file {file_id}: {len(content)} bytes")
+            logger.debug("Downloaded file %s: %d bytes", file_id, len(content))
             return content
             
         except Exception as e:
@@ -506,14 +634,16 @@ class GoogleDriveProvider(BaseStorageProvider):
             
             # Check if file exists (if overwrite=True)
             if overwrite:
+                # Always ask Drive: a cached name->ID hit would still need a
+                # files.get to rule out deleted files, so it saves no request
                 existing = self.service.files().list(
-                    q=f"'{folder_id}' in parents and name='{filename}' and trashed=false",
+                    q=_name_query(folder_id, filename),
                     spaces='drive',
                     fields='files(id)',
                     supportsAllDrives=True
                 ).execute()
-                
                 existing_files = existing.get('files', [])
+                
                 if existing_files:
                     # Update existing file
                     file_id = existing_files[0]['id']
@@ -528,7 +658,7 @@ class GoogleDriveProvider(BaseStorageProvider):
                         supportsAllDrives=True
                     ).execute()
                     
-                    print(f"Updated existing file: {filename} (ID: {file_id})")
+                    logger.info("Updated existing file: %s (ID: %s)", filename, file_id)
                     return {
                         'id': file_id,
                         'name': filename,
@@ -551,11 +681,12 @@ class GoogleDriveProvider(BaseStorageProvider):
             created = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
-                fields='id, name',
+                fields='id, name, mimeType, size, createdTime, modifiedTime',
                 supportsAllDrives=True
             ).execute()
+            self._cache_file(folder_id, created)
             
-            print(f"Uploaded new file: {filename} (ID: {created['id']})")
+            logger.info("Uploaded new file: %s (ID: %s)", filename, created['id'])
             return {
                 'id': created['id'],
                 'name': filename,
@@ -601,13 +732,52 @@ class GoogleDriveProvider(BaseStorageProvider):
                 supportsAllDrives=True
             ).execute()
             
-            print(f"Created folder: {folder_name} (ID: {created['id']})")
+            logger.info("Created folder: %s (ID: %s)", folder_name, created['id'])
             return True
             
         except Exception as e:
-            print(f"Error creating folder {folder_name}: {str(e)}")
+            logger.error("Error creating folder %s: %s", folder_name, e)
             return False
     
+    def delete_files_batch(self, paths: List[str]) -> int:
+        """
+        Delete files through Drive's batch endpoint, 100 per round-trip.
+        
+        Args:
+            paths: Google Drive file IDs
+            
+        Returns:
+            Number of files deleted
+        """
+        if not self._connected:
+            raise Exception("Not connected to Google Drive. Call connect() first.")
+        
+        deleted_ids = set()
+        
+        def on_delete(request_id, response, exception):
+            if exception is None:
+                deleted_ids.add(request_id)
+            else:
+                logger.warning("Error deleting file %s: %s", request_id, exception)
+        
+        for start in range(0, len(paths), self.BATCH_MAX_REQUESTS):
+            batch = self.service.new_batch_http_request(callback=on_delete)
+            for file_id in paths[start:start + self.BATCH_MAX_REQUESTS]:
+                batch.add(
+                    self.service.files().delete(fileId=file_id, supportsAllDrives=True),
+                    request_id=file_id
+                )
+            batch.execute()
+        
+        if deleted_ids:
+            self._name_cache = OrderedDict(
+                (key, item) for key, item in self._name_cache.items()
+                if item.get('id') not in deleted_ids
+            )
+        
+        logger.info("Deleted %d/%d files", len(deleted_ids), len(paths))
+        return len(deleted_ids)
+    
     def file_exists(self, path: str) -> bool:
         """
         Check if a file exists in Google Drive.
@@ -631,6 +801,33 @@ class GoogleDriveProvider(BaseStorageProvider):
         except:
             return False
     
+    def stat(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get existence and basic metadata for a file in one request.
+        
+        Args:
+            path: Google Drive file ID
+            
+        Returns:
+            Dict with id, name, size, mimeType, modifiedTime, md5Checksum
+            and trashed, or None if the file does not exist
+        """
+        _import_google_libs()
+        
+        if not self._connected:
+            raise Exception("Not connected to Google Drive. Call connect() first.")
+        
+        try:
+            return self.service.files().get(
+                fileId=path,
+                fields='id, name, size, mimeType, modifiedTime, md5Checksum, trashed',
+                supportsAllDrives=True
+            ).execute()
+        except _HttpError as e:
+            if e.resp.status == 404:
+                return None
+            raise
+    
     def get_file_by_name(self, folder_id: str, filename: str) -> Optional[Dict[str, Any]]:
         """
         Find a file by name in a specific folder.
@@ -645,22 +842,37 @@ class GoogleDriveProvider(BaseStorageProvider):
         if not self._connected:
             raise Exception("Not connected to Google Drive. Call connect() first.")
         
+        cached = self._get_cached_file(folder_id, filename)
+        if cached is not None:
+            try:
+                current = self.service.files().get(
+                    fileId=cached['id'],
+                    fields='id, name, trashed',
+                    supportsAllDrives=True
+                ).execute()
+            except Exception:
+                current = None
+            if current and not current.get('trashed') and current.get('name') == filename:
+                return dict(cached)
+            self._name_cache.pop((folder_id, filename), None)
+        
         try:
             results = self.service.files().list(
-                q=f"'{folder_id}' in parents and name='{filename}' and trashed=false",
+                q=_name_query(folder_id, filename),
                 spaces='drive',
-                fields='files(id, name, mimeType, size, createdTime, modifiedTime)',
+                fields=f"files({_FILE_FIELDS_QUERY})",
                 supportsAllDrives=True,
                 includeItemsFromAllDrives=True
             ).execute()
             
             files = results.get('files', [])
             if files:
+                self._cache_file(folder_id, files[0])
                 return files[0]
             return None
             
         except Exception as e:
-            print(f"Error finding file {filename}: {str(e)}")
+            logger.error("Error finding file %s: %s", filename, e)
             return None
     
     def get_user_info(self) -> Dict[str, Any]:
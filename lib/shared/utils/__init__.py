@@ -9,15 +9,22 @@ from .file_utils import (
     get_content_type_for_file,
     get_file_type_info,
     validate_file_size,
+    prepare_upload,
     get_file_extension,
 )
 
 from .memory_utils import (
     get_memory_info,
+    get_process_rss_mb,
     force_garbage_collection,
     clear_large_object,
 )
 
+from .http_utils import (
+    create_http_session,
+    get_http_session,
+)
+
 __all__ = [
     # File utilities
     "normalize_dropbox_path",
@@ -26,9 +33,14 @@ __all__ = [
     "get_content_type_for_file",
     "get_file_type_info",
     "validate_file_size",
+    "prepare_upload",
     "get_file_extension",
     # Memory utilities
     "get_memory_info",
+    "get_process_rss_mb",
     "force_garbage_collection",
     "clear_large_object",
+    # HTTP utilities
+    "create_http_session",
+    "get_http_session",
 ]
@@ -11,8 +11,51 @@ from typing import Dict, Any, Tuple, Optional
 from ..config.constants import (
     FILE_TYPE_CONFIG,
     CONTENT_TYPE_MAPPING,
+    RAW_EXTENSIONS,
 )
 
+# RAW extensions as a set for O(1) membership checks
+_RAW_EXT_SET = frozenset(RAW_EXTENSIONS)
+
+# Extension -> (file_type, config) lookup, built once from FILE_TYPE_CONFIG.
+# The first type listing an extension wins, matching the previous scan order.
+_EXT_TO_TYPE_CONFIG: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+for _file_type, _config in FILE_TYPE_CONFIG.items():
+    for _ext in _config['extensions']:
+        _EXT_TO_TYPE_CONFIG.setdefault(_ext, (_file_type, _config))
+del _file_type, _config, _ext
+
+_OTHER_TYPE_CONFIG: Tuple[str, Dict[str, Any]] = ('OTHER', FILE_TYPE_CONFIG['OTHER'])
+
+# Dotted extension -> MIME type, so lookups skip stripping the dot per call
+_CONTENT_TYPE_BY_EXT: Dict[str, str] = {
+    '.' + ext: content_type for ext, content_type in CONTENT_TYPE_MAPPING.items()
+}
+
+# Exact (power of two) reciprocal for byte -> MB conversion
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# Per-type size limits in bytes, so the size check is a plain int compare
+_MAX_BYTES_BY_TYPE: Dict[str, int] = {
+    file_type: int(config['max_size_mb'] * 1024 * 1024)
+    for file_type, config in FILE_TYPE_CONFIG.items()
+}
+
+# Path normalization helpers
+_BACKSLASH_TABLE = str.maketrans({'\\': '/'})
+# ASCII fast path: backslash swap and A-Z lowercasing in one translate pass
+_ASCII_NORMALIZE_TABLE = str.maketrans({
+    **{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)},
+    '\\': '/',
+})
+_SLASH_RUN_RE = re.compile(r'/+')
+# Characters never present in an ASCII path_lower (uppercase or backslash)
+_INVALID_ASCII_PATH_CHAR_RE = re.compile(r'[A-Z\\]')
+
+# Filename prefix sanitization patterns
+_UNSAFE_PREFIX_CHARS_RE = re.compile(r'[^\w\-\s]')
+_PREFIX_SEPARATOR_RUN_RE = re.compile(r'[\s_]+')
+
 
 def normalize_dropbox_path(path: str) -> str:
     """
@@ -33,24 +76,24 @@ def normalize_dropbox_path(path: str) -> str:
     if not path:
         return path
     
-    # Replace backslashes with forward slashes
-    normalized = path.replace('\\', '/')
+    # Replace backslashes with forward slashes; lowercase for path_lower compatibility
+    if path.isascii():
+        normalized = path.translate(_ASCII_NORMALIZE_TABLE)
+    else:
+        normalized = path.translate(_BACKSLASH_TABLE).lower()
     
     # Ensure leading slash
-    if not normalized.startswith('/'):
+    if normalized[0] != '/':
         normalized = '/' + normalized
     
-    # Remove duplicate slashes
-    while '//' in normalized:
-        normalized = normalized.replace('//', '/')
+    # Collapse duplicate slashes
+    if '//' in normalized:
+        normalized = _SLASH_RUN_RE.sub('/', normalized)
     
     # Remove trailing slash unless it's the root
-    if len(normalized) > 1 and normalized.endswith('/'):
+    if len(normalized) > 1 and normalized[-1] == '/':
         normalized = normalized[:-1]
     
-    # Convert to lowercase for path_lower compatibility
-    normalized = normalized.lower()
-    
     return normalized
 
 
@@ -67,11 +110,14 @@ def validate_dropbox_path(path: str) -> bool:
     if not path or not isinstance(path, str):
         return False
     
-    return (
-        path.startswith('/') and 
-        '\\' not in path and 
-        path == path.lower()
-    )
+    if path[0] != '/':
+        return False
+    
+    # ASCII paths: stop at the first uppercase letter or backslash
+    if path.isascii():
+        return _INVALID_ASCII_PATH_CHAR_RE.search(path) is None
+    
+    return '\\' not in path and path == path.lower()
 
 
 def sanitize_filename_prefix(prefix: str) -> str:
@@ -92,10 +138,14 @@ def sanitize_filename_prefix(prefix: str) -> str:
         return ""
     
     # Keep alphanumeric, hyphens, underscores, and spaces
-    sanitized = re.sub(r'[^\w\-\s]', '_', prefix)
+    # (plain ASCII prefixes of only those characters need no substitution)
+    if prefix.isascii() and prefix.replace('_', '').replace('-', '').replace(' ', '').isalnum():
+        sanitized = prefix
+    else:
+        sanitized = _UNSAFE_PREFIX_CHARS_RE.sub('_', prefix)
     
     # Replace multiple spaces/underscores with single underscore
-    sanitized = re.sub(r'[\s_]+', '_', sanitized)
+    sanitized = _PREFIX_SEPARATOR_RUN_RE.sub('_', sanitized)
     
     # Remove leading/trailing underscores
     sanitized = sanitized.strip('_')
@@ -106,6 +156,17 @@ def sanitize_filename_prefix(prefix: str) -> str:
     return sanitized
 
 
+def _fast_ext(name: str) -> str:
+    """Lowercase extension of a non-empty name, matching os.path.splitext."""
+    dot = name.rfind('.')
+    if dot <= 0 or dot < name.rfind('/'):
+        return ''
+    if name[dot - 1] in './':
+        # Leading-dot names ('.hidden', 'dir/..x') need splitext's rules
+        return os.path.splitext(name)[1].lower()
+    return name[dot:].lower()
+
+
 def get_file_extension(filename: str) -> str:
     """
     Get lowercase file extension from filename.
@@ -119,8 +180,7 @@ def get_file_extension(filename: str) -> str:
     if not filename:
         return ''
     
-    _, ext = os.path.splitext(filename)
-    return ext.lower()
+    return _fast_ext(filename)
 
 
 def get_file_type_info(filename: str) -> Tuple[str, Dict[str, Any]]:
@@ -134,13 +194,7 @@ def get_file_type_info(filename: str) -> Tuple[str, Dict[str, Any]]:
         Tuple of (file_type, config_dict)
         file_type is one of: 'RAW', 'CR3', 'TIFF', 'JPEG', 'PNG', 'OTHER'
     """
-    file_ext = get_file_extension(filename)
-    
-    for file_type, config in FILE_TYPE_CONFIG.items():
-        if file_ext in config['extensions']:
-            return file_type, config
-    
-    return 'OTHER', FILE_TYPE_CONFIG['OTHER']
+    return _EXT_TO_TYPE_CONFIG.get(get_file_extension(filename), _OTHER_TYPE_CONFIG)
 
 
 def get_content_type_for_file(filename: str) -> str:
@@ -153,14 +207,38 @@ def get_content_type_for_file(filename: str) -> str:
     Returns:
         MIME type string (e.g., 'image/jpeg')
     """
-    file_ext = get_file_extension(filename)
+    return _CONTENT_TYPE_BY_EXT.get(get_file_extension(filename), 'application/octet-stream')
+
+
+def _check_file_size(
+    filename: str,
+    file_type: str,
+    config: Dict[str, Any],
+    file_size_bytes: int,
+) -> Tuple[bool, Optional[str]]:
+    """Size check shared by validate_file_size and prepare_upload."""
+    if file_size_bytes > _MAX_BYTES_BY_TYPE[file_type]:
+        file_size_mb = file_size_bytes * _BYTES_TO_MB
+        max_size_mb = config['max_size_mb']
+        error_msg = (
+            f"File too large: {filename} "
+            f"({file_size_mb:.1f}MB > {max_size_mb}MB limit for {file_type})"
+        )
+        return False, error_msg
     
-    # Remove leading dot for lookup
-    ext_key = file_ext.lstrip('.')
+    return True, None
+
+
+def _upload_timeout(config: Dict[str, Any], file_size_mb: float, base_timeout: int) -> int:
+    """Timeout rule shared by calculate_upload_timeout and prepare_upload."""
+    timeout = int(base_timeout * config['timeout_multiplier'])
     
-    content_type = CONTENT_TYPE_MAPPING.get(ext_key, 'application/octet-stream')
+    # Scale up for very large files
+    if file_size_mb > 50:
+        timeout = int(timeout * (file_size_mb / 50))
     
-    return content_type
+    # Cap at 15 minutes
+    return min(timeout, 900)
 
 
 def validate_file_size(filename: str, file_size_bytes: int) -> Tuple[bool, Optional[str]]:
@@ -176,17 +254,7 @@ def validate_file_size(filename: str, file_size_bytes: int) -> Tuple[bool, Optio
         error_message is None if valid
     """
     file_type, config = get_file_type_info(filename)
-    file_size_mb = file_size_bytes / (1024 * 1024)
-    max_size_mb = config['max_size_mb']
-    
-    if file_size_mb > max_size_mb:
-        error_msg = (
-            f"File too large: {filename} "
-            f"({file_size_mb:.1f}MB > {max_size_mb}MB limit for {file_type})"
-        )
-        return False, error_msg
-    
-    return True, None
+    return _check_file_size(filename, file_type, config, file_size_bytes)
 
 
 def calculate_upload_timeout(filename: str, file_size_bytes: int, base_timeout: int = 120) -> int:
@@ -201,17 +269,31 @@ def calculate_upload_timeout(filename: str, file_size_bytes: int, base_timeout:
     Returns:
         Calculated timeout in seconds (capped at 900)
     """
-    file_type, config = get_file_type_info(filename)
-    file_size_mb = file_size_bytes / (1024 * 1024)
+    _, config = get_file_type_info(filename)
+    return _upload_timeout(config, file_size_bytes * _BYTES_TO_MB, base_timeout)
+
+
+def prepare_upload(
+    filename: str,
+    file_size_bytes: int,
+    base_timeout: int = 120,
+) -> Tuple[bool, Optional[str], int]:
+    """
+    Validate file size and calculate upload timeout in one pass.
     
-    timeout = int(base_timeout * config['timeout_multiplier'])
+    Resolves the file type once instead of once per check.
     
-    # Scale up for very large files
-    if file_size_mb > 50:
-        timeout = int(timeout * (file_size_mb / 50))
-    
-    # Cap at 15 minutes
-    return min(timeout, 900)
+    Args:
+        filename: Filename for type detection
+        file_size_bytes: File size in bytes
+        base_timeout: Base timeout in seconds
+        
+    Returns:
+        Tuple of (is_valid, error_message, timeout_seconds)
+    """
+    file_type, config = get_file_type_info(filename)
+    is_valid, error_msg = _check_file_size(filename, file_type, config, file_size_bytes)
+    return is_valid, error_msg, _upload_timeout(config, file_size_bytes * _BYTES_TO_MB, base_timeout)
 
 
 def is_dji_file(filename: str) -> bool:
@@ -229,10 +311,8 @@ def is_dji_file(filename: str) -> bool:
     if not filename:
         return False
     
-    name_upper = filename.upper()
-    name_lower = filename.lower()
-    
-    return name_upper.startswith('DJI_') and name_lower.endswith('.dng')
+    # Only the 4-char prefix and suffix need case-folding
+    return filename[:4].lower() == 'dji_' and filename[-4:].lower() == '.dng'
 
 
 def is_cr3_file(filename: str) -> bool:
@@ -258,12 +338,10 @@ def is_raw_file(filename: str) -> bool:
     Returns:
         True if traditional RAW file (not CR3)
     """
-    from ..config.constants import RAW_EXTENSIONS
-    
     ext = get_file_extension(filename)
     
     # Exclude CR3 as it needs full download for MP4 container parsing
     if ext == '.cr3':
         return False
     
-    return ext in RAW_EXTENSIONS
+    return ext in _RAW_EXT_SET
@@ -0,0 +1,62 @@
+"""
+HTTP Utilities
+==============
+Pooled requests session shared by storage and enhancement providers.
+
+A warm container keeps one session alive across invocations, so uploads,
+downloads and API calls for every bracket in a job reuse the same TLS
+connections instead of handshaking per request.
+"""
+
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config.constants import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_TOTAL,
+    HTTP_RETRY_BACKOFF_FACTOR,
+    HTTP_RETRY_STATUS_CODES,
+)
+
+_shared_session: Optional[requests.Session] = None
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a requests session with a pooled, retrying HTTPS adapter.
+
+    Retries apply to idempotent methods only (urllib3's default), so POSTs
+    that create uploads or enhancements are never sent twice. The final
+    response is returned rather than raised once retries run out, leaving
+    status handling to the caller as before.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=HTTP_RETRY_TOTAL,
+            backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+            status_forcelist=HTTP_RETRY_STATUS_CODES,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide provider session, creating it on first use.
+
+    The session carries no default headers; providers pass their own
+    authentication per request so one pool can serve all of them.
+    """
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = create_http_session()
+    return _shared_session
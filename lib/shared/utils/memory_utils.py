@@ -7,6 +7,16 @@ Memory monitoring and garbage collection helpers for serverless functions.
 import gc
 from typing import Dict, Any, Optional
 
+# psutil is imported once at load; the handle to the current process is
+# created once so RSS samples only read /proc/self/statm instead of parsing
+# /proc/meminfo on every call
+try:
+    import psutil as _psutil
+    _PROCESS = _psutil.Process()
+except ImportError:
+    _psutil = None
+    _PROCESS = None
+
 
 def get_memory_info() -> Dict[str, Any]:
     """
@@ -15,21 +25,36 @@ def get_memory_info() -> Dict[str, Any]:
     Returns:
         Dictionary with memory stats, or error info if unavailable
     """
+    if _psutil is None:
+        return {'memory_status': 'psutil_not_available'}
+    
     try:
-        import psutil
-        memory = psutil.virtual_memory()
+        memory = _psutil.virtual_memory()
         return {
             'memory_percent': round(memory.percent, 1),
             'memory_used_mb': round(memory.used / (1024 * 1024), 1),
             'memory_available_mb': round(memory.available / (1024 * 1024), 1),
             'memory_total_mb': round(memory.total / (1024 * 1024), 1),
         }
-    except ImportError:
-        return {'memory_status': 'psutil_not_available'}
     except Exception as e:
         return {'memory_error': str(e)}
 
 
+def get_process_rss_mb() -> Optional[float]:
+    """
+    Get resident set size of the current process.
+    
+    Returns:
+        RSS in MB, or None if psutil is unavailable
+    """
+    if _PROCESS is None:
+        return None
+    try:
+        return _PROCESS.memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
 def force_garbage_collection() -> Dict[str, Any]:
     """
     Force garbage collection and return stats.
@@ -51,6 +76,7 @@ def force_garbage_collection() -> Dict[str, Any]:
             'objects_collected': collected,
             'before_counts': before_counts,
             'after_counts': after_counts,
+            'generation_stats': gc.get_stats(),
         }
     except Exception as e:
         return {'gc_error': str(e)}
@@ -121,6 +147,8 @@ class MemoryTracker:
     """
     Context manager for tracking memory usage during operations.
     
+    Measures the process RSS (not system-wide memory) before and after.
+    
     Usage:
         with MemoryTracker("Processing bracket") as tracker:
             # ... do work ...
@@ -129,25 +157,19 @@ class MemoryTracker:
     
     def __init__(self, operation_name: str = "Operation"):
         self.operation_name = operation_name
-        self.start_memory: Optional[Dict[str, Any]] = None
-        self.end_memory: Optional[Dict[str, Any]] = None
+        self.start_rss_mb: Optional[float] = None
+        self.end_rss_mb: Optional[float] = None
         self.delta_mb: float = 0.0
     
     def __enter__(self):
-        self.start_memory = get_memory_info()
+        self.start_rss_mb = get_process_rss_mb()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_memory = get_memory_info()
+        self.end_rss_mb = get_process_rss_mb()
         
-        if (self.start_memory and self.end_memory and 
-            'memory_used_mb' in self.start_memory and 
-            'memory_used_mb' in self.end_memory):
-            
-            self.delta_mb = (
-                self.end_memory['memory_used_mb'] - 
-                self.start_memory['memory_used_mb']
-            )
+        if self.start_rss_mb is not None and self.end_rss_mb is not None:
+            self.delta_mb = self.end_rss_mb - self.start_rss_mb
         
         return False  # Don't suppress exceptions
     
@@ -155,7 +177,7 @@ class MemoryTracker:
         """Get summary of memory usage during operation."""
         return {
             'operation': self.operation_name,
-            'start_memory_mb': self.start_memory.get('memory_used_mb') if self.start_memory else None,
-            'end_memory_mb': self.end_memory.get('memory_used_mb') if self.end_memory else None,
+            'start_memory_mb': round(self.start_rss_mb, 1) if self.start_rss_mb is not None else None,
+            'end_memory_mb': round(self.end_rss_mb, 1) if self.end_rss_mb is not None else None,
             'delta_mb': round(self.delta_mb, 2),
         }
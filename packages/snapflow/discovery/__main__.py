@@ -11,12 +11,17 @@ Modes:
 Version: 1.0.0-snapflow
 """
 
+import gc
 import json
 import os
+import re
 import uuid
 import math
+import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, List, Optional, Tuple
 from io import BytesIO
@@ -38,6 +43,15 @@ except ImportError:
     EXIFREAD_AVAILABLE = False
     print("WARNING: exifread not available, EXIF extraction disabled")
 
+# Fast JSON encoding for large discovery payloads (falls back to stdlib)
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_dumps = json.dumps
+
 # Function version
 VERSION = f"1.0.0-discovery-snapflow-{SHARED_VERSION}"
 
@@ -45,18 +59,30 @@ VERSION = f"1.0.0-discovery-snapflow-{SHARED_VERSION}"
 DEFAULT_TIME_DELTA_SECONDS = 2
 DEFAULT_FILES_PER_PAGE = 25
 MAX_THREADS = 3
+# Per-provider page worker counts. RAW header reads are small and
+# network-bound, so Dropbox (requests-based, safe to share across threads)
+# runs many at once; Google Drive's httplib2 transport is not thread-safe,
+# so it keeps the conservative default.
+PAGE_WORKERS_BY_PROVIDER = {
+    'dropbox': 16,
+}
+# Whole-file downloads (JPEG, CR3, partial-read fallback) hold full images
+# in memory, so at most MAX_THREADS run at once whatever the worker count
+_FULL_DOWNLOAD_SLOTS = threading.BoundedSemaphore(MAX_THREADS)
 MAX_RETRIES = 3
 RETRY_DELAY = 2
 RAW_HEADER_SIZE = 64 * 1024
+_EXIF_DATETIME_RE = re.compile(r'(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})')
 
 # Supported file extensions
 RAW_EXTENSIONS = ('.arw', '.nef', '.cr2', '.cr3', '.dng', '.raw', '.orf', '.rw2')
 SUPPORTED_EXTENSIONS = ('.jpg', '.jpeg') + RAW_EXTENSIONS
+_RAW_EXT_SET = frozenset(RAW_EXTENSIONS)
 
 
 def _detect_dji_file(filename: str) -> bool:
     """Detect DJI drone files by filename pattern"""
-    return filename.upper().startswith('DJI_') and filename.lower().endswith('.dng')
+    return filename[:4].lower() == 'dji_' and filename[-4:].lower() == '.dng'
 
 
 def _get_time_delta_with_dji_override(
@@ -75,15 +101,25 @@ def _get_time_delta_with_dji_override(
             print(f"Invalid time_delta_seconds: {time_delta_seconds}, using default")
             requested_seconds = DEFAULT_TIME_DELTA_SECONDS
     
-    # Count DJI files
-    dji_count = sum(1 for f in metadata_files if _detect_dji_file(f.get('name', '')))
+    # Count DJI files, stopping as soon as the majority is decided
     total_files = len(metadata_files)
-    dji_ratio = dji_count / total_files if total_files > 0 else 0
-    
-    if dji_ratio > 0.5:
+    threshold = total_files // 2 + 1
+    dji_count = 0
+    remaining = total_files
+    
+    for f in metadata_files:
+        if _detect_dji_file(f.get('name', '')):
+            dji_count += 1
+            if dji_count >= threshold:
+                break
+        remaining -= 1
+        if dji_count + remaining < threshold:
+            break
+    
+    if dji_count >= threshold:
         # Majority DJI - use longer time delta
         actual_seconds = 10
-        print(f"DJI detected ({dji_count}/{total_files}): time_delta={actual_seconds}s")
+        print(f"DJI detected (majority of {total_files}): time_delta={actual_seconds}s")
     else:
         actual_seconds = requested_seconds
         print(f"Standard cameras: time_delta={actual_seconds}s")
@@ -91,31 +127,51 @@ def _get_time_delta_with_dji_override(
     return timedelta(seconds=actual_seconds)
 
 
+def _parse_exif_datetime(value: str) -> Optional[str]:
+    """Convert an EXIF 'YYYY:MM:DD HH:MM:SS' string to ISO format"""
+    try:
+        # Fixed-width layout: match the fields directly instead of strptime
+        match = _EXIF_DATETIME_RE.fullmatch(value)
+        if match:
+            dt = datetime(*map(int, match.groups()))
+        else:
+            dt = datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
+        return dt.isoformat()
+    except ValueError:
+        return None
+
+
 def _extract_exif_datetime(file_bytes: bytes, filename: str) -> Optional[str]:
     """Extract datetime from EXIF data"""
     if not EXIFREAD_AVAILABLE:
         return None
     
     try:
-        with BytesIO(file_bytes) as stream:
-            tags = exifread.process_file(stream, details=True)
-        
-        if not tags:
-            return None
-        
-        # DJI-specific tag priority
+        # DJI-specific tag priority. Parsing stops at the first-priority tag;
+        # IFD0 'Image DateTime' is read before the EXIF sub-IFD, so the
+        # fallbacks are still available when DateTimeOriginal is missing.
         if _detect_dji_file(filename):
             datetime_tags = ['Image DateTime', 'EXIF DateTime', 'DateTime']
+            stop_tag = 'DateTime'
         else:
             datetime_tags = ['EXIF DateTimeOriginal', 'Image DateTime', 'EXIF DateTime', 'DateTime']
+            stop_tag = 'DateTimeOriginal'
+        
+        # BytesIO over immutable bytes shares the buffer rather than copying it.
+        # details=False skips MakerNote decoding, which is not needed here.
+        with BytesIO(file_bytes) as stream:
+            tags = exifread.process_file(
+                stream, stop_tag=stop_tag, details=False, extract_thumbnail=False
+            )
+        
+        if not tags:
+            return None
         
         for tag_name in datetime_tags:
             if tag_name in tags:
-                try:
-                    dt = datetime.strptime(str(tags[tag_name]), '%Y:%m:%d %H:%M:%S')
-                    return dt.isoformat()
-                except ValueError:
-                    continue
+                date_taken = _parse_exif_datetime(str(tags[tag_name]))
+                if date_taken:
+                    return date_taken
         
         return None
         
@@ -140,22 +196,29 @@ def _download_and_extract_exif(
     
     try:
         # For RAW files, try partial download first (header only)
-        is_raw = file_name.lower().endswith(RAW_EXTENSIONS)
-        is_cr3 = file_name.lower().endswith('.cr3')
+        ext = os.path.splitext(file_name)[1].lower()
+        is_raw = ext in _RAW_EXT_SET
+        is_cr3 = ext == '.cr3'
         
+        header_bytes = None
         if is_raw and not is_cr3:
             # Partial download for most RAW files
             try:
-                file_bytes = storage_provider.download_file_partial(file_path, 0, RAW_HEADER_SIZE)
+                header_bytes = storage_provider.download_file_partial(file_path, 0, RAW_HEADER_SIZE)
             except (NotImplementedError, AttributeError):
-                # Fallback to full download
-                file_bytes = storage_provider.download_file(file_path)
-        else:
-            # Full download for JPEG and CR3 (CR3 needs full file)
-            file_bytes = storage_provider.download_file(file_path)
+                # Fallback to full download below
+                pass
         
         # Extract EXIF
-        date_taken = _extract_exif_datetime(file_bytes, file_name)
+        if header_bytes is not None:
+            date_taken = _extract_exif_datetime(header_bytes, file_name)
+        else:
+            # Full download for JPEG and CR3 (CR3 needs full file); the slot
+            # is held until parsing is done so whole files stay bounded
+            with _FULL_DOWNLOAD_SLOTS:
+                file_bytes = storage_provider.download_file(file_path)
+                date_taken = _extract_exif_datetime(file_bytes, file_name)
+                del file_bytes
         
         if date_taken:
             result = {
@@ -183,6 +246,14 @@ def _download_and_extract_exif(
             return None
 
 
+def _epoch_seconds(date_taken: str) -> float:
+    """Convert an ISO timestamp to epoch seconds (naive values treated as UTC)"""
+    dt = datetime.fromisoformat(date_taken)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 def _group_files_by_bracket(
     files: List[Dict[str, Any]],
     time_delta: timedelta
@@ -193,33 +264,26 @@ def _group_files_by_bracket(
     
     print(f"Creating brackets from {len(files)} files, time_delta={time_delta.total_seconds()}s")
     
-    # Sort by timestamp
-    sorted_files = sorted(files, key=lambda f: f['date_taken'])
-    
-    brackets = []
-    current_bracket = []
-    
-    for file in sorted_files:
-        current_time = datetime.fromisoformat(file['date_taken'])
-        
-        if not current_bracket:
-            current_bracket.append(file)
-        else:
-            last_time = datetime.fromisoformat(current_bracket[-1]['date_taken'])
-            time_gap = current_time - last_time
-            
-            if time_gap <= time_delta:
-                current_bracket.append(file)
-            else:
-                # Finish current bracket
-                bracket_output = [{'name': f['name'], 'path_lower': f['path_lower']} for f in current_bracket]
-                brackets.append(bracket_output)
-                current_bracket = [file]
+    # Parse each timestamp once and sort on the float
+    entries = [(_epoch_seconds(f['date_taken']), f) for f in files]
+    entries.sort(key=itemgetter(0))
+    delta_s = time_delta.total_seconds()
+    
+    # Split wherever the gap to the previous timestamp exceeds the delta
+    timestamps = [ts for ts, _ in entries]
+    sorted_files = [f for _, f in entries]
+    bounds = [0]
+    bounds.extend(
+        i for i in range(1, len(timestamps))
+        if timestamps[i] - timestamps[i - 1] > delta_s
+    )
+    bounds.append(len(sorted_files))
+    raw_brackets = [sorted_files[a:b] for a, b in zip(bounds, bounds[1:])]
     
-    # Add final bracket
-    if current_bracket:
-        bracket_output = [{'name': f['name'], 'path_lower': f['path_lower']} for f in current_bracket]
-        brackets.append(bracket_output)
+    brackets = [
+        [{'name': f['name'], 'path_lower': f['path_lower']} for f in bracket]
+        for bracket in raw_brackets
+    ]
     
     print(f"Created {len(brackets)} brackets")
     return brackets
@@ -236,11 +300,13 @@ def _sort_brackets_chronologically(
     # Create lookup
     metadata_lookup = {f['name']: f['date_taken'] for f in all_metadata}
     
-    def get_earliest_time(bracket):
-        times = [metadata_lookup.get(f['name'], '9999-12-31') for f in bracket]
-        return min(times) if times else '9999-12-31'
+    # Earliest timestamp per bracket, computed in one pass before sorting
+    keys = [
+        min((metadata_lookup.get(f['name'], '9999-12-31') for f in bracket), default='9999-12-31')
+        for bracket in brackets
+    ]
     
-    return sorted(brackets, key=get_earliest_time)
+    return [bracket for _, bracket in sorted(zip(keys, brackets), key=itemgetter(0))]
 
 
 # =============================================================================
@@ -287,31 +353,50 @@ def _handle_process_page_mode(
     page_number: int,
     files_per_page: int,
     all_files: List[Dict],
-    session_id: str
+    session_id: str,
+    max_workers: int = MAX_THREADS,
+    page_files: Optional[List[Dict]] = None
 ) -> Dict[str, Any]:
-    """Process page mode: Extract EXIF from a page of files"""
-    print(f"Process page mode: page {page_number}")
+    """
+    Process page mode: Extract EXIF from a page of files
     
-    # Get files for this page
-    start_idx = (page_number - 1) * files_per_page
-    end_idx = start_idx + files_per_page
-    page_files = all_files[start_idx:end_idx]
+    Callers may send just this page's slice as page_files instead of the
+    full all_files listing, which keeps per-page payloads small.
+    """
+    print(f"Process page mode: page {page_number}")
     
-    print(f"Processing files {start_idx + 1}-{min(end_idx, len(all_files))} of {len(all_files)}")
+    if page_files is not None:
+        print(f"Processing {len(page_files)} files sent for page {page_number}")
+    else:
+        # Get files for this page
+        start_idx = (page_number - 1) * files_per_page
+        end_idx = start_idx + files_per_page
+        page_files = all_files[start_idx:end_idx]
+        
+        print(f"Processing files {start_idx + 1}-{min(end_idx, len(all_files))} of {len(all_files)}")
     
     # Process with threading
     extracted_metadata = []
     
-    with ThreadPoolExecutor(max_workers=MAX_THREADS) as executor:
-        future_to_file = {
-            executor.submit(_download_and_extract_exif, storage_provider, f): f
-            for f in page_files
-        }
-        
-        for future in as_completed(future_to_file):
-            result = future.result()
-            if result:
-                extracted_metadata.append(result)
+    workers = max(1, min(max_workers, len(page_files)))
+    
+    # Downloaded buffers and exifread tag dicts are short-lived and acyclic;
+    # suspend cyclic GC while they churn and collect once at the end
+    gc.disable()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_file = {
+                executor.submit(_download_and_extract_exif, storage_provider, f): f
+                for f in page_files
+            }
+            
+            for future in as_completed(future_to_file):
+                result = future.result()
+                if result:
+                    extracted_metadata.append(result)
+    finally:
+        gc.enable()
+        gc.collect()
     
     print(f"Page {page_number} complete: {len(extracted_metadata)} files processed")
     
@@ -332,13 +417,18 @@ def _handle_make_bracket_mode(
     print("Make bracket mode")
     
     # Flatten nested arrays if needed
-    all_metadata = []
-    
     if len(aggregated_metadata) == 1 and isinstance(aggregated_metadata[0], list):
         # Double-nested: [[{...}]]
         all_metadata = aggregated_metadata[0]
+    elif all(isinstance(item, list) for item in aggregated_metadata):
+        # Aggregator output, one list per page: [[{...}], [{...}]]
+        all_metadata = list(chain.from_iterable(aggregated_metadata))
+    elif not any(isinstance(item, list) for item in aggregated_metadata):
+        # Already flat: [{...}]
+        all_metadata = list(aggregated_metadata)
     else:
-        # Normal case: [{...}] or [[{...}], [{...}]]
+        # Mixed pages and single entries
+        all_metadata = []
         for item in aggregated_metadata:
             if isinstance(item, list):
                 all_metadata.extend(item)
@@ -407,7 +497,7 @@ def main(data: Dict[str, Any]) -> Dict[str, Any]:
             return {
                 'statusCode': 200,
                 'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps(brackets)
+                'body': _json_dumps(brackets)
             }
         
         # =====================================================================
@@ -478,18 +568,24 @@ def main(data: Dict[str, Any]) -> Dict[str, Any]:
         elif mode == 'process_page':
             page_number = data.get('page_number')
             all_files = data.get('all_files')
+            page_files = data.get('page_files')
             session_id = data.get('session_id', str(uuid.uuid4()))
             files_per_page = data.get('files_per_page', DEFAULT_FILES_PER_PAGE)
             
-            if not page_number or not all_files:
-                raise ValueError("Missing 'page_number' or 'all_files' for process_page")
+            if not page_number or not (all_files or page_files):
+                raise ValueError("Missing 'page_number' or 'all_files'/'page_files' for process_page")
+            
+            max_workers = PAGE_WORKERS_BY_PROVIDER.get(storage_provider_name, MAX_THREADS)
             
-            result = _handle_process_page_mode(storage, page_number, files_per_page, all_files, session_id)
+            result = _handle_process_page_mode(
+                storage, page_number, files_per_page, all_files, session_id, max_workers,
+                page_files=page_files
+            )
         
         return {
             'statusCode': 200,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps(result)
+            'body': _json_dumps(result)
         }
         
     except Exception as e:
@@ -501,7 +597,7 @@ def main(data: Dict[str, Any]) -> Dict[str, Any]:
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
+            'body': _json_dumps({
                 'error': error_msg,
                 'version': VERSION,
                 'correlation_id': correlation_id
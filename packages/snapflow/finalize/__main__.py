@@ -8,10 +8,14 @@ Version: 1.0.0-snapflow
 
 import json
 import os
+import random
 import requests
+import threading
 import uuid
 import time
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Dict, Any, List, Optional
 
 # Import from SnapFlow Core shared library
 from shared import (
@@ -20,51 +24,168 @@ from shared import (
     EnhancementFactory,
     # Config
     SHARED_VERSION,
+    DOWNLOAD_CHUNK_SIZE,
     # Notifications
     WebhookNotifier,
     NotificationLevel,
     # Utils
     sanitize_filename_prefix,
+    get_http_session,
 )
 
+# Fast JSON for request/response bodies (falls back to stdlib).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+# handlers keep working with either backend.
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Function version
 VERSION = f"1.0.0-finalize-snapflow-{SHARED_VERSION}"
 
 # Retry Configuration
-RETRY_DELAY_SECONDS = 180  # Wait 3 minutes between retries
+# Wait between retry waves (3 minutes); FINALIZE_RETRY_DELAY_SECONDS can
+# shorten it per deployment but is clamped so MAX_RETRIES waits never sleep
+# longer in total than the original 3 x 180s
+RETRY_DELAY_MAX_SECONDS = 180
+RETRY_DELAY_SECONDS = min(
+    max(int(os.getenv("FINALIZE_RETRY_DELAY_SECONDS", "180")), 0),
+    RETRY_DELAY_MAX_SECONDS
+)
+RETRY_JITTER_FRACTION = 0.1  # Waits land in the top 10% of the delay
 MAX_RETRIES = 3
 
+# Deadline budgeting: never sleep into the time the last wave's downloads,
+# uploads and the job_completed webhook need
+FUNCTION_TIMEOUT_SECONDS = 900
+FINAL_WAVE_RESERVE_SECONDS = 120
+
+# Provider statuses that mean "not finished yet" (normalized to lowercase)
+_RETRY_STATUSES = frozenset({'pending', 'in_progress', 'processing'})
+
+# Enhancements checked/downloaded concurrently per retry wave. The work is
+# network-bound; the cap keeps us polite to the Fotello/AutoHDR APIs.
+MAX_CONCURRENT_ENHANCEMENTS = 10
+
+# Shared pooled HTTP session for providers and result downloads: keeps TLS
+# connections to the provider APIs and CDN alive across brackets and
+# retries transient errors on idempotent requests
+_HTTP = get_http_session()
+
+
+_NOTIFICATION_LEVELS = {
+    'errors_only': NotificationLevel.ERRORS_ONLY,
+    'minimal': NotificationLevel.MINIMAL,
+    'standard': NotificationLevel.STANDARD,
+    'verbose': NotificationLevel.VERBOSE,
+}
+
 
 def _parse_notification_level(level_str: str) -> NotificationLevel:
     """Convert string to NotificationLevel enum"""
-    mapping = {
-        'errors_only': NotificationLevel.ERRORS_ONLY,
-        'minimal': NotificationLevel.MINIMAL,
-        'standard': NotificationLevel.STANDARD,
-        'verbose': NotificationLevel.VERBOSE,
-    }
-    return mapping.get(level_str, NotificationLevel.MINIMAL)
+    return _NOTIFICATION_LEVELS.get(level_str, NotificationLevel.MINIMAL)
 
 
-def _download_file_from_url(url: str) -> bytes:
-    """Downloads a file from a given URL and returns its content as bytes"""
+def _remaining_seconds(context: Any, started_at: float) -> float:
+    """Seconds left before the function timeout"""
+    get_remaining = getattr(context, 'get_remaining_time_in_millis', None)
+    if callable(get_remaining):
+        return get_remaining() / 1000
+    return FUNCTION_TIMEOUT_SECONDS - (time.monotonic() - started_at)
+
+
+def _retry_delay_seconds(remaining_seconds: float) -> float:
+    """
+    Jittered wait before the next retry wave, bounded by the deadline
+    
+    Waits between 90% and 100% of RETRY_DELAY_SECONDS, so concurrent jobs
+    spread their polling without noticeably shortening the window slow
+    enhancements get, and never past FINAL_WAVE_RESERVE_SECONDS before the
+    function timeout. Returns 0 or less when no further wave fits.
+    """
+    delay = random.uniform(RETRY_DELAY_SECONDS * (1 - RETRY_JITTER_FRACTION), RETRY_DELAY_SECONDS)
+    return min(delay, remaining_seconds - FINAL_WAVE_RESERVE_SECONDS)
+
+
+def _upload_from_url(
+    url: str,
+    storage_provider,
+    dest_path: str,
+    upload_lock: Optional[threading.Lock] = None,
+    verbose_logs: bool = True
+) -> int:
+    """
+    Downloads a file from a given URL into storage and returns its size in bytes
+    
+    Providers with upload_stream (Dropbox) get the response chunks piped
+    straight into an upload session, so the enhanced image is never held
+    in memory whole; others receive one joined bytes object.
+    """
     try:
-        print(f"Downloading enhanced file from URL")
-        response = requests.get(url, stream=True, timeout=300)
-        response.raise_for_status()
-        
-        content_length = response.headers.get('content-length')
-        if content_length:
-            size_mb = int(content_length) / (1024 * 1024)
-            print(f"Enhanced file size: {size_mb:.2f} MB")
+        if verbose_logs:
+            print(f"Downloading enhanced file from URL")
+        with _HTTP.get(url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+            
+            content_length = response.headers.get('content-length')
+            if content_length and verbose_logs:
+                size_mb = int(content_length) / (1024 * 1024)
+                print(f"Enhanced file size: {size_mb:.2f} MB")
+            
+            chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
             
-        print("Enhanced file downloaded successfully")
-        return response.content
+            if hasattr(storage_provider, 'upload_stream'):
+                size_bytes = 0
+                
+                def _counted_chunks():
+                    nonlocal size_bytes
+                    for chunk in chunks:
+                        size_bytes += len(chunk)
+                        yield chunk
+                
+                with upload_lock or nullcontext():
+                    storage_provider.upload_stream(dest_path, _counted_chunks(), overwrite=True)
+            else:
+                content = b''.join(chunks)
+                size_bytes = len(content)
+                with upload_lock or nullcontext():
+                    storage_provider.upload_file(dest_path, content, overwrite=True)
+        
+        if verbose_logs:
+            print("Enhanced file downloaded successfully")
+        return size_bytes
     except requests.exceptions.RequestException as e:
         print(f"Failed to download file from URL: {e}")
         raise
 
 
+def _resolve_filename_prefix(filename_prefix: str, listing_id: str) -> str:
+    """Sanitized filename prefix for the job, falling back to listing_id"""
+    if filename_prefix and filename_prefix.strip():
+        return sanitize_filename_prefix(filename_prefix) or listing_id
+    return listing_id
+
+
+def _dropbox_dest_path(destination_folder: str, filename: str) -> str:
+    """Dropbox: /path/to/folder/filename"""
+    dest_path = f"{destination_folder}/{filename}"
+    if not dest_path.startswith('/'):
+        dest_path = '/' + dest_path
+    return dest_path
+
+
+def _gdrive_dest_path(destination_folder: str, filename: str) -> str:
+    """Google Drive: folder_id/filename"""
+    return f"{destination_folder}/{filename}"
+
+
 def _create_standardized_job_result(
     job_id: str,
     listing_id: str,
@@ -76,44 +197,44 @@ def _create_standardized_job_result(
 ) -> Dict:
     """Create standardized job result structure"""
     
-    # Separate successful and failed enhancements
-    successful_uploads = [r for r in completed_enhancements if r.get('status') == 'uploaded']
-    failed_results = [r for r in completed_enhancements if r.get('status') != 'uploaded']
+    # Split successes and failures in a single pass
+    successful_count = 0
+    enhanced_images = []
+    failed_brackets = []
+    
+    for r in completed_enhancements:
+        if r.get('status') == 'uploaded':
+            successful_count += 1
+            if 'storage_path' in r and 'file_size_mb' in r:
+                enhanced_images.append({
+                    'bracket_index': r['bracket_index'],
+                    'storage_path': r['storage_path'],
+                    'file_size_mb': r['file_size_mb']
+                })
+        else:
+            failed_brackets.append({
+                'bracket_index': r.get('bracket_index'),
+                'error': r.get('error', 'Unknown error')
+            })
+    
+    failed_count = len(failed_brackets)
     
     # Determine overall job status
-    if successful_uploads and not failed_results:
+    if successful_count and not failed_count:
         job_status = 'job_completed'
-    elif successful_uploads and failed_results:
+    elif successful_count and failed_count:
         job_status = 'job_partial_success'
     else:
         job_status = 'job_failed'
     
-    # Build enhanced_images array
-    enhanced_images = []
-    for r in successful_uploads:
-        if 'storage_path' in r and 'file_size_mb' in r:
-            enhanced_images.append({
-                'bracket_index': r['bracket_index'],
-                'storage_path': r['storage_path'],
-                'file_size_mb': r['file_size_mb']
-            })
-    
-    # Build failed_brackets array
-    failed_brackets = []
-    for r in failed_results:
-        failed_brackets.append({
-            'bracket_index': r.get('bracket_index'),
-            'error': r.get('error', 'Unknown error')
-        })
-    
     return {
         'status': job_status,
         'job_id': job_id,
         'listing_id': listing_id,
         'total_brackets': total_brackets,
         'processed_brackets': processed_brackets,
-        'successful_enhancements': len(successful_uploads),
-        'failed_enhancements': len(failed_results),
+        'successful_enhancements': successful_count,
+        'failed_enhancements': failed_count,
         'enhanced_images': enhanced_images,
         'failed_brackets': failed_brackets,
         'timestamp': time.time(),
@@ -133,77 +254,84 @@ def _process_enhancement(
     notifier: WebhookNotifier,
     current_num: int = None,
     total_num: int = None,
-    filename_prefix: str = None
+    prefix_to_use: str = None,
+    upload_lock: Optional[threading.Lock] = None,
+    status_result: Optional[Dict] = None,
+    dest_path_builder: Callable[[str, str], str] = None,
+    verbose_logs: bool = True
 ) -> Dict:
-    """Process a single enhancement - check status and download/upload if completed"""
+    """
+    Process a single enhancement - check status and download/upload if completed
+    
+    dest_path_builder maps (destination_folder, filename) to the storage
+    path; it is chosen once per job from the storage provider.
+    verbose_logs enables per-bracket progress output (errors always print).
+    prefix_to_use is the job's already-sanitized filename prefix (see
+    _resolve_filename_prefix); listing_id is used when it is empty.
+    status_result is this enhancement's entry from a batched
+    check_statuses() call; the status is fetched individually if omitted.
+    upload_lock serializes storage uploads for providers whose client is
+    not thread-safe (Google Drive's httplib2 transport).
+    """
     
     enhancement_id = enhancement_info['enhancement_id']
     bracket_index = enhancement_info['bracket_index']
+    dest_path_builder = dest_path_builder or _dropbox_dest_path
     
-    # Progress info
-    progress_info = {}
-    if current_num is not None and total_num is not None:
-        progress_info = {
-            'enhancement_progress': f"{current_num} of {total_num}",
-            'current_enhancement': current_num,
-            'total_enhancements': total_num
-        }
+    # Progress info (only materialized for completed brackets)
+    has_progress = current_num is not None and total_num is not None
     
     try:
-        # Check enhancement status using provider
-        status_result = enhancement_provider.get_enhancement_status(enhancement_id)
-        status = status_result.get('status', 'unknown')
+        # Check enhancement status using provider (unless already batched)
+        if status_result is None:
+            status_result = enhancement_provider.check_status(enhancement_id)
+        # Normalize once so 'Processing' / ' completed' don't fall through
+        status = str(status_result.get('status') or 'unknown').strip().lower()
+        enhanced_image_url = status_result.get('enhanced_image_url')
+        status_error = status_result.get('error')
         
-        print(f"Enhancement {enhancement_id} status: {status}")
+        if status == 'error':
+            raise IOError(status_error or 'Status check failed')
+        
+        if verbose_logs:
+            print(f"Enhancement {enhancement_id} status: {status}")
         
         if status == 'completed':
-            enhanced_image_url = status_result.get('enhanced_image_url')
-            
             if enhanced_image_url:
-                progress_msg = f" ({progress_info.get('enhancement_progress', f'bracket {bracket_index + 1}')})"
-                print(f"Enhancement completed{progress_msg}")
+                if verbose_logs:
+                    progress_msg = f"{current_num} of {total_num}" if has_progress else f"bracket {bracket_index + 1}"
+                    print(f"Enhancement completed ({progress_msg})")
                 
                 try:
-                    # Download enhanced image
-                    enhanced_bytes = _download_file_from_url(enhanced_image_url)
-                    
                     # Build destination filename
-                    if filename_prefix and filename_prefix.strip():
-                        sanitized_prefix = sanitize_filename_prefix(filename_prefix)
-                        prefix_to_use = sanitized_prefix if sanitized_prefix else listing_id
-                    else:
-                        prefix_to_use = listing_id
-                    
-                    enhanced_filename = f"{bracket_index + 1}_{prefix_to_use}.jpg"
+                    enhanced_filename = f"{bracket_index + 1}_{prefix_to_use or listing_id}.jpg"
+                    dest_path = dest_path_builder(destination_folder, enhanced_filename)
                     
-                    # Upload to storage
-                    # Handle different path formats for Dropbox vs Google Drive
-                    if hasattr(storage_provider, 'provider_name') and storage_provider.provider_name == 'google_drive':
-                        # Google Drive: folder_id/filename
-                        dest_path = f"{destination_folder}/{enhanced_filename}"
-                    else:
-                        # Dropbox: /path/to/folder/filename
-                        dest_path = f"{destination_folder}/{enhanced_filename}"
-                        if not dest_path.startswith('/'):
-                            dest_path = '/' + dest_path
-                    
-                    upload_result = storage_provider.upload_file(dest_path, enhanced_bytes, overwrite=True)
+                    # Download enhanced image into storage
+                    enhanced_size = _upload_from_url(
+                        enhanced_image_url, storage_provider, dest_path, upload_lock, verbose_logs
+                    )
                     
-                    print(f"Uploaded to: {dest_path}")
+                    if verbose_logs:
+                        print(f"Uploaded to: {dest_path}")
                     
-                    notifier.send_debug('bracket_completed', {
+                    debug_data = {
                         'bracket_index': bracket_index,
                         'storage_path': dest_path,
                         'enhancement_id': enhancement_id,
-                        **progress_info
-                    })
+                    }
+                    if has_progress:
+                        debug_data['enhancement_progress'] = f"{current_num} of {total_num}"
+                        debug_data['current_enhancement'] = current_num
+                        debug_data['total_enhancements'] = total_num
+                    notifier.send_debug('bracket_completed', debug_data)
                     
                     return {
                         'enhancement_id': enhancement_id,
                         'bracket_index': bracket_index,
                         'status': 'uploaded',
                         'storage_path': dest_path,
-                        'file_size_mb': round(len(enhanced_bytes) / (1024 * 1024), 2)
+                        'file_size_mb': round(enhanced_size / (1024 * 1024), 2)
                     }
                     
                 except Exception as e:
@@ -225,7 +353,7 @@ def _process_enhancement(
                     'error': 'No enhanced_image_url in response'
                 }
         
-        elif status == 'in_progress' or status == 'processing':
+        elif status in _RETRY_STATUSES:
             return {
                 'enhancement_id': enhancement_id,
                 'bracket_index': bracket_index,
@@ -238,7 +366,7 @@ def _process_enhancement(
                 'enhancement_id': enhancement_id,
                 'bracket_index': bracket_index,
                 'status': 'failed',
-                'error': status_result.get('error', 'Enhancement failed')
+                'error': status_error if status_error is not None else 'Enhancement failed'
             }
         
         else:
@@ -278,6 +406,8 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     - Storage: Dropbox, Google Drive
     - Enhancement: Fotello, AutoHDR
     """
+    started_at = time.monotonic()
+    
     # Setup correlation ID
     correlation_id = event.get('correlation_id', str(uuid.uuid4()))
     print(f"=== SNAPFLOW FINALIZE v{VERSION} === [ID: {correlation_id}]")
@@ -289,7 +419,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if 'body' in event and event['body']:
             if isinstance(event['body'], str):
                 try:
-                    event_data = json.loads(event['body'])
+                    event_data = _json_loads(event['body'])
                 except json.JSONDecodeError:
                     event_data = event
             else:
@@ -377,7 +507,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return {
                 'statusCode': 400,
                 'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
+                'body': _json_dumps({
                     'error': error_msg,
                     'job_id': job_id,
                     'correlation_id': correlation_id
@@ -411,7 +541,9 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             else:
                 raise ValueError(f"Unknown storage provider: {storage_provider_name}")
             
-            storage = StorageFactory.create(storage_provider_name, storage_credentials)
+            storage = StorageFactory.create(
+                storage_provider_name, storage_credentials, session=_HTTP
+            )
             print(f"Storage provider connected: {storage_provider_name}")
             
         except Exception as e:
@@ -428,7 +560,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return {
                 'statusCode': 500,
                 'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
+                'body': _json_dumps({
                     'error': error_msg,
                     'job_id': job_id,
                     'correlation_id': correlation_id
@@ -442,13 +574,15 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             if enhancement_provider_name == 'fotello':
                 enhancement = EnhancementFactory.create(
                     'fotello',
-                    event_data.get('fotello_api_key')
+                    event_data.get('fotello_api_key'),
+                    session=_HTTP
                 )
             elif enhancement_provider_name == 'autohdr':
                 enhancement = EnhancementFactory.create(
                     'autohdr',
                     event_data.get('autohdr_api_key'),
-                    email=event_data.get('autohdr_email')
+                    email=event_data.get('autohdr_email'),
+                    session=_HTTP
                 )
             else:
                 raise ValueError(f"Unknown enhancement provider: {enhancement_provider_name}")
@@ -469,7 +603,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return {
                 'statusCode': 500,
                 'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
+                'body': _json_dumps({
                     'error': error_msg,
                     'job_id': job_id,
                     'correlation_id': correlation_id
@@ -480,51 +614,88 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # PROCESS ENHANCEMENTS WITH RETRY LOGIC
         # =====================================================================
         completed_enhancements = []
-        pending_retries = enhancement_ids.copy()
+        # Each wave rebinds pending_retries to a new list, so the input
+        # list is never mutated and needs no defensive copy
+        pending_retries = enhancement_ids
         retry_count = 0
         total_enhancements_count = len(enhancement_ids)
+        upload_lock = threading.Lock() if storage_provider_name == 'google_drive' else None
+        dest_path_builder = _gdrive_dest_path if storage_provider_name == 'google_drive' else _dropbox_dest_path
+        prefix_to_use = _resolve_filename_prefix(filename_prefix, listing_id)
+        
+        # Per-bracket progress lines only at standard/verbose levels; the
+        # default (minimal) keeps one summary line per wave
+        verbose_logs = notification_level in (NotificationLevel.STANDARD, NotificationLevel.VERBOSE)
         
         while pending_retries and retry_count <= MAX_RETRIES:
             print(f"Processing attempt #{retry_count + 1} for {len(pending_retries)} enhancements")
             
-            if retry_count > 0:
-                notifier.send_debug('retry_attempt', {
-                    'retry_count': retry_count,
-                    'pending_count': len(pending_retries),
-                    'total_enhancements': total_enhancements_count
-                })
-                print(f"Waiting {RETRY_DELAY_SECONDS} seconds before retry...")
-                time.sleep(RETRY_DELAY_SECONDS)
-            
             still_pending = []
+            total_pending = len(pending_retries)
+            workers = max(1, min(MAX_CONCURRENT_ENHANCEMENTS, total_pending))
             
-            for idx, enhancement_info in enumerate(pending_retries):
-                current_num = idx + 1
-                total_pending = len(pending_retries)
-                
-                print(f"Checking enhancement {current_num}/{total_pending} (bracket {enhancement_info['bracket_index'] + 1})")
-                
-                result = _process_enhancement(
-                    enhancement_info=enhancement_info,
-                    enhancement_provider=enhancement,
-                    storage_provider=storage,
-                    listing_id=listing_id,
-                    destination_folder=destination_folder,
-                    notifier=notifier,
-                    current_num=current_num,
-                    total_num=total_pending,
-                    filename_prefix=filename_prefix
-                )
+            # One batched status round for the whole wave
+            statuses = enhancement.check_statuses(
+                [e['enhancement_id'] for e in pending_retries],
+                max_workers=MAX_CONCURRENT_ENHANCEMENTS
+            )
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = []
+                for idx, enhancement_info in enumerate(pending_retries):
+                    current_num = idx + 1
+                    
+                    if verbose_logs:
+                        print(f"Checking enhancement {current_num}/{total_pending} (bracket {enhancement_info['bracket_index'] + 1})")
+                    
+                    futures.append(executor.submit(
+                        _process_enhancement,
+                        enhancement_info=enhancement_info,
+                        enhancement_provider=enhancement,
+                        storage_provider=storage,
+                        listing_id=listing_id,
+                        destination_folder=destination_folder,
+                        notifier=notifier,
+                        current_num=current_num,
+                        total_num=total_pending,
+                        prefix_to_use=prefix_to_use,
+                        upload_lock=upload_lock,
+                        status_result=statuses.get(enhancement_info['enhancement_id']),
+                        dest_path_builder=dest_path_builder,
+                        verbose_logs=verbose_logs
+                    ))
                 
-                if result.get('retry_needed'):
-                    still_pending.append(enhancement_info)
-                    print(f"Enhancement {enhancement_info['enhancement_id']} still in progress, will retry")
-                else:
-                    completed_enhancements.append(result)
-                    print(f"Enhancement {enhancement_info['enhancement_id']} finished: {result['status']}")
+                # Collect in submission order so results keep bracket order
+                for enhancement_info, future in zip(pending_retries, futures):
+                    result = future.result()
+                    
+                    if result.get('retry_needed'):
+                        still_pending.append(enhancement_info)
+                        if verbose_logs:
+                            print(f"Enhancement {enhancement_info['enhancement_id']} still in progress, will retry")
+                    else:
+                        completed_enhancements.append(result)
+                        if verbose_logs:
+                            print(f"Enhancement {enhancement_info['enhancement_id']} finished: {result['status']}")
+            
+            print(f"Attempt #{retry_count + 1}: {total_pending - len(still_pending)} finished, {len(still_pending)} still in progress")
             
             pending_retries = still_pending
             retry_count += 1
+            
+            # Only wait when another wave will actually run
+            if pending_retries and retry_count <= MAX_RETRIES:
+                delay = _retry_delay_seconds(_remaining_seconds(context, started_at))
+                if delay <= 0:
+                    print("Not enough time left for another retry wave")
+                    break
+                notifier.send_debug('retry_attempt', {
+                    'retry_count': retry_count,
+                    'pending_count': len(pending_retries),
+                    'total_enhancements': total_enhancements_count
+                })
+                print(f"Waiting {delay:.0f} seconds before retry...")
+                time.sleep(delay)
         
         # Handle any remaining in-progress as timeouts
         for enhancement_info in pending_retries:
@@ -532,7 +703,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'enhancement_id': enhancement_info['enhancement_id'],
                 'bracket_index': enhancement_info['bracket_index'],
                 'status': 'timeout',
-                'error': f'Enhancement still in progress after {MAX_RETRIES} retry attempts'
+                'error': f'Enhancement still in progress after {retry_count - 1} retry attempts'
             })
         
         # =====================================================================
@@ -551,7 +722,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return {
             'statusCode': 200,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
+            'body': _json_dumps({
                 'message': 'Processing completed',
                 'job_id': job_id,
                 'listing_id': listing_id,
@@ -590,7 +761,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return {
             'statusCode': 500,
             'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
+            'body': _json_dumps({
                 'error': error_msg,
                 'error_type': type(e).__name__,
                 'job_id': event_data.get('job_id', 'unknown') if 'event_data' in dir() else 'unknown',
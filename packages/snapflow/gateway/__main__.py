@@ -7,14 +7,18 @@ Validates credentials, dispatches to process function.
 Version: 1.0.0-snapflow
 """
 
+import atexit
 import json
 import os
 import requests
-import uuid
-import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from requests.certs import where as _ca_bundle_path
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 
 # Import from SnapFlow Core shared library
 from shared import (
@@ -26,137 +30,229 @@ from shared import (
     SHARED_VERSION,
 )
 
+# Fast JSON for request/response bodies (falls back to stdlib).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+# handlers keep working with either backend.
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Function version
 VERSION = f"1.0.0-gateway-snapflow-{SHARED_VERSION}"
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Fields accepted from HTTP web-trigger requests
+_EXPECTED_FIELDS = frozenset([
+    # Identity
+    'client_id', 'listing_id',
+
+    # Provider selection (new format)
+    'storage_provider', 'enhancement_provider',
+
+    # Dropbox credentials (legacy)
+    'dropbox_refresh_token_encrypted', 'dropbox_app_key_encrypted',
+    'dropbox_app_secret_encrypted', 'dropbox_team_member_id', 'access_mode',
+
+    # Google Drive credentials (legacy)
+    'google_drive_client_id_encrypted', 'google_drive_client_secret_encrypted',
+    'google_drive_refresh_token_encrypted',
+
+    # Enhancement credentials (legacy)
+    'fotello_api_key_encrypted',
+    'autohdr_api_key_encrypted', 'autohdr_email',
+
+    # Job configuration
+    'callback_webhook', 'brackets_data',
+    'dropbox_folder', 'dropbox_destination_folder',
+    'google_drive_folder_id', 'google_drive_destination_folder_id',
+    'notification_level', 'filename_prefix',
+
+    # Optional flags
+    'skip_finalize', 'batch_debug_notifications',
+])
+
+_REQUIRED_FIELDS = ('client_id', 'listing_id', 'callback_webhook', 'brackets_data')
+
+# Decrypted credential fields that must never outlive the dispatch
+_SENSITIVE_FIELDS = frozenset({
+    'dropbox_app_key', 'dropbox_app_secret', 'dropbox_refresh_token',
+    'fotello_api_key', 'autohdr_api_key',
+    'google_drive_client_id', 'google_drive_client_secret', 'google_drive_refresh_token',
+})
+
+# Background dispatch workers, kept alive across warm invocations so each
+# request hands off to an existing thread instead of spawning a new one.
+_DISPATCH_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DISPATCH_POOL_SIZE", "8")),
+    thread_name_prefix="dispatch"
+)
+atexit.register(_DISPATCH_POOL.shutdown, wait=False)
+
+# TLS context with the CA bundle loaded once at container init; by default
+# requests hands urllib3 the bundle path and it is re-read for every new
+# connection.
+_SSL_CONTEXT = create_urllib3_context()
+_SSL_CONTEXT.load_verify_locations(cafile=_ca_bundle_path())
+
+
+class _PreloadedTLSAdapter(HTTPAdapter):
+    """HTTPAdapter that verifies certificates with the shared _SSL_CONTEXT"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = _SSL_CONTEXT
+        super().init_poolmanager(*args, **kwargs)
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True:
+            # CAs are already in _SSL_CONTEXT; a path here would reload them
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+# Shared HTTP session so warm invocations reuse keep-alive connections to
+# the process function and callback webhooks instead of a new TLS handshake
+_SESSION = requests.Session()
+_SESSION.headers.update({'Content-Type': 'application/json'})
+_SESSION.mount('https://', _PreloadedTLSAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+))
+
+
+def _warmup():
+    """
+    Prime per-container resources during init rather than on the first request.
+    The runtime executes module-level code before the first `main` call,
+    so this work is off the request path.
+    """
+    # Start a dispatch worker so the first submit reuses a live thread
+    _DISPATCH_POOL.submit(int).result()
+
+
+if os.getenv("SNAPFLOW_WARMUP", "1") == "1":
+    _warmup()
+
+
+def _new_id() -> str:
+    """Random 128-bit identifier in canonical UUID layout (8-4-4-4-12 hex)"""
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _error_response(status_code: int, error: str, correlation_id: str) -> Dict[str, Any]:
+    """Build a JSON error response for the web action"""
+    return {
+        'statusCode': status_code,
+        'headers': _JSON_HEADERS,
+        'body': _json_dumps({
+            'error': error,
+            'correlation_id': correlation_id,
+            'version': VERSION
+        })
+    }
 
-def _dispatch_async(
-    process_url: str,
-    payload: dict,
-    callback_webhook: str,
-    job_id: str,
-    listing_id: str,
-    client_id: str,
+
+@dataclass(slots=True, frozen=True)
+class DispatchCtx:
+    """Identifiers and endpoints for one background dispatch"""
+    process_url: str
+    callback_webhook: str
+    job_id: str
+    listing_id: str
+    client_id: str
     correlation_id: str
-):
+
+
+def _dispatch_async(ctx: DispatchCtx, payload: dict):
     """
-    Dispatch to process function in background thread.
+    Dispatch to process function on the background dispatch pool.
     Runs after gateway has already returned to Make.com.
+
+    Takes ownership of `payload`: credentials are cleared from it once
+    the dispatch finishes, so callers must not reuse it.
     """
     try:
-        print(f"[ASYNC] Starting dispatch for job {job_id} (client: {client_id}) [ID: {correlation_id}]")
+        print(f"[ASYNC] Starting dispatch for job {ctx.job_id} (client: {ctx.client_id}) [ID: {ctx.correlation_id}]")
         
-        payload['correlation_id'] = correlation_id
+        payload['correlation_id'] = ctx.correlation_id
 
-        response = requests.post(
-            process_url,
-            json=payload,
-            timeout=60,
-            headers={'Content-Type': 'application/json'}
-        )
+        response = _SESSION.post(ctx.process_url, json=payload, timeout=60)
 
         print(f"[ASYNC] Dispatch response: {response.status_code}")
 
         if response.status_code >= 400:
             print(f"[ASYNC] Dispatch failed: {response.text}")
-            _send_dispatch_error(callback_webhook, job_id, listing_id, client_id, 
-                               f'Process function returned {response.status_code}', correlation_id)
+            if ctx.callback_webhook:
+                _send_dispatch_error(ctx, f'Process function returned {response.status_code}')
         else:
-            print(f"[ASYNC] Dispatch successful for job {job_id}")
+            print(f"[ASYNC] Dispatch successful for job {ctx.job_id}")
 
     except Exception as e:
         print(f"[ASYNC] Dispatch error: {e}")
-        _send_dispatch_error(callback_webhook, job_id, listing_id, client_id, 
-                           f'Async dispatch failed: {str(e)}', correlation_id)
+        if ctx.callback_webhook:
+            _send_dispatch_error(ctx, f'Async dispatch failed: {str(e)}')
     finally:
         # Clear sensitive data from memory
-        _clear_credentials_from_payload(payload)
+        _scrub(payload)
+        print(f"[ASYNC] Cleared credentials from payload")
 
 
-def _send_dispatch_error(callback_webhook: str, job_id: str, listing_id: str, 
-                        client_id: str, error: str, correlation_id: str):
-    """Send dispatch error notification to callback webhook"""
-    if not callback_webhook:
-        return
-    
+def _send_dispatch_error(ctx: DispatchCtx, error: str):
+    """
+    Send dispatch error notification to callback webhook.
+    Callers check that ctx.callback_webhook is set before calling.
+    """
     try:
         error_notification = {
             'status': 'dispatch_failed',
             'function_name': 'gateway',
             'log_level': 'ERROR',
-            'job_id': job_id,
-            'listing_id': listing_id,
-            'client_id': client_id,
+            'job_id': ctx.job_id,
+            'listing_id': ctx.listing_id,
+            'client_id': ctx.client_id,
             'error': error,
             'timestamp': time.time(),
-            'correlation_id': correlation_id,
+            'correlation_id': ctx.correlation_id,
             'version': VERSION
         }
-        requests.post(callback_webhook, json=error_notification, timeout=10)
+        _SESSION.post(ctx.callback_webhook, json=error_notification, timeout=10)
     except:
         pass
 
 
-def _clear_credentials_from_payload(payload: dict):
-    """Clear sensitive credentials from payload dict"""
-    sensitive_fields = [
-        'dropbox_app_key', 'dropbox_app_secret', 'dropbox_refresh_token',
-        'fotello_api_key', 'autohdr_api_key',
-        'google_drive_client_id', 'google_drive_client_secret', 'google_drive_refresh_token'
-    ]
-    for field in sensitive_fields:
-        payload.pop(field, None)
-    print(f"[ASYNC] Cleared credentials from payload")
+def _scrub(d: dict):
+    """Remove sensitive credential fields from a dict in place"""
+    for field in _SENSITIVE_FIELDS:
+        d.pop(field, None)
 
 
 def _parse_event_data(event: Dict[str, Any]) -> Dict[str, Any]:
     """Parse and extract data from various event formats"""
     
-    # List of fields we expect
-    expected_fields = [
-        # Identity
-        'client_id', 'listing_id',
-        
-        # Provider selection (new format)
-        'storage_provider', 'enhancement_provider',
-        
-        # Dropbox credentials (legacy)
-        'dropbox_refresh_token_encrypted', 'dropbox_app_key_encrypted', 
-        'dropbox_app_secret_encrypted', 'dropbox_team_member_id', 'access_mode',
-        
-        # Google Drive credentials (legacy)
-        'google_drive_client_id_encrypted', 'google_drive_client_secret_encrypted',
-        'google_drive_refresh_token_encrypted',
-        
-        # Enhancement credentials (legacy)
-        'fotello_api_key_encrypted',
-        'autohdr_api_key_encrypted', 'autohdr_email',
-        
-        # Job configuration
-        'callback_webhook', 'brackets_data', 
-        'dropbox_folder', 'dropbox_destination_folder',
-        'google_drive_folder_id', 'google_drive_destination_folder_id',
-        'notification_level', 'filename_prefix',
-        
-        # Optional flags
-        'skip_finalize',
-    ]
-    
     # HTTP request format (from web trigger)
     if '__ow_method' in event and '__ow_headers' in event:
         print("HTTP request detected")
-        return {field: event.get(field) for field in expected_fields if field in event}
+        return {field: event[field] for field in event.keys() & _EXPECTED_FIELDS}
     
-    # Body wrapper format
-    if 'body' in event:
-        body = event.get('body')
-        if isinstance(body, str):
-            try:
-                return json.loads(body)
-            except json.JSONDecodeError:
-                pass
-        elif isinstance(body, dict):
-            return body
+    # Body wrapper format (a missing body falls through like a non-JSON one)
+    body = event.get('body')
+    if isinstance(body, (str, bytes)):
+        try:
+            return _json_loads(body)
+        except json.JSONDecodeError:
+            pass
+    elif isinstance(body, dict):
+        return body
     
     # Direct format (fields at top level)
     if 'listing_id' in event or 'client_id' in event:
@@ -165,23 +261,26 @@ def _parse_event_data(event: Dict[str, Any]) -> Dict[str, Any]:
     return None
 
 
-def _validate_required_fields(data: Dict[str, Any]) -> list:
-    """Validate required fields are present"""
-    required = ['client_id', 'listing_id', 'callback_webhook', 'brackets_data']
+def _classify(data: Dict[str, Any]) -> tuple:
+    """
+    Validate required fields and detect providers in one pass.
     
-    # Need either Dropbox or Google Drive credentials
+    Returns:
+        Tuple of (missing_fields, storage_provider, enhancement_provider)
+    """
+    # Credential presence drives both validation and provider detection
     has_dropbox = data.get('dropbox_refresh_token_encrypted')
     has_google_drive = data.get('google_drive_refresh_token_encrypted')
-    
-    # Need either Fotello or AutoHDR credentials
     has_fotello = data.get('fotello_api_key_encrypted')
     has_autohdr = data.get('autohdr_api_key_encrypted')
     
-    missing = [f for f in required if not data.get(f)]
+    missing = [f for f in _REQUIRED_FIELDS if not data.get(f)]
     
+    # Need either Dropbox or Google Drive credentials
     if not has_dropbox and not has_google_drive:
         missing.append('storage_credentials (dropbox or google_drive)')
     
+    # Need either Fotello or AutoHDR credentials
     if not has_fotello and not has_autohdr:
         missing.append('enhancement_credentials (fotello or autohdr)')
     
@@ -189,82 +288,80 @@ def _validate_required_fields(data: Dict[str, Any]) -> list:
     if not data.get('dropbox_destination_folder') and not data.get('google_drive_destination_folder_id'):
         missing.append('destination_folder')
     
-    return missing
-
-
-def _detect_providers(data: Dict[str, Any]) -> tuple:
-    """Detect storage and enhancement providers from credentials"""
-    
     # Storage provider
-    if data.get('storage_provider'):
-        storage_provider = data['storage_provider']
-    elif data.get('dropbox_refresh_token_encrypted'):
-        storage_provider = 'dropbox'
-    elif data.get('google_drive_refresh_token_encrypted'):
-        storage_provider = 'google_drive'
-    else:
-        storage_provider = None
+    storage_provider = data.get('storage_provider')
+    if not storage_provider:
+        if has_dropbox:
+            storage_provider = 'dropbox'
+        elif has_google_drive:
+            storage_provider = 'google_drive'
+        else:
+            storage_provider = None
     
     # Enhancement provider
-    if data.get('enhancement_provider'):
-        enhancement_provider = data['enhancement_provider']
-    elif data.get('fotello_api_key_encrypted'):
-        enhancement_provider = 'fotello'
-    elif data.get('autohdr_api_key_encrypted'):
-        enhancement_provider = 'autohdr'
-    else:
-        enhancement_provider = None
+    enhancement_provider = data.get('enhancement_provider')
+    if not enhancement_provider:
+        if has_fotello:
+            enhancement_provider = 'fotello'
+        elif has_autohdr:
+            enhancement_provider = 'autohdr'
+        else:
+            enhancement_provider = None
     
-    return storage_provider, enhancement_provider
+    return missing, storage_provider, enhancement_provider
 
 
 def _build_process_payload(data: Dict[str, Any], decrypted: Dict[str, Any], 
                           job_id: str, storage_provider: str, 
                           enhancement_provider: str) -> Dict[str, Any]:
-    """Build the payload for the process function"""
+    """
+    Build the payload for the process function.
+    Expects `data` to have passed _classify, so required fields are present.
+    """
+    
+    # Most jobs send no prefix; skip the sanitizer for that common case
+    filename_prefix = data.get('filename_prefix')
     
     payload = {
         # Job identity
         'job_id': job_id,
-        'client_id': data.get('client_id'),
-        'listing_id': data.get('listing_id'),
+        'client_id': data['client_id'],
+        'listing_id': data['listing_id'],
         
         # Providers
         'storage_provider': storage_provider,
         'enhancement_provider': enhancement_provider,
         
         # Job data
-        'brackets_data': data.get('brackets_data', []),
-        'callback_webhook': data.get('callback_webhook'),
+        'brackets_data': data['brackets_data'],
+        'callback_webhook': data['callback_webhook'],
         'notification_level': data.get('notification_level', 'minimal'),
-        'filename_prefix': sanitize_filename_prefix(data.get('filename_prefix', '')),
+        'filename_prefix': sanitize_filename_prefix(filename_prefix) if filename_prefix else '',
         
         # Flags
         'skip_finalize': data.get('skip_finalize', False),
+        'batch_debug_notifications': data.get('batch_debug_notifications', False),
         
         # Version info
         'version': VERSION,
     }
     
-    # Add storage credentials based on provider
+    # Add storage credentials based on provider (assigned directly rather
+    # than via update() so no throwaway dict is built per request)
     if storage_provider == 'dropbox':
-        payload.update({
-            'dropbox_refresh_token': decrypted.get('dropbox_refresh_token'),
-            'dropbox_app_key': decrypted.get('dropbox_app_key'),
-            'dropbox_app_secret': decrypted.get('dropbox_app_secret'),
-            'dropbox_destination_folder': data.get('dropbox_destination_folder'),
-            'dropbox_folder': data.get('dropbox_folder'),
-            'dropbox_team_member_id': data.get('dropbox_team_member_id'),
-            'access_mode': data.get('access_mode', 'member'),
-        })
+        payload['dropbox_refresh_token'] = decrypted.get('dropbox_refresh_token')
+        payload['dropbox_app_key'] = decrypted.get('dropbox_app_key')
+        payload['dropbox_app_secret'] = decrypted.get('dropbox_app_secret')
+        payload['dropbox_destination_folder'] = data.get('dropbox_destination_folder')
+        payload['dropbox_folder'] = data.get('dropbox_folder')
+        payload['dropbox_team_member_id'] = data.get('dropbox_team_member_id')
+        payload['access_mode'] = data.get('access_mode', 'member')
     elif storage_provider == 'google_drive':
-        payload.update({
-            'google_drive_client_id': decrypted.get('google_drive_client_id'),
-            'google_drive_client_secret': decrypted.get('google_drive_client_secret'),
-            'google_drive_refresh_token': decrypted.get('google_drive_refresh_token'),
-            'google_drive_folder_id': data.get('google_drive_folder_id'),
-            'google_drive_destination_folder_id': data.get('google_drive_destination_folder_id'),
-        })
+        payload['google_drive_client_id'] = decrypted.get('google_drive_client_id')
+        payload['google_drive_client_secret'] = decrypted.get('google_drive_client_secret')
+        payload['google_drive_refresh_token'] = decrypted.get('google_drive_refresh_token')
+        payload['google_drive_folder_id'] = data.get('google_drive_folder_id')
+        payload['google_drive_destination_folder_id'] = data.get('google_drive_destination_folder_id')
     
     # Add enhancement credentials based on provider
     if enhancement_provider == 'fotello':
@@ -288,7 +385,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     - Enhancement: Fotello, AutoHDR
     """
     # Generate correlation ID for request tracking
-    correlation_id = str(uuid.uuid4())
+    correlation_id = _new_id()
     
     try:
         print(f"=== SNAPFLOW GATEWAY v{VERSION} === [ID: {correlation_id}]")
@@ -297,46 +394,20 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         data = _parse_event_data(event)
         
         if not data or not isinstance(data, dict):
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'error': 'Invalid data format',
-                    'correlation_id': correlation_id,
-                    'version': VERSION
-                })
-            }
+            return _error_response(400, 'Invalid data format', correlation_id)
 
         # Extract client_id early for error reporting
         client_id = data.get('client_id')
         if not client_id:
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'error': 'client_id is required',
-                    'correlation_id': correlation_id,
-                    'version': VERSION
-                })
-            }
+            return _error_response(400, 'client_id is required', correlation_id)
 
         print(f"Request received for client: {client_id}")
 
-        # Validate required fields
-        missing_fields = _validate_required_fields(data)
+        # Validate required fields and detect providers
+        missing_fields, storage_provider, enhancement_provider = _classify(data)
         if missing_fields:
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'error': f'Missing required fields: {", ".join(missing_fields)}',
-                    'correlation_id': correlation_id,
-                    'version': VERSION
-                })
-            }
-
-        # Detect providers
-        storage_provider, enhancement_provider = _detect_providers(data)
+            return _error_response(400, f'Missing required fields: {", ".join(missing_fields)}', correlation_id)
+
         print(f"Providers detected - Storage: {storage_provider}, Enhancement: {enhancement_provider}")
 
         # Decrypt credentials using SnapFlow Core
@@ -345,46 +416,22 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             print(f"Successfully decrypted credentials for client: {client_id}")
         except Exception as e:
             print(f"Decryption failed for client {client_id}: {e}")
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'error': f'Credential decryption failed: {str(e)}',
-                    'correlation_id': correlation_id,
-                    'version': VERSION
-                })
-            }
+            return _error_response(400, f'Credential decryption failed: {str(e)}', correlation_id)
 
         # Validate decrypted credentials based on provider
         if storage_provider == 'dropbox':
             if not decrypted_data.get('dropbox_app_key') or len(decrypted_data.get('dropbox_app_key', '').strip()) < 10:
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json'},
-                    'body': json.dumps({
-                        'error': 'Invalid decrypted dropbox_app_key format',
-                        'correlation_id': correlation_id,
-                        'version': VERSION
-                    })
-                }
+                return _error_response(400, 'Invalid decrypted dropbox_app_key format', correlation_id)
 
         # Generate job ID
-        job_id = str(uuid.uuid4())
-        listing_id = data.get('listing_id')
-        callback_webhook = data.get('callback_webhook')
+        job_id = _new_id()
+        listing_id = data['listing_id']
+        callback_webhook = data['callback_webhook']
         
         # Get process function URL
         process_url = os.getenv("PROCESS_FUNCTION_URL")
         if not process_url:
-            return {
-                'statusCode': 500,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'error': 'PROCESS_FUNCTION_URL not configured',
-                    'correlation_id': correlation_id,
-                    'version': VERSION
-                })
-            }
+            return _error_response(500, 'PROCESS_FUNCTION_URL not configured', correlation_id)
 
         # Build process payload
         process_payload = _build_process_payload(
@@ -392,33 +439,25 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
 
         # Calculate totals for response
-        brackets_data = data.get('brackets_data', [])
+        brackets_data = data['brackets_data']
         total_brackets = len(brackets_data)
-        total_files = sum(len(bracket) for bracket in brackets_data)
+        total_files = sum(map(len, brackets_data))
 
-        # Start async dispatch to process function
+        # Start async dispatch to process function. The worker owns
+        # process_payload from here on and scrubs it after the POST.
         print(f"Starting async dispatch for job {job_id}")
-        dispatch_thread = threading.Thread(
-            target=_dispatch_async,
-            args=(
-                process_url, 
-                process_payload.copy(), 
-                callback_webhook,
-                job_id, 
-                listing_id, 
-                client_id, 
-                correlation_id
-            )
+        dispatch_ctx = DispatchCtx(
+            process_url=process_url,
+            callback_webhook=callback_webhook,
+            job_id=job_id,
+            listing_id=listing_id,
+            client_id=client_id,
+            correlation_id=correlation_id
         )
-        dispatch_thread.daemon = True
-        dispatch_thread.start()
+        _DISPATCH_POOL.submit(_dispatch_async, dispatch_ctx, process_payload)
 
         # Clear sensitive data before logging
-        for field in ['dropbox_app_key', 'dropbox_app_secret', 'dropbox_refresh_token',
-                      'fotello_api_key', 'autohdr_api_key', 'google_drive_client_secret',
-                      'google_drive_refresh_token']:
-            decrypted_data.pop(field, None)
-            process_payload.pop(field, None)
+        _scrub(decrypted_data)
 
         # Immediate response to Make.com
         success_response = {
@@ -431,7 +470,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'total_brackets': total_brackets,
             'total_files': total_files,
             'skip_finalize': data.get('skip_finalize', False),
-            'received_at': datetime.utcnow().isoformat() + "Z",
+            'received_at': time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             'version': VERSION,
             'correlation_id': correlation_id
         }
@@ -440,8 +479,8 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         return {
             'statusCode': 202,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps(success_response)
+            'headers': _JSON_HEADERS,
+            'body': _json_dumps(success_response)
         }
 
     except Exception as e:
@@ -450,12 +489,4 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         import traceback
         print(f"Traceback: {traceback.format_exc()}")
 
-        return {
-            'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
-                'error': error_msg,
-                'version': VERSION,
-                'correlation_id': correlation_id
-            })
-        }
+        return _error_response(500, error_msg, correlation_id)
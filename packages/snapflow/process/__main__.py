@@ -8,11 +8,16 @@ Version: 1.0.0-snapflow
 
 import json
 import os
-import requests
 import uuid
 import time
 import gc
-from typing import Dict, Any, List
+import hashlib
+import tempfile
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from dataclasses import asdict, dataclass
+from typing import BinaryIO, ClassVar, Dict, Any, Iterator, List, Optional, Tuple, Union
 
 # Import from SnapFlow Core shared library
 from shared import (
@@ -27,24 +32,387 @@ from shared import (
     NotificationLevel,
     # Utils
     validate_file_size,
-    get_file_type_info,
     get_memory_info,
     force_garbage_collection,
+    get_http_session,
 )
 
+# orjson is used when available (C-level serialization of the response and
+# finalize payloads); the stdlib fallback keeps the same call signatures
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    _json_bytes = orjson.dumps
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+    
+    def _json_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 # Function version
 VERSION = f"1.0.0-process-snapflow-{SHARED_VERSION}"
 
+# Concurrent downloads per bracket. Dropbox (requests-based) is safe to
+# share across threads; Google Drive's httplib2 transport is not, so it
+# downloads one file at a time.
+DOWNLOAD_WORKERS_BY_PROVIDER = {
+    'dropbox': 8,
+}
+
+# Connected storage providers reused across warm invocations, keyed by a
+# digest of their credentials. Entries expire well before Dropbox's
+# short-lived access tokens (4h) do.
+STORAGE_CACHE_SIZE = 32
+STORAGE_CACHE_TTL_SECONDS = 3600
+_storage_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+# Raise the young-generation threshold so allocation-heavy transfers don't
+# keep triggering collections (and with them, frequent gen-2 passes)
+gc.set_threshold(100_000, 50, 10)
+
+# Brackets processed at once. Google Drive shares one non-thread-safe
+# client across brackets, so it stays sequential.
+BRACKET_WORKERS_BY_PROVIDER = {
+    'dropbox': 3,
+}
+
+# Downloaded files are held in memory up to this size, then spill to
+# /tmp, so large RAWs in flight don't each hold a full in-memory copy
+DOWNLOAD_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# One pooled HTTP session for providers and the finalize call, so every
+# bracket in a job (and warm invocations after it) reuse TLS connections
+_HTTP = get_http_session()
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Runs the finalize call so the completion notification can be sent while
+# it is in flight; main() joins it before returning
+_FINALIZE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="finalize")
+
+
+def _json_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a JSON response for the web action"""
+    return {
+        'statusCode': status_code,
+        'headers': _JSON_HEADERS,
+        'body': _json_dumps(body),
+    }
+
+
+def _job_failed(status_code: int, error: str, correlation_id: str, **extra) -> Dict[str, Any]:
+    """Build the job_failed response; extra fields go between error and correlation_id"""
+    return _json_response(status_code, {
+        'status': 'job_failed',
+        'error': error,
+        **extra,
+        'correlation_id': correlation_id,
+    })
+
+
+_NOTIFICATION_LEVELS = {
+    'errors_only': NotificationLevel.ERRORS_ONLY,
+    'minimal': NotificationLevel.MINIMAL,
+    'standard': NotificationLevel.STANDARD,
+    'verbose': NotificationLevel.VERBOSE,
+}
+
 
 def _parse_notification_level(level_str: str) -> NotificationLevel:
     """Convert string to NotificationLevel enum"""
-    mapping = {
-        'errors_only': NotificationLevel.ERRORS_ONLY,
-        'minimal': NotificationLevel.MINIMAL,
-        'standard': NotificationLevel.STANDARD,
-        'verbose': NotificationLevel.VERBOSE,
+    return _NOTIFICATION_LEVELS.get(level_str, NotificationLevel.MINIMAL)
+
+
+@dataclass(slots=True, frozen=True)
+class DropboxCreds:
+    """Dropbox connection credentials read once from the process event"""
+    refresh_token: Optional[str]
+    app_key: Optional[str]
+    app_secret: Optional[str]
+    member_id: Optional[str]
+    
+    # Field name -> event/finalize payload key
+    EVENT_KEYS: ClassVar[Dict[str, str]] = {
+        'refresh_token': 'dropbox_refresh_token',
+        'app_key': 'dropbox_app_key',
+        'app_secret': 'dropbox_app_secret',
+        'member_id': 'dropbox_team_member_id',
+    }
+
+
+@dataclass(slots=True, frozen=True)
+class GoogleDriveCreds:
+    """Google Drive connection credentials read once from the process event"""
+    client_id: Optional[str]
+    client_secret: Optional[str]
+    refresh_token: Optional[str]
+    
+    EVENT_KEYS: ClassVar[Dict[str, str]] = {
+        'client_id': 'google_drive_client_id',
+        'client_secret': 'google_drive_client_secret',
+        'refresh_token': 'google_drive_refresh_token',
+    }
+
+
+_STORAGE_CREDS_BY_PROVIDER = {
+    'dropbox': DropboxCreds,
+    'google_drive': GoogleDriveCreds,
+}
+
+
+def _extract_storage_creds(storage_provider: str, event_data: Dict[str, Any]):
+    """Read the selected storage provider's credentials from the event"""
+    creds_class = _STORAGE_CREDS_BY_PROVIDER.get(storage_provider)
+    if creds_class is None:
+        raise ValueError(f"Unknown storage provider: {storage_provider}")
+    return creds_class(**{
+        field: event_data.get(key) for field, key in creds_class.EVENT_KEYS.items()
+    })
+
+
+def _storage_creds_event_fields(storage_creds) -> Dict[str, Any]:
+    """Credentials keyed as the event carries them, for forwarding to finalize"""
+    return {
+        key: getattr(storage_creds, field)
+        for field, key in storage_creds.EVENT_KEYS.items()
+    }
+
+
+def _storage_cache_key(storage_provider: str, credentials: Dict[str, Any]) -> str:
+    """Digest identifying a provider/credentials pair without keeping the secrets as a key"""
+    digest = hashlib.sha256(storage_provider.encode('utf-8'))
+    for name in sorted(credentials):
+        digest.update(f"\0{name}\0{credentials[name] or ''}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _get_cached_storage(cache_key: str):
+    """Connected storage provider from a previous invocation, or None if absent/expired"""
+    entry = _storage_cache.get(cache_key)
+    if entry is None:
+        return None
+    created_at, storage = entry
+    if time.monotonic() - created_at > STORAGE_CACHE_TTL_SECONDS:
+        del _storage_cache[cache_key]
+        return None
+    _storage_cache.move_to_end(cache_key)
+    return storage
+
+
+def _cache_storage(cache_key: str, storage):
+    """Remember a connected storage provider, evicting the least recently used"""
+    _storage_cache[cache_key] = (time.monotonic(), storage)
+    _storage_cache.move_to_end(cache_key)
+    while len(_storage_cache) > STORAGE_CACHE_SIZE:
+        _storage_cache.popitem(last=False)
+
+
+def _download_bracket_file(storage, file_info: Dict[str, Any]) -> Optional[Tuple[str, Union[bytes, BinaryIO]]]:
+    """
+    Download and validate a single bracket file.
+    
+    Chunks are kept in memory until the file grows past
+    DOWNLOAD_SPOOL_MAX_BYTES, then spill to a temporary file. Small files
+    are returned as bytes joined once from the chunks (a single-chunk
+    download is returned without copying); larger ones as the on-disk
+    file object, which the caller uploads from and must close.
+    
+    Returns:
+        Tuple of (filename, data), or None if the file was skipped
+    """
+    # Support both Dropbox (path_lower) and Google Drive (id) formats
+    file_path = file_info.get('path_lower') or file_info.get('id') or file_info.get('path_id')
+    original_filename = file_info.get('name')
+    
+    if not file_path or not original_filename:
+        print(f"Skipping file due to missing path or name: {file_info}")
+        return None
+
+    chunks: List[bytes] = []
+    spill = None
+    try:
+        # Stream file from storage
+        file_size = 0
+        for chunk in storage.download_stream(file_path):
+            file_size += len(chunk)
+            if spill is None and file_size > DOWNLOAD_SPOOL_MAX_BYTES:
+                spill = tempfile.TemporaryFile()
+                spill.writelines(chunks)
+                chunks.clear()
+            if spill is None:
+                chunks.append(chunk)
+            else:
+                spill.write(chunk)
+        
+        # Validate file size
+        is_valid, error_msg = validate_file_size(original_filename, file_size)
+        if not is_valid:
+            print(f"File {original_filename} failed validation: {error_msg}")
+            if spill is not None:
+                spill.close()
+            return None
+
+        if spill is None:
+            data = b''.join(chunks)
+        else:
+            spill.seek(0)
+            data = spill
+        
+        return original_filename, data
+        
+    except Exception as e:
+        print(f"Failed to download {original_filename}: {e}")
+        if spill is not None:
+            spill.close()
+        return None
+
+
+def _iter_bracket_downloads(storage, bracket: List[Dict[str, Any]],
+                            max_workers: int = 1) -> Iterator[Tuple[str, Union[bytes, BinaryIO]]]:
+    """
+    Yield a bracket's downloaded (filename, data) pairs in bracket order
+    as they become ready.
+    
+    With max_workers > 1, up to max_workers downloads run ahead of the
+    consumer, so uploading one file overlaps downloading the next ones
+    while at most max_workers files are held in memory. Skipped files are
+    not yielded.
+    """
+    if max_workers <= 1 or len(bracket) <= 1:
+        for file_info in bracket:
+            prepared = _download_bracket_file(storage, file_info)
+            if prepared is not None:
+                yield prepared
+        return
+    
+    remaining = iter(bracket)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(bracket))) as executor:
+        in_flight = deque(
+            executor.submit(_download_bracket_file, storage, file_info)
+            for file_info in islice(remaining, max_workers)
+        )
+        while in_flight:
+            prepared = in_flight.popleft().result()
+            next_file = next(remaining, None)
+            if next_file is not None:
+                in_flight.append(executor.submit(_download_bracket_file, storage, next_file))
+            if prepared is not None:
+                yield prepared
+
+
+def _post_finalize(finalize_url: str, finalize_payload: Dict[str, Any]):
+    """POST the finalize payload (runs on _FINALIZE_POOL)"""
+    return _HTTP.post(
+        finalize_url,
+        data=_json_bytes(finalize_payload),
+        headers=_JSON_HEADERS,
+        timeout=90,
+    )
+
+
+def _close_file_data(data: Union[bytes, BinaryIO]):
+    """Close a downloaded file's data if it is a temporary file"""
+    if hasattr(data, 'close'):
+        data.close()
+
+
+def _upload_bracket(storage, enhancement, bracket: List[Dict[str, Any]],
+                    download_workers: int = 1) -> Tuple[int, List[str]]:
+    """
+    Download a bracket's files and upload them to the enhancement provider.
+    
+    Providers with supports_batch_upload receive the whole bracket in one
+    upload_images() call once every file has downloaded. Otherwise the
+    transfer is pipelined: each file is uploaded as soon as it is
+    downloaded, while the next downloads continue in the background.
+    
+    Returns:
+        Tuple of (files_downloaded, upload_ids)
+    """
+    downloads = _iter_bracket_downloads(storage, bracket, download_workers)
+    
+    if enhancement.supports_batch_upload:
+        bracket_files = list(downloads)
+        files_downloaded = len(bracket_files)
+        if not bracket_files:
+            return 0, []
+        try:
+            upload_ids = enhancement.upload_images(bracket_files)
+        finally:
+            for _, data in bracket_files:
+                _close_file_data(data)
+            bracket_files.clear()
+        return files_downloaded, upload_ids
+    
+    upload_ids = []
+    files_downloaded = 0
+    for filename, data in downloads:
+        files_downloaded += 1
+        try:
+            upload_ids.append(enhancement.upload_image(filename, data))
+        except Exception as e:
+            print(f"Failed to upload {filename}: {e}")
+        
+        # Release file data immediately
+        _close_file_data(data)
+        data = None
+    
+    return files_downloaded, upload_ids
+
+
+def _process_bracket(storage, enhancement, notifier, bracket_idx: int,
+                     bracket: List[Dict[str, Any]], total_brackets_count: int,
+                     listing_id: str, download_workers: int = 1) -> Dict[str, Any]:
+    """
+    Download, upload and request enhancement for one bracket.
+    
+    Runs on the bracket pool, so it only reports what happened; main()
+    does the counting and result notifications in bracket order.
+    
+    Returns:
+        Dict with files_downloaded, upload_ids, enhancement_id and error
+    """
+    current_bracket_num = bracket_idx + 1
+    outcome = {
+        'files_downloaded': 0,
+        'upload_ids': [],
+        'enhancement_id': None,
+        'error': None,
     }
-    return mapping.get(level_str, NotificationLevel.MINIMAL)
+    
+    # Log memory and progress
+    memory_info = get_memory_info()
+    notifier.send_debug_buffered('processing_bracket_started', {
+        'bracket_index': bracket_idx,
+        'bracket_progress': f"{current_bracket_num} of {total_brackets_count}",
+        'file_count': len(bracket),
+        **memory_info
+    })
+    
+    print(f"Processing bracket {current_bracket_num}/{total_brackets_count} ({len(bracket)} files)")
+    
+    try:
+        files_downloaded, upload_ids = _upload_bracket(
+            storage, enhancement, bracket, download_workers
+        )
+        outcome['files_downloaded'] = files_downloaded
+        outcome['upload_ids'] = upload_ids
+        
+        if upload_ids:
+            # Request enhancement
+            outcome['enhancement_id'] = enhancement.request_enhancement(
+                upload_ids=upload_ids,
+                listing_id=listing_id
+            )
+    
+    except Exception as e:
+        outcome['error'] = str(e)
+    
+    return outcome
 
 
 def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -78,20 +446,12 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             event_data = event
         elif 'body' in event and event['body']:
             body = event.get('body')
-            if isinstance(body, str):
-                event_data = json.loads(body)
+            if isinstance(body, (str, bytes)):
+                event_data = _json_loads(body)
             else:
                 event_data = body
         else:
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'status': 'job_failed',
-                    'error': 'No valid data found in event',
-                    'correlation_id': correlation_id
-                })
-            }
+            return _job_failed(400, 'No valid data found in event', correlation_id)
 
         # Extract common fields
         job_id = event_data.get('job_id', str(uuid.uuid4()))
@@ -111,6 +471,17 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         print(f"Providers - Storage: {storage_provider}, Enhancement: {enhancement_provider}")
         print(f"skip_finalize: {skip_finalize}")
         
+        # Validate before building the notifier so malformed events fail
+        # fast with no webhook traffic
+        required_fields = ['listing_id', 'callback_webhook']
+        missing = [f for f in required_fields if not event_data.get(f)]
+        if missing:
+            error_msg = f"Missing required fields: {', '.join(missing)}"
+            return _job_failed(400, error_msg, correlation_id)
+
+        if not brackets_data:
+            return _job_failed(400, 'No brackets_data found in payload', correlation_id)
+
         # Create notifier
         notifier = WebhookNotifier(
             callback_webhook=callback_webhook,
@@ -120,69 +491,43 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             correlation_id=correlation_id,
             notification_level=notification_level,
             function_name='process',
-            version=VERSION
+            version=VERSION,
+            batch_debug=bool(event_data.get('batch_debug_notifications', False))
         )
         
         # Send process started notification
-        notifier.send_debug('process_started', {
+        notifier.send_debug_buffered('process_started', {
             'storage_provider': storage_provider,
             'enhancement_provider': enhancement_provider,
             'brackets_count': len(brackets_data),
             'skip_finalize': skip_finalize
         })
 
-        # Validate required fields
-        required_fields = ['listing_id', 'callback_webhook']
-        missing = [f for f in required_fields if not event_data.get(f)]
-        if missing:
-            error_msg = f"Missing required fields: {', '.join(missing)}"
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'status': 'job_failed',
-                    'error': error_msg,
-                    'correlation_id': correlation_id
-                })
-            }
-
-        if not brackets_data:
-            return {
-                'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'status': 'job_failed',
-                    'error': 'No brackets_data found in payload',
-                    'correlation_id': correlation_id
-                })
-            }
-
         # =====================================================================
         # CREATE STORAGE PROVIDER
         # =====================================================================
-        notifier.send_debug('storage_connecting', {'provider': storage_provider})
+        notifier.send_debug_buffered('storage_connecting', {'provider': storage_provider})
         
         try:
-            if storage_provider == 'dropbox':
-                storage_credentials = {
-                    'refresh_token': event_data.get('dropbox_refresh_token'),
-                    'app_key': event_data.get('dropbox_app_key'),
-                    'app_secret': event_data.get('dropbox_app_secret'),
-                    'member_id': event_data.get('dropbox_team_member_id'),
-                }
-            elif storage_provider == 'google_drive':
-                storage_credentials = {
-                    'client_id': event_data.get('google_drive_client_id'),
-                    'client_secret': event_data.get('google_drive_client_secret'),
-                    'refresh_token': event_data.get('google_drive_refresh_token'),
-                }
-            else:
-                raise ValueError(f"Unknown storage provider: {storage_provider}")
+            storage_creds = _extract_storage_creds(storage_provider, event_data)
+            storage_credentials = asdict(storage_creds)
+            
+            # Reuse a connection from a previous warm invocation when the
+            # same credentials come back. get_user_info() only returns what
+            # connect() fetched, so a stale cached client shows up as failed
+            # downloads instead (see CHECK RESULTS)
+            cache_key = _storage_cache_key(storage_provider, storage_credentials)
+            storage = _get_cached_storage(cache_key)
+            storage_from_cache = storage is not None
+            if storage is None:
+                storage = StorageFactory.create(
+                    storage_provider, storage_credentials, session=_HTTP
+                )
+                _cache_storage(cache_key, storage)
             
-            storage = StorageFactory.create(storage_provider, storage_credentials)
             user_info = storage.get_user_info()
             
-            notifier.send_debug('storage_connected', {
+            notifier.send_debug_buffered('storage_connected', {
                 'provider': storage_provider,
                 'user': user_info.get('display_name') or user_info.get('email')
             })
@@ -190,155 +535,91 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         except Exception as e:
             error_msg = f"Storage connection failed: {str(e)}"
             notifier.send_error('storage_connection_failed', error_msg)
-            return {
-                'statusCode': 500,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'status': 'job_failed',
-                    'error': error_msg,
-                    'correlation_id': correlation_id
-                })
-            }
+            return _job_failed(500, error_msg, correlation_id)
 
         # =====================================================================
         # CREATE ENHANCEMENT PROVIDER
         # =====================================================================
-        notifier.send_debug('enhancement_connecting', {'provider': enhancement_provider})
+        notifier.send_debug_buffered('enhancement_connecting', {'provider': enhancement_provider})
         
         try:
             if enhancement_provider == 'fotello':
                 enhancement = EnhancementFactory.create(
                     'fotello', 
-                    event_data.get('fotello_api_key')
+                    event_data.get('fotello_api_key'),
+                    session=_HTTP
                 )
             elif enhancement_provider == 'autohdr':
                 enhancement = EnhancementFactory.create(
                     'autohdr',
                     event_data.get('autohdr_api_key'),
-                    email=event_data.get('autohdr_email')
+                    email=event_data.get('autohdr_email'),
+                    session=_HTTP
                 )
             else:
                 raise ValueError(f"Unknown enhancement provider: {enhancement_provider}")
             
-            notifier.send_debug('enhancement_connected', {'provider': enhancement_provider})
+            notifier.send_debug_buffered('enhancement_connected', {'provider': enhancement_provider})
             
         except Exception as e:
             error_msg = f"Enhancement provider connection failed: {str(e)}"
             notifier.send_error('enhancement_connection_failed', error_msg)
-            return {
-                'statusCode': 500,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'status': 'job_failed',
-                    'error': error_msg,
-                    'correlation_id': correlation_id
-                })
-            }
+            return _job_failed(500, error_msg, correlation_id)
 
         # =====================================================================
         # PROCESS BRACKETS
         # =====================================================================
-        notifier.send_debug('bracket_processing_started', {'total_brackets': len(brackets_data)})
+        notifier.send_debug_buffered('bracket_processing_started', {'total_brackets': len(brackets_data)})
         
         enhancement_ids = []
         total_brackets_count = len(brackets_data)
+        download_workers = DOWNLOAD_WORKERS_BY_PROVIDER.get(storage_provider, 1)
+        bracket_workers = BRACKET_WORKERS_BY_PROVIDER.get(storage_provider, 1)
         
-        for bracket_idx, bracket in enumerate(brackets_data):
-            current_bracket_num = bracket_idx + 1
-            
-            # Log memory and progress
-            memory_info = get_memory_info()
-            notifier.send_debug('processing_bracket_started', {
-                'bracket_index': bracket_idx,
-                'bracket_progress': f"{current_bracket_num} of {total_brackets_count}",
-                'file_count': len(bracket),
-                **memory_info
-            })
-            
-            print(f"Processing bracket {current_bracket_num}/{total_brackets_count} ({len(bracket)} files)")
-            
-            # Download and prepare files for this bracket
-            bracket_files = []
-            for file_info in bracket:
-                # Support both Dropbox (path_lower) and Google Drive (id) formats
-                file_path = file_info.get('path_lower') or file_info.get('id') or file_info.get('path_id')
-                original_filename = file_info.get('name')
+        def run_bracket(indexed_bracket):
+            bracket_idx, bracket = indexed_bracket
+            return _process_bracket(
+                storage, enhancement, notifier, bracket_idx, bracket,
+                total_brackets_count, listing_id, download_workers
+            )
+        
+        # Brackets run concurrently; outcomes are reduced here in bracket
+        # order so counters and result notifications stay sequential
+        with ThreadPoolExecutor(max_workers=bracket_workers) as executor:
+            for bracket_idx, outcome in enumerate(executor.map(run_bracket, enumerate(brackets_data))):
+                current_bracket_num = bracket_idx + 1
+                files_processed += outcome['files_downloaded']
+                upload_ids = outcome['upload_ids']
+                files_uploaded += len(upload_ids)
                 
-                if not file_path or not original_filename:
-                    print(f"Skipping file due to missing path or name: {file_info}")
-                    continue
-
-                try:
-                    # Download file from storage
-                    file_bytes = storage.download_file(file_path)
-                    
-                    # Validate file size
-                    is_valid, error_msg = validate_file_size(original_filename, len(file_bytes))
-                    if not is_valid:
-                        print(f"File {original_filename} failed validation: {error_msg}")
-                        continue
-
-                    bracket_files.append({
-                        'name': original_filename,
-                        'bytes': file_bytes,
-                        'file_type': get_file_type_info(original_filename)[0]
+                # Young-generation sweep after each bracket; file buffers are
+                # freed by refcounting, so a full collection buys nothing here
+                gc.collect(1)
+                
+                if outcome['error']:
+                    print(f"Failed to process bracket {current_bracket_num}: {outcome['error']}")
+                    notifier.send_error('bracket_processing_error', outcome['error'], {
+                        'bracket_index': bracket_idx
                     })
-                    
-                    files_processed += 1
-                    
-                except Exception as e:
-                    print(f"Failed to download {original_filename}: {e}")
                     continue
-            
-            if not bracket_files:
-                print(f"No valid files in bracket {current_bracket_num}, skipping")
-                notifier.send_debug('bracket_skipped_no_files', {
-                    'bracket_index': bracket_idx,
-                    'reason': 'no_valid_files'
-                })
-                continue
-            
-            # Upload bracket to enhancement provider
-            try:
-                print(f"Uploading bracket {current_bracket_num} ({len(bracket_files)} files)")
                 
-                # Upload each file and collect upload IDs
-                upload_ids = []
-                for file_info in bracket_files:
-                    try:
-                        upload_id = enhancement.upload_image(
-                            file_info['name'],
-                            file_info['bytes']
-                        )
-                        upload_ids.append(upload_id)
-                        files_uploaded += 1
-                        
-                        # Clear file bytes immediately
-                        file_info['bytes'] = None
-                        
-                    except Exception as e:
-                        print(f"Failed to upload {file_info['name']}: {e}")
-                        file_info['bytes'] = None
-                        continue
-                
-                # Force garbage collection after large uploads
-                bracket_files.clear()
-                force_garbage_collection()
+                if not outcome['files_downloaded']:
+                    print(f"No valid files in bracket {current_bracket_num}, skipping")
+                    notifier.send_debug_buffered('bracket_skipped_no_files', {
+                        'bracket_index': bracket_idx,
+                        'reason': 'no_valid_files'
+                    })
+                    continue
                 
                 if not upload_ids:
                     print(f"No files uploaded for bracket {current_bracket_num}")
-                    notifier.send_debug('bracket_upload_failed', {
+                    notifier.send_debug_buffered('bracket_upload_failed', {
                         'bracket_index': bracket_idx,
                         'reason': 'no_successful_uploads'
                     })
                     continue
                 
-                # Request enhancement
-                enhancement_id = enhancement.request_enhancement(
-                    upload_ids=upload_ids,
-                    listing_id=listing_id
-                )
-                
+                enhancement_id = outcome['enhancement_id']
                 enhancement_ids.append({
                     'enhancement_id': enhancement_id,
                     'bracket_index': bracket_idx,
@@ -347,7 +628,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 
                 brackets_processed += 1
                 
-                notifier.send_debug('enhancement_request_success', {
+                notifier.send_debug_buffered('enhancement_request_success', {
                     'bracket_index': bracket_idx,
                     'bracket_progress': f"{current_bracket_num} of {total_brackets_count}",
                     'enhancement_id': enhancement_id,
@@ -355,17 +636,16 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 })
                 
                 print(f"Bracket {current_bracket_num} enhancement requested: {enhancement_id}")
-                
-            except Exception as e:
-                print(f"Failed to process bracket {current_bracket_num}: {e}")
-                notifier.send_error('bracket_processing_error', str(e), {
-                    'bracket_index': bracket_idx
-                })
-                continue
 
         # =====================================================================
         # CHECK RESULTS
         # =====================================================================
+        if storage_from_cache and not files_processed:
+            # Nothing downloaded through a reused connection: drop it so the
+            # next invocation reconnects with a fresh token
+            print("No files downloaded with cached storage connection, evicting it")
+            _storage_cache.pop(cache_key, None)
+        
         if not enhancement_ids:
             raise Exception("No brackets were successfully processed")
 
@@ -376,7 +656,7 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             # Return enhancement IDs for later retrieval
             print(f"skip_finalize=True: Returning {len(enhancement_ids)} enhancement IDs")
             
-            notifier.send_debug('finalize_skipped', {
+            notifier.send_debug_buffered('finalize_skipped', {
                 'enhancement_ids_count': len(enhancement_ids),
                 'reason': 'skip_finalize=true'
             })
@@ -393,33 +673,30 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 retry_attempts=0
             )
             
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({
-                    'status': 'enhancement_requested',
-                    'job_id': job_id,
-                    'listing_id': listing_id,
-                    'skip_finalize': True,
-                    'enhancement_ids': enhancement_ids,
-                    'files_processed': files_processed,
-                    'files_uploaded': files_uploaded,
-                    'brackets_processed': brackets_processed,
-                    'message': f'Enhancement requested for {brackets_processed} brackets. Call finalize later with enhancement_ids.',
-                    'version': VERSION,
-                    'correlation_id': correlation_id
-                })
-            }
+            return _json_response(200, {
+                'status': 'enhancement_requested',
+                'job_id': job_id,
+                'listing_id': listing_id,
+                'skip_finalize': True,
+                'enhancement_ids': enhancement_ids,
+                'files_processed': files_processed,
+                'files_uploaded': files_uploaded,
+                'brackets_processed': brackets_processed,
+                'message': f'Enhancement requested for {brackets_processed} brackets. Call finalize later with enhancement_ids.',
+                'version': VERSION,
+                'correlation_id': correlation_id
+            })
         
         # Call finalize function
-        notifier.send_debug('finalize_call_attempt', {
+        notifier.send_debug_buffered('finalize_call_attempt', {
             'enhancement_ids_count': len(enhancement_ids)
         })
         
+        finalize_future = None
         finalize_url = os.getenv("FINALIZE_FUNCTION_URL")
         if not finalize_url:
             print("FINALIZE_FUNCTION_URL not set, skipping finalize call")
-            notifier.send_debug('finalize_url_missing', {})
+            notifier.send_debug_buffered('finalize_url_missing', {})
         else:
             # Build finalize payload
             finalize_payload = {
@@ -438,23 +715,14 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'storage_provider': storage_provider,
             }
             
-            # Add storage credentials based on provider
+            # Add storage credentials (already read for the connection) and
+            # the provider's destination settings
+            finalize_payload.update(_storage_creds_event_fields(storage_creds))
             if storage_provider == 'dropbox':
-                finalize_payload.update({
-                    'dropbox_refresh_token': event_data.get('dropbox_refresh_token'),
-                    'dropbox_app_key': event_data.get('dropbox_app_key'),
-                    'dropbox_app_secret': event_data.get('dropbox_app_secret'),
-                    'dropbox_destination_folder': event_data.get('dropbox_destination_folder'),
-                    'dropbox_team_member_id': event_data.get('dropbox_team_member_id'),
-                    'access_mode': event_data.get('access_mode', 'member'),
-                })
+                finalize_payload['dropbox_destination_folder'] = event_data.get('dropbox_destination_folder')
+                finalize_payload['access_mode'] = event_data.get('access_mode', 'member')
             elif storage_provider == 'google_drive':
-                finalize_payload.update({
-                    'google_drive_client_id': event_data.get('google_drive_client_id'),
-                    'google_drive_client_secret': event_data.get('google_drive_client_secret'),
-                    'google_drive_refresh_token': event_data.get('google_drive_refresh_token'),
-                    'google_drive_destination_folder_id': event_data.get('google_drive_destination_folder_id'),
-                })
+                finalize_payload['google_drive_destination_folder_id'] = event_data.get('google_drive_destination_folder_id')
             
             # Add enhancement credentials
             if enhancement_provider == 'fotello':
@@ -465,20 +733,26 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             
             finalize_payload['enhancement_provider'] = enhancement_provider
             
+            print("Calling finalize function...")
+            finalize_future = _FINALIZE_POOL.submit(_post_finalize, finalize_url, finalize_payload)
+
+        # Process completed (sent while the finalize call is in flight)
+        notifier.send_debug_buffered('process_completed_success', {
+            'brackets_processed': brackets_processed,
+            'enhancement_requests': len(enhancement_ids),
+            'files_processed': files_processed,
+            'files_uploaded': files_uploaded
+        })
+
+        if finalize_future is not None:
             try:
-                print("Calling finalize function...")
-                finalize_response = requests.post(
-                    finalize_url,
-                    json=finalize_payload,
-                    timeout=90,
-                    headers={'Content-Type': 'application/json'}
-                )
+                finalize_response = finalize_future.result()
                 print(f"Finalize response: {finalize_response.status_code}")
                 
                 if finalize_response.status_code >= 400:
                     notifier.send_error('finalize_call_failed', finalize_response.text)
                 else:
-                    notifier.send_debug('finalize_called_successfully', {
+                    notifier.send_debug_buffered('finalize_called_successfully', {
                         'status_code': finalize_response.status_code
                     })
                     
@@ -486,53 +760,43 @@ def main(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 print(f"Failed to call finalize: {e}")
                 notifier.send_error('finalize_call_exception', str(e))
 
-        # Process completed
-        notifier.send_debug('process_completed_success', {
+        return _json_response(200, {
+            'status': 'enhancement_requested',
+            'job_id': job_id,
+            'listing_id': listing_id,
+            'files_processed': files_processed,
+            'files_uploaded': files_uploaded,
             'brackets_processed': brackets_processed,
             'enhancement_requests': len(enhancement_ids),
-            'files_processed': files_processed,
-            'files_uploaded': files_uploaded
+            'message': f'Successfully processed {brackets_processed} brackets. Finalize monitoring started.',
+            'version': VERSION,
+            'correlation_id': correlation_id
         })
 
-        return {
-            'statusCode': 200,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
-                'status': 'enhancement_requested',
-                'job_id': job_id,
-                'listing_id': listing_id,
-                'files_processed': files_processed,
-                'files_uploaded': files_uploaded,
-                'brackets_processed': brackets_processed,
-                'enhancement_requests': len(enhancement_ids),
-                'message': f'Successfully processed {brackets_processed} brackets. Finalize monitoring started.',
-                'version': VERSION,
-                'correlation_id': correlation_id
-            })
-        }
-
     except Exception as e:
         error_msg = str(e)
         print(f"Process function failed: {error_msg}")
         import traceback
         print(f"Traceback: {traceback.format_exc()}")
         
+        # Defensive full collection before reporting the failure
+        force_garbage_collection()
+        
         # Send error notification
         if notifier:
             notifier.send_error('job_failed', error_msg)
 
-        return {
-            'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({
-                'status': 'job_failed',
-                'job_id': job_id,
-                'listing_id': listing_id,
-                'error': error_msg,
-                'files_processed': files_processed,
-                'files_uploaded': files_uploaded,
-                'brackets_processed': brackets_processed,
-                'version': VERSION,
-                'correlation_id': correlation_id
-            })
-        }
+        return _job_failed(
+            500, error_msg, correlation_id,
+            job_id=job_id,
+            listing_id=listing_id,
+            files_processed=files_processed,
+            files_uploaded=files_uploaded,
+            brackets_processed=brackets_processed,
+            version=VERSION,
+        )
+
+    finally:
+        # Deliver any progress events still queued for the batched webhook
+        if notifier:
+            notifier.flush()
@@ -4,10 +4,14 @@ Pytest Configuration and Fixtures
 Loads test credentials from environment and provides reusable fixtures.
 """
 
+import json
+import logging
 import os
 import sys
+import time
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
 # Add lib/shared to path for imports
@@ -22,6 +26,8 @@ else:
     # Try loading from CI environment
     load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # CREDENTIAL FIXTURES
@@ -111,6 +117,23 @@ def encryption_key():
     return key
 
 
+@pytest.fixture(scope="session")
+def fernet(encryption_key):
+    """Fernet instance for encryption_key, built once per session."""
+    from cryptography.fernet import Fernet
+    
+    return Fernet(encryption_key.encode())
+
+
+@pytest.fixture(scope="session")
+def encrypted_dropbox_payload(fernet, dropbox_credentials):
+    """Legacy-format gateway payload with Fernet-encrypted Dropbox credentials."""
+    payload = {"client_id": "E2E"}
+    for field, value in dropbox_credentials.items():
+        payload[f"dropbox_{field}_encrypted"] = fernet.encrypt(value.encode()).decode()
+    return payload
+
+
 @pytest.fixture(scope="session")
 def test_client_id():
     """Test client ID."""
@@ -120,8 +143,11 @@ def test_client_id():
 # =============================================================================
 # PROVIDER FIXTURES
 # =============================================================================
+# Session-scoped so each provider authenticates once per test run. Tests that
+# upload files register them with cleanup_paths, so sharing the instances is
+# safe.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dropbox_provider(dropbox_credentials):
     """Configured Dropbox storage provider."""
     from shared.providers import StorageFactory
@@ -130,7 +156,7 @@ def dropbox_provider(dropbox_credentials):
     return provider
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def google_drive_provider(google_drive_credentials):
     """Configured Google Drive storage provider."""
     from shared.providers import StorageFactory
@@ -139,24 +165,276 @@ def google_drive_provider(google_drive_credentials):
     return provider
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fotello_provider(fotello_credentials):
     """Configured Fotello enhancement provider."""
     from shared.providers import EnhancementFactory
     
-    provider = EnhancementFactory.create("fotello", fotello_credentials)
+    provider = EnhancementFactory.create("fotello", fotello_credentials["api_key"])
     return provider
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def autohdr_provider(autohdr_credentials):
     """Configured AutoHDR enhancement provider."""
     from shared.providers import EnhancementFactory
     
-    provider = EnhancementFactory.create("autohdr", autohdr_credentials)
+    provider = EnhancementFactory.create(
+        "autohdr",
+        autohdr_credentials["api_key"],
+        email=autohdr_credentials["email"],
+    )
     return provider
 
 
+@pytest.fixture(scope="session")
+def autohdr_open_photoshoot(autohdr_provider, sample_image_bytes):
+    """
+    One unfinalized AutoHDR photoshoot shared by the photoshoot tests.
+    
+    Creating a photoshoot allocates server-side objects and presigned URLs,
+    so the create and finalize tests share one instead of each making its
+    own. Returns (unique_identifier, upload_batch result).
+    """
+    import uuid
+    
+    unique_id = str(uuid.uuid4())
+    result = autohdr_provider.upload_batch(
+        images=[("test_image.jpg", sample_image_bytes)],
+        unique_identifier=unique_id,
+        address="123 Test Street",
+        auto_finalize=False
+    )
+    return unique_id, result
+
+
+# Test folder listings, fetched once per session. Tests that only need
+# "some files" read these instead of listing the folder again; tests that
+# exercise list_files itself (filters, path variants) still call it.
+
+_JPEG_EXTENSIONS = ('.jpg', '.jpeg')
+
+
+@pytest.fixture(scope="session")
+def dropbox_test_folder_files(dropbox_provider, dropbox_test_folder):
+    """All files in the Dropbox test folder."""
+    return dropbox_provider.list_files(dropbox_test_folder)
+
+
+@pytest.fixture(scope="session")
+def dropbox_test_folder_jpgs(dropbox_test_folder_files):
+    """JPEG files in the Dropbox test folder."""
+    return [f for f in dropbox_test_folder_files if f['name'].lower().endswith(_JPEG_EXTENSIONS)]
+
+
+@pytest.fixture(scope="session")
+def google_drive_test_folder_files(google_drive_provider, google_drive_test_folder):
+    """All files in the Google Drive test folder."""
+    return google_drive_provider.list_files(google_drive_test_folder)
+
+
+@pytest.fixture(scope="session")
+def google_drive_test_folder_jpgs(google_drive_test_folder_files):
+    """JPEG files in the Google Drive test folder."""
+    return [f for f in google_drive_test_folder_files if f['name'].lower().endswith(_JPEG_EXTENSIONS)]
+
+
+@pytest.fixture(scope="session")
+def cached_download(tmp_path_factory):
+    """
+    Helper to download a storage file through an on-disk cache.
+    
+    Call cached_download(provider, path_or_id, size=None). Files are cached
+    per session by default; point SNAPFLOW_TEST_CACHE at a persistent
+    directory to reuse them across runs (the listed size is part of the
+    cache key, so a replaced test file is fetched again).
+    """
+    import hashlib
+    
+    cache_dir = Path(os.getenv("SNAPFLOW_TEST_CACHE") or tmp_path_factory.mktemp("downloads"))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _download(provider, key, size=None):
+        digest = hashlib.sha1(
+            f"{provider.get_provider_type()}|{key}|{size}".encode()
+        ).hexdigest()
+        cached = cache_dir / digest
+        if cached.exists():
+            return cached.read_bytes()
+        
+        content = provider.download_file(key)
+        # Write then rename, so parallel workers never read a partial file
+        partial = cache_dir / f"{digest}.{os.getpid()}.part"
+        partial.write_bytes(content)
+        partial.replace(cached)
+        return content
+    return _download
+
+
+# Marker -> provider fixture warmed by _warm_http_pools
+_WARM_PROVIDERS = {
+    "dropbox": "dropbox_provider",
+    "google_drive": "google_drive_provider",
+    "fotello": "fotello_provider",
+    "autohdr": "autohdr_provider",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_http_pools(request):
+    """
+    Create providers for the selected tests before the first test runs.
+    
+    Storage providers authenticate on creation; for enhancement providers a
+    HEAD request opens a TLS connection in the shared pool. Handshake and
+    OAuth latency is paid once up front instead of inside the first timed
+    test body. Only providers whose marker appears in the run are warmed,
+    so unit-only runs never touch the network.
+    """
+    from shared import get_http_session, FOTELLO_BASE_URL, AUTOHDR_BASE_URL
+    
+    # Enhancement providers don't touch the network when created
+    warm_urls = {"fotello": FOTELLO_BASE_URL, "autohdr": AUTOHDR_BASE_URL}
+    selected = {
+        marker.name
+        for item in request.session.items
+        for marker in item.iter_markers()
+    }
+    for marker, fixture in _WARM_PROVIDERS.items():
+        if marker not in selected:
+            continue
+        try:
+            request.getfixturevalue(fixture)
+        except pytest.skip.Exception:
+            continue
+        if marker in warm_urls:
+            try:
+                get_http_session().head(warm_urls[marker], timeout=10)
+            except Exception as e:
+                logger.warning("Warm-up request failed for %s: %s", marker, e)
+
+
+# Per-backend settings for storage_rig: provider fixture, test folder
+# fixture, the file key passed to download_file, display name, and how many
+# threads may share the client (Google Drive's httplib2 is not thread-safe)
+_STORAGE_RIGS = {
+    "dropbox": ("dropbox_provider", "dropbox_test_folder", "path_lower", "Dropbox", 4),
+    "google_drive": ("google_drive_provider", "google_drive_test_folder", "id", "Google Drive", 1),
+}
+
+
+@pytest.fixture(params=[
+    pytest.param("dropbox", marks=pytest.mark.dropbox),
+    pytest.param("google_drive", marks=pytest.mark.google_drive),
+])
+def storage_rig(request):
+    """
+    Storage provider under test, parametrized across backends.
+    
+    Provider, folder and listing fixtures are resolved lazily, so a backend
+    without credentials skips only its own parametrization.
+    """
+    provider_fixture, folder_fixture, path_key, provider_name, max_workers = (
+        _STORAGE_RIGS[request.param]
+    )
+    return SimpleNamespace(
+        provider_type=request.param,
+        provider_name=provider_name,
+        provider=request.getfixturevalue(provider_fixture),
+        test_folder=request.getfixturevalue(folder_fixture),
+        files=request.getfixturevalue(f"{folder_fixture}_files"),
+        jpgs=request.getfixturevalue(f"{folder_fixture}_jpgs"),
+        path_key=path_key,
+        max_workers=max_workers,
+    )
+
+
+@pytest.fixture(params=[
+    pytest.param(("dropbox_provider", "dropbox", "Dropbox"), marks=pytest.mark.dropbox),
+    pytest.param(("google_drive_provider", "google_drive", "Google Drive"), marks=pytest.mark.google_drive),
+    pytest.param(("fotello_provider", "fotello", "Fotello"), marks=pytest.mark.fotello),
+    pytest.param(("autohdr_provider", "autohdr", "AutoHDR"), marks=pytest.mark.autohdr),
+], ids=lambda param: param[1])
+def provider_contract(request):
+    """
+    Any configured provider with its expected type and display name.
+    
+    Returns (provider, provider_type, provider_name); a provider without
+    credentials skips only its own parametrization.
+    """
+    fixture, provider_type, provider_name = request.param
+    return request.getfixturevalue(fixture), provider_type, provider_name
+
+
+# =============================================================================
+# HTTP RECORDING (pytest-recording)
+# =============================================================================
+# Classes marked @pytest.mark.vcr replay API traffic from tests/cassettes
+# instead of calling Dropbox, Google Drive and Fotello. Secrets are scrubbed
+# before a cassette is written. A test without a recorded cassette runs live
+# unless --record-mode is given, and without pytest-recording installed the
+# marker is inert.
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+_SCRUBBED_RESPONSE_FIELDS = frozenset({"access_token", "refresh_token", "id_token", "api_key"})
+
+
+def _scrub_json(value):
+    if isinstance(value, dict):
+        return {
+            key: "REDACTED" if key in _SCRUBBED_RESPONSE_FIELDS else _scrub_json(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_scrub_json(item) for item in value]
+    return value
+
+
+def _scrub_response(response):
+    """Redact OAuth tokens from JSON response bodies before recording."""
+    body = response.get("body", {}).get("string")
+    if not body:
+        return response
+    try:
+        data = json.loads(body)
+    except (TypeError, ValueError):
+        return response
+    scrubbed = json.dumps(_scrub_json(data))
+    response["body"]["string"] = scrubbed.encode() if isinstance(body, bytes) else scrubbed
+    return response
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Scrub credentials from recorded requests and responses."""
+    return {
+        "filter_headers": ["Authorization", "X-Api-Key"],
+        "filter_post_data_parameters": ["client_id", "client_secret", "refresh_token"],
+        "before_record_response": _scrub_response,
+    }
+
+
+@pytest.fixture
+def vcr_cassette_dir(request):
+    """Store cassettes under tests/cassettes/<test module>."""
+    return str(CASSETTE_DIR / request.module.__name__.rsplit(".", 1)[-1])
+
+
+@pytest.fixture
+def disable_recording(request, vcr_cassette_dir, default_cassette_name):
+    """Run live when this test has no cassette and no --record-mode was given.
+
+    pytest-recording defaults to record mode "none", which fails every request
+    that is not already on tape.
+    """
+    if request.config.getoption("--disable-recording"):
+        return True
+    if request.config.getoption("--record-mode") is not None:
+        return False
+    return not (Path(vcr_cassette_dir) / f"{default_cassette_name}.yaml").exists()
+
+
 # =============================================================================
 # UTILITY FIXTURES
 # =============================================================================
@@ -164,47 +442,90 @@ def autohdr_provider(autohdr_credentials):
 @pytest.fixture
 def mock_env(monkeypatch):
     """Helper to mock environment variables."""
+    from shared.config.credentials import _clear_key_cache
+
     def _mock_env(env_dict):
         for key, value in env_dict.items():
             monkeypatch.setenv(key, value)
-    return _mock_env
+        # Client keys are cached per container; drop them when env changes
+        _clear_key_cache()
+    yield _mock_env
+    _clear_key_cache()
+
+
+@pytest.fixture(scope="session")
+def cleanup_paths(request):
+    """
+    Helper to register uploaded test files for deletion at session end.
+    
+    Call cleanup_paths(provider, path_or_id) after each upload. Files are
+    removed per provider with one delete_files_batch call at teardown
+    instead of one delete round-trip per test.
+    """
+    pending = {}
+    
+    def _register(provider, path):
+        pending.setdefault(id(provider), (provider, []))[1].append(path)
+    
+    def _delete_all():
+        for provider, paths in pending.values():
+            try:
+                deleted = provider.delete_files_batch(paths)
+                logger.info("Cleaned up %s/%s test files", deleted, len(paths))
+            except Exception as e:
+                logger.warning("Cleanup failed: %s", e)
+    
+    request.addfinalizer(_delete_all)
+    return _register
 
 
 @pytest.fixture
+def wait_for_enhancement():
+    """
+    Helper to poll an enhancement until it completes or fails.
+    
+    Polls with exponential backoff (2s, 4s, 8s... capped at 30s), so quick
+    results are seen early without hammering the API on slow ones.
+    Returns the final status dict, or None if the timeout expires.
+    """
+    def _wait(provider, enhancement_id, timeout=180, initial_delay=2, max_delay=30):
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        while True:
+            status = provider.check_status(enhancement_id)
+            if status['status'] in ('completed', 'failed'):
+                return status
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            
+            logger.info("Waiting %.0fs... status: %s", min(delay, remaining), status['status'])
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_delay)
+    return _wait
+
+
+# Smallest valid JPEG (1x1 pixel, gray), built once at import
+_SAMPLE_JPEG: bytes = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb00430008060607060508"
+    "0707070909080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720"
+    "222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001"
+    "000101011100ffc4001f00000105010101010101000000000000000001020304"
+    "05060708090a0bffc400b5100002010303020403050504040000017d01020300"
+    "041105122131410613516107227114328191a1082342b1c11552d1f024336272"
+    "82090a161718191a25262728292a3435363738393a434445464748494a535455"
+    "565758595a636465666768696a737475767778797a838485868788898a929394"
+    "95969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9"
+    "cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9faffda"
+    "0008010100003f00fbd3200a28a002800a2803ffd9"
+)
+
+
+@pytest.fixture(scope="session")
 def sample_image_bytes():
-    """Minimal valid JPEG bytes for testing uploads."""
-    # Smallest valid JPEG (1x1 pixel, gray)
-    return bytes([
-        0xFF, 0xD8, 0xFF, 0xE0, 0x00, 0x10, 0x4A, 0x46, 0x49, 0x46, 0x00, 0x01,
-        0x01, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0x00, 0xFF, 0xDB, 0x00, 0x43,
-        0x00, 0x08, 0x06, 0x06, 0x07, 0x06, 0x05, 0x08, 0x07, 0x07, 0x07, 0x09,
-        0x09, 0x08, 0x0A, 0x0C, 0x14, 0x0D, 0x0C, 0x0B, 0x0B, 0x0C, 0x19, 0x12,
-        0x13, 0x0F, 0x14, 0x1D, 0x1A, 0x1F, 0x1E, 0x1D, 0x1A, 0x1C, 0x1C, 0x20,
-        0x24, 0x2E, 0x27, 0x20, 0x22, 0x2C, 0x23, 0x1C, 0x1C, 0x28, 0x37, 0x29,
-        0x2C, 0x30, 0x31, 0x34, 0x34, 0x34, 0x1F, 0x27, 0x39, 0x3D, 0x38, 0x32,
-        0x3C, 0x2E, 0x33, 0x34, 0x32, 0xFF, 0xC0, 0x00, 0x0B, 0x08, 0x00, 0x01,
-        0x00, 0x01, 0x01, 0x01, 0x11, 0x00, 0xFF, 0xC4, 0x00, 0x1F, 0x00, 0x00,
-        0x01, 0x05, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08,
-        0x09, 0x0A, 0x0B, 0xFF, 0xC4, 0x00, 0xB5, 0x10, 0x00, 0x02, 0x01, 0x03,
-        0x03, 0x02, 0x04, 0x03, 0x05, 0x05, 0x04, 0x04, 0x00, 0x00, 0x01, 0x7D,
-        0x01, 0x02, 0x03, 0x00, 0x04, 0x11, 0x05, 0x12, 0x21, 0x31, 0x41, 0x06,
-        0x13, 0x51, 0x61, 0x07, 0x22, 0x71, 0x14, 0x32, 0x81, 0x91, 0xA1, 0x08,
-        0x23, 0x42, 0xB1, 0xC1, 0x15, 0x52, 0xD1, 0xF0, 0x24, 0x33, 0x62, 0x72,
-        0x82, 0x09, 0x0A, 0x16, 0x17, 0x18, 0x19, 0x1A, 0x25, 0x26, 0x27, 0x28,
-        0x29, 0x2A, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3A, 0x43, 0x44, 0x45,
-        0x46, 0x47, 0x48, 0x49, 0x4A, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
-        0x5A, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x73, 0x74, 0x75,
-        0x76, 0x77, 0x78, 0x79, 0x7A, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89,
-        0x8A, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9A, 0xA2, 0xA3,
-        0xA4, 0xA5, 0xA6, 0xA7, 0xA8, 0xA9, 0xAA, 0xB2, 0xB3, 0xB4, 0xB5, 0xB6,
-        0xB7, 0xB8, 0xB9, 0xBA, 0xC2, 0xC3, 0xC4, 0xC5, 0xC6, 0xC7, 0xC8, 0xC9,
-        0xCA, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8, 0xD9, 0xDA, 0xE1, 0xE2,
-        0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA, 0xF1, 0xF2, 0xF3, 0xF4,
-        0xF5, 0xF6, 0xF7, 0xF8, 0xF9, 0xFA, 0xFF, 0xDA, 0x00, 0x08, 0x01, 0x01,
-        0x00, 0x00, 0x3F, 0x00, 0xFB, 0xD3, 0x20, 0x0A, 0x28, 0xA0, 0x02, 0x80,
-        0x0A, 0x28, 0x03, 0xFF, 0xD9
-    ])
+    """Minimal valid JPEG bytes for testing uploads (immutable, shared)."""
+    return _SAMPLE_JPEG
 
 
 # =============================================================================
@@ -221,3 +542,4 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "fotello: Tests requiring Fotello credentials")
     config.addinivalue_line("markers", "autohdr: Tests requiring AutoHDR credentials")
     config.addinivalue_line("markers", "slow: Tests that take more than 30 seconds")
+    config.addinivalue_line("markers", "vcr: Replays recorded HTTP from tests/cassettes")
@@ -8,80 +8,91 @@ WARNING: These tests are slow and consume API credits!
 Run with: pytest tests/e2e/test_full_pipeline.py -v
 """
 
+import logging
 import pytest
-import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
 
 
 @pytest.mark.e2e
 @pytest.mark.slow
-@pytest.mark.dropbox
 @pytest.mark.fotello
-class TestDropboxFotelloPipeline:
-    """Test complete Dropbox → Fotello → Dropbox pipeline."""
+class TestStorageFotelloPipeline:
+    """Test storage → Fotello pipeline for every storage backend."""
     
     def test_download_upload_enhance(
         self,
-        dropbox_provider,
-        fotello_provider,
-        dropbox_test_folder
+        storage_rig,
+        fotello_provider
     ):
         """
         Full pipeline test:
-        1. List files from Dropbox test folder
-        2. Download first image
-        3. Upload to Fotello
+        1. List files from the storage test folder
+        2. Download images (up to 3, as one bracket)
+        3. Upload each to Fotello as soon as it is downloaded
         4. Request enhancement
         5. Verify enhancement ID returned
         """
-        # 1. List files
-        files = dropbox_provider.list_files(
-            dropbox_test_folder,
-            extensions=('.jpg', '.jpeg')
-        )
+        storage = storage_rig.provider
         
-        if not files:
-            pytest.skip("No JPEG files in Dropbox test folder")
+        # 1. List files (cached for the session)
+        files = storage_rig.jpgs
         
-        print(f"Found {len(files)} files, using: {files[0]['name']}")
+        if not files:
+            pytest.skip(f"No JPEG files in {storage_rig.provider_name} test folder")
         
-        # 2. Download
-        file_path = files[0]['path_lower']
-        content = dropbox_provider.download_file(file_path)
+        bracket = files[:3]
+        logger.info("Found %s files, using: %s", len(files), [f['name'] for f in bracket])
         
-        assert len(content) > 0
-        print(f"Downloaded {len(content)} bytes")
+        # 2-3. Download and upload; each worker pipes one file, so one
+        # image's download overlaps another's upload
+        def pipe_one(file):
+            content = storage.download_file(file[storage_rig.path_key])
+            assert len(content) > 0
+            logger.info("Downloaded %s: %s bytes", file['name'], len(content))
+            return fotello_provider.upload_image(file['name'], content)
         
-        # 3. Upload to Fotello
-        upload_id = fotello_provider.upload_image(
-            files[0]['name'],
-            content
-        )
+        workers = min(storage_rig.max_workers, len(bracket))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            upload_ids = list(executor.map(pipe_one, bracket))
         
-        assert upload_id is not None
-        print(f"Uploaded to Fotello: {upload_id}")
+        assert all(upload_ids)
+        logger.info("Uploaded to Fotello: %s", upload_ids)
         
         # 4. Request enhancement
         enhancement_id = fotello_provider.request_enhancement(
-            upload_ids=[upload_id],
-            listing_id=f"e2e-test-{uuid.uuid4().hex[:8]}"
+            upload_ids=upload_ids,
+            listing_id=f"{storage_rig.provider_type}-e2e-{uuid.uuid4().hex[:8]}"
         )
         
         assert enhancement_id is not None
-        print(f"Enhancement requested: {enhancement_id}")
+        logger.info("Enhancement requested: %s", enhancement_id)
         
         # 5. Verify status is accessible
         status = fotello_provider.check_status(enhancement_id)
         
         assert 'status' in status
-        print(f"Enhancement status: {status['status']}")
+        logger.info("Enhancement status: %s", status['status'])
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+@pytest.mark.dropbox
+@pytest.mark.fotello
+class TestDropboxFotelloPipeline:
+    """Test complete Dropbox → Fotello → Dropbox pipeline."""
     
     @pytest.mark.skip(reason="Full cycle takes 2+ minutes and costs credits")
     def test_full_cycle_with_result_upload(
         self,
         dropbox_provider,
         fotello_provider,
-        dropbox_test_folder
+        dropbox_test_folder,
+        dropbox_test_folder_jpgs,
+        cached_download,
+        wait_for_enhancement
     ):
         """
         Complete cycle including waiting for result and uploading back.
@@ -90,19 +101,15 @@ class TestDropboxFotelloPipeline:
         1. Downloads from Dropbox
         2. Uploads to Fotello
         3. Waits for enhancement
-        4. Downloads enhanced image
-        5. Uploads back to Dropbox
+        4. Streams enhanced image back to Dropbox
         """
         # Get test image
-        files = dropbox_provider.list_files(
-            dropbox_test_folder,
-            extensions=('.jpg', '.jpeg')
-        )
+        files = dropbox_test_folder_jpgs
         
         if not files:
             pytest.skip("No test files available")
         
-        content = dropbox_provider.download_file(files[0]['path_lower'])
+        content = cached_download(dropbox_provider, files[0]['path_lower'], files[0]['size'])
         
         # Upload and enhance
         upload_id = fotello_provider.upload_image(files[0]['name'], content)
@@ -112,87 +119,25 @@ class TestDropboxFotelloPipeline:
         )
         
         # Wait for completion (max 3 minutes)
-        enhanced_url = None
-        for attempt in range(18):
-            status = fotello_provider.check_status(enhancement_id)
-            
-            if status['status'] == 'completed':
-                enhanced_url = status.get('enhanced_image_url')
-                break
-            elif status['status'] == 'failed':
-                pytest.fail(f"Enhancement failed: {status}")
-            
-            print(f"Waiting... status: {status['status']}")
-            time.sleep(10)
+        status = wait_for_enhancement(fotello_provider, enhancement_id, timeout=180)
+        if status and status['status'] == 'failed':
+            pytest.fail(f"Enhancement failed: {status}")
         
+        enhanced_url = status.get('enhanced_image_url') if status else None
         if not enhanced_url:
             pytest.fail("Enhancement did not complete in time")
         
-        # Download enhanced image
+        # Stream enhanced image straight back to Dropbox
         import requests
-        response = requests.get(enhanced_url, timeout=60)
-        response.raise_for_status()
-        enhanced_content = response.content
-        
-        print(f"Downloaded enhanced image: {len(enhanced_content)} bytes")
-        
-        # Upload back to Dropbox
         result_path = f"{dropbox_test_folder}/enhanced/{files[0]['name']}"
-        dropbox_provider.upload_file(result_path, enhanced_content)
-        
-        print(f"Uploaded result to: {result_path}")
-
-
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.google_drive
-@pytest.mark.fotello
-class TestGoogleDriveFotelloPipeline:
-    """Test complete Google Drive → Fotello → Google Drive pipeline."""
-    
-    def test_download_upload_enhance(
-        self,
-        google_drive_provider,
-        fotello_provider,
-        google_drive_test_folder
-    ):
-        """
-        Full pipeline test with Google Drive as storage.
-        """
-        # 1. List files
-        files = google_drive_provider.list_files(
-            google_drive_test_folder,
-            extensions=('.jpg', '.jpeg')
-        )
-        
-        if not files:
-            pytest.skip("No JPEG files in Google Drive test folder")
-        
-        print(f"Found {len(files)} files, using: {files[0]['name']}")
-        
-        # 2. Download
-        content = google_drive_provider.download_file(files[0]['id'])
-        
-        assert len(content) > 0
-        print(f"Downloaded {len(content)} bytes")
-        
-        # 3. Upload to Fotello
-        upload_id = fotello_provider.upload_image(
-            files[0]['name'],
-            content
-        )
-        
-        assert upload_id is not None
-        print(f"Uploaded to Fotello: {upload_id}")
-        
-        # 4. Request enhancement
-        enhancement_id = fotello_provider.request_enhancement(
-            upload_ids=[upload_id],
-            listing_id=f"gdrive-e2e-{uuid.uuid4().hex[:8]}"
-        )
-        
-        assert enhancement_id is not None
-        print(f"Enhancement requested: {enhancement_id}")
+        with requests.get(enhanced_url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            dropbox_provider.upload_stream(
+                result_path,
+                response.iter_content(chunk_size=4 * 1024 * 1024)
+            )
+        
+        logger.info("Uploaded result to: %s", result_path)
 
 
 @pytest.mark.e2e
@@ -206,28 +151,30 @@ class TestDropboxAutoHDRPipeline:
         self,
         dropbox_provider,
         autohdr_provider,
-        dropbox_test_folder
+        dropbox_test_folder_jpgs,
+        cached_download
     ):
         """
         Pipeline test with AutoHDR enhancement.
         Note: AutoHDR uses webhooks, so we can only verify upload success.
         """
         # Get test images
-        files = dropbox_provider.list_files(
-            dropbox_test_folder,
-            extensions=('.jpg', '.jpeg')
-        )
+        files = dropbox_test_folder_jpgs
         
         if len(files) < 2:
             pytest.skip("Need at least 2 JPEG files for AutoHDR bracket")
         
-        # Download multiple files for bracket
-        images = []
-        for file in files[:3]:  # Use up to 3 files
-            content = dropbox_provider.download_file(file['path_lower'])
-            images.append((file['name'], content))
+        # Download multiple files for bracket (up to 3, concurrently)
+        bracket = files[:3]
+        names = [file['name'] for file in bracket]
+        with ThreadPoolExecutor(max_workers=min(6, len(bracket))) as executor:
+            contents = list(executor.map(
+                lambda file: cached_download(dropbox_provider, file['path_lower'], file['size']),
+                bracket
+            ))
+        images = list(zip(names, contents))
         
-        print(f"Downloaded {len(images)} images for bracket")
+        logger.info("Downloaded %s images for bracket", len(images))
         
         # Upload batch to AutoHDR
         result = autohdr_provider.upload_batch(
@@ -238,52 +185,30 @@ class TestDropboxAutoHDRPipeline:
         )
         
         assert result.get('successful_uploads', 0) > 0
-        print(f"AutoHDR upload result: {result.get('successful_uploads')} files uploaded")
+        logger.info("AutoHDR upload result: %s files uploaded", result.get('successful_uploads'))
 
 
 @pytest.mark.e2e
 class TestCredentialDecryptionPipeline:
     """Test credential decryption in pipeline context."""
     
-    def test_decrypts_and_creates_providers(self, mock_env, encryption_key):
+    def test_decrypts_and_creates_providers(
+        self,
+        mock_env,
+        encryption_key,
+        dropbox_credentials,
+        encrypted_dropbox_payload
+    ):
         """Should decrypt credentials and create providers."""
         from shared import decrypt_credentials, StorageFactory
-        from cryptography.fernet import Fernet
-        import os
-        
-        # Setup encrypted credentials
-        fernet = Fernet(encryption_key.encode())
-        
-        mock_env({
-            "CLIENT_E2E_ENCRYPTION_KEY": encryption_key,
-            "TEST_DROPBOX_APP_KEY": os.getenv("TEST_DROPBOX_APP_KEY", "skip"),
-            "TEST_DROPBOX_APP_SECRET": os.getenv("TEST_DROPBOX_APP_SECRET", "skip"),
-            "TEST_DROPBOX_REFRESH_TOKEN": os.getenv("TEST_DROPBOX_REFRESH_TOKEN", "skip"),
-        })
-        
-        # Skip if real credentials not available
-        if os.getenv("TEST_DROPBOX_APP_KEY") == "skip":
-            pytest.skip("Dropbox credentials not configured")
         
-        # Create encrypted payload (like Make.com would send)
-        encrypted_payload = {
-            "client_id": "E2E",
-            "dropbox_app_key_encrypted": fernet.encrypt(
-                os.getenv("TEST_DROPBOX_APP_KEY").encode()
-            ).decode(),
-            "dropbox_app_secret_encrypted": fernet.encrypt(
-                os.getenv("TEST_DROPBOX_APP_SECRET").encode()
-            ).decode(),
-            "dropbox_refresh_token_encrypted": fernet.encrypt(
-                os.getenv("TEST_DROPBOX_REFRESH_TOKEN").encode()
-            ).decode(),
-        }
+        mock_env({"CLIENT_E2E_ENCRYPTION_KEY": encryption_key})
         
         # Decrypt (like gateway function does)
-        decrypted = decrypt_credentials(encrypted_payload, "E2E")
+        decrypted = decrypt_credentials(encrypted_dropbox_payload, "E2E")
         
         # Verify decryption worked
-        assert decrypted["dropbox_app_key"] == os.getenv("TEST_DROPBOX_APP_KEY")
+        assert decrypted["dropbox_app_key"] == dropbox_credentials["app_key"]
         
         # Create provider with decrypted credentials
         provider = StorageFactory.create("dropbox", {
@@ -293,4 +218,4 @@ class TestCredentialDecryptionPipeline:
         })
         
         assert provider.is_connected()
-        print("Full credential decryption → provider creation pipeline works!")
+        logger.info("Full credential decryption → provider creation pipeline works!")
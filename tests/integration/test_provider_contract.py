@@ -0,0 +1,25 @@
+"""
+Integration Tests: Provider Contract
+====================================
+Connection and identity checks every storage and enhancement provider
+must pass, run against each configured provider through the
+provider_contract fixture.
+Requires credentials for at least one provider.
+
+Run with: pytest tests/integration/test_provider_contract.py -v
+"""
+
+import pytest
+
+
+@pytest.mark.integration
+class TestProviderConnection:
+    """Test connection and authentication."""
+    
+    def test_connects_with_provider_info(self, provider_contract):
+        """Should connect and report the expected type and name."""
+        provider, provider_type, provider_name = provider_contract
+        
+        assert provider.is_connected()
+        assert provider.get_provider_type() == provider_type
+        assert provider.get_provider_name() == provider_name
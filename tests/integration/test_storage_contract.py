@@ -0,0 +1,37 @@
+"""
+Integration Tests: Storage Provider Contract
+============================================
+Behaviour every storage provider must share, run against each backend
+through the storage_rig fixture.
+Requires TEST_DROPBOX_* and/or TEST_GDRIVE_* environment variables.
+
+Run with: pytest tests/integration/test_storage_contract.py -v
+"""
+
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.vcr
+class TestListFilesContract:
+    """Test listing files from storage."""
+    
+    def test_filters_by_extension(self, storage_rig):
+        """Should filter files by extension."""
+        jpg_files = storage_rig.provider.list_files(
+            storage_rig.test_folder,
+            extensions=('.jpg', '.jpeg')
+        )
+        
+        for f in jpg_files:
+            assert f['name'].lower().endswith(('.jpg', '.jpeg'))
+    
+    def test_returns_file_metadata(self, storage_rig):
+        """Files should have required metadata fields."""
+        files = storage_rig.files
+        
+        if files:
+            file = files[0]
+            assert 'name' in file
+            assert storage_rig.path_key in file  # Google Drive uses IDs instead of paths
+            assert 'size' in file
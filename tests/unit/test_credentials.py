@@ -7,6 +7,15 @@ No external API calls - runs fast.
 
 import pytest
 from cryptography.fernet import Fernet
+from shared.config import (
+    generate_fernet_key,
+    decrypt_credential,
+    decrypt_credential_bytes,
+    decrypt_credentials,
+    mask_credentials,
+    get_client_encryption_key,
+)
+from shared.config.credentials import _NativeFernet, _get_fernet
 
 
 class TestGenerateFernetKey:
@@ -15,8 +24,6 @@ class TestGenerateFernetKey:
     @pytest.mark.unit
     def test_generates_valid_key(self):
         """Generated key should be valid Fernet format."""
-        from shared.config import generate_fernet_key
-        
         key = generate_fernet_key()
         
         # Should be base64-encoded, 44 chars
@@ -30,8 +37,6 @@ class TestGenerateFernetKey:
     @pytest.mark.unit
     def test_generates_unique_keys(self):
         """Each call should generate a different key."""
-        from shared.config import generate_fernet_key
-        
         keys = [generate_fernet_key() for _ in range(10)]
         
         # All keys should be unique
@@ -42,12 +47,9 @@ class TestDecryptCredential:
     """Tests for decrypt_credential function."""
     
     @pytest.mark.unit
-    def test_decrypts_valid_credential(self, encryption_key):
+    def test_decrypts_valid_credential(self, fernet, encryption_key):
         """Should decrypt a properly encrypted value."""
-        from shared.config import decrypt_credential
-        
         # Encrypt a test value
-        fernet = Fernet(encryption_key.encode())
         original = "my-secret-api-key"
         encrypted = fernet.encrypt(original.encode()).decode()
         
@@ -59,8 +61,6 @@ class TestDecryptCredential:
     @pytest.mark.unit
     def test_raises_on_invalid_key(self):
         """Should raise ValueError with wrong key."""
-        from shared.config import decrypt_credential
-        
         # Encrypt with one key
         key1 = Fernet.generate_key().decode()
         key2 = Fernet.generate_key().decode()
@@ -75,26 +75,41 @@ class TestDecryptCredential:
     @pytest.mark.unit
     def test_raises_on_invalid_encrypted_value(self, encryption_key):
         """Should raise ValueError with garbage input."""
-        from shared.config import decrypt_credential
-        
         with pytest.raises(ValueError, match="Failed to decrypt"):
             decrypt_credential("not-valid-encrypted-data", encryption_key)
+    
+    @pytest.mark.unit
+    def test_decrypts_bytes_credential(self, fernet, encryption_key):
+        """Should decrypt bytes tokens to bytes without a str round trip."""
+        token = fernet.encrypt(b"my-secret-api-key")
+        
+        assert decrypt_credential_bytes(token, encryption_key) == b"my-secret-api-key"
+    
+    @pytest.mark.unit
+    def test_native_backend_reads_cryptography_tokens(self, fernet, encryption_key):
+        """Should decrypt cryptography-made tokens with the rfernet backend."""
+        pytest.importorskip("rfernet")
+        
+        token = fernet.encrypt(b"secret")
+        
+        assert _NativeFernet(encryption_key).decrypt(token) == b"secret"
+    
+    @pytest.mark.unit
+    def test_reuses_fernet_per_key(self, encryption_key):
+        """Should build the Fernet instance for a key only once."""
+        assert _get_fernet(encryption_key) is _get_fernet(encryption_key)
 
 
 class TestDecryptCredentials:
     """Tests for decrypt_credentials function."""
     
     @pytest.mark.unit
-    def test_decrypts_legacy_format(self, mock_env, encryption_key):
+    def test_decrypts_legacy_format(self, mock_env, fernet, encryption_key):
         """Should decrypt legacy flat format."""
-        from shared.config import decrypt_credentials
-        
         # Setup environment with encryption key
         mock_env({"CLIENT_TEST_ENCRYPTION_KEY": encryption_key})
         
         # Encrypt test values
-        fernet = Fernet(encryption_key.encode())
-        
         data = {
             "client_id": "TEST",
             "dropbox_app_key_encrypted": fernet.encrypt(b"app-key-123").decode(),
@@ -120,14 +135,10 @@ class TestDecryptCredentials:
         assert "dropbox_app_key_encrypted" not in result
     
     @pytest.mark.unit
-    def test_decrypts_google_drive_credentials(self, mock_env, encryption_key):
+    def test_decrypts_google_drive_credentials(self, mock_env, fernet, encryption_key):
         """Should decrypt Google Drive credentials."""
-        from shared.config import decrypt_credentials
-        
         mock_env({"CLIENT_TEST_ENCRYPTION_KEY": encryption_key})
         
-        fernet = Fernet(encryption_key.encode())
-        
         data = {
             "google_drive_client_id_encrypted": fernet.encrypt(b"gdrive-client-id").decode(),
             "google_drive_client_secret_encrypted": fernet.encrypt(b"gdrive-secret").decode(),
@@ -141,14 +152,10 @@ class TestDecryptCredentials:
         assert result["google_drive_refresh_token"] == "gdrive-refresh"
     
     @pytest.mark.unit
-    def test_decrypts_autohdr_credentials(self, mock_env, encryption_key):
+    def test_decrypts_autohdr_credentials(self, mock_env, fernet, encryption_key):
         """Should decrypt AutoHDR credentials (api_key only, email is plain)."""
-        from shared.config import decrypt_credentials
-        
         mock_env({"CLIENT_TEST_ENCRYPTION_KEY": encryption_key})
         
-        fernet = Fernet(encryption_key.encode())
-        
         data = {
             "autohdr_api_key_encrypted": fernet.encrypt(b"autohdr-key").decode(),
             "autohdr_email": "test@example.com",  # NOT encrypted
@@ -159,19 +166,26 @@ class TestDecryptCredentials:
         assert result["autohdr_api_key"] == "autohdr-key"
         assert result["autohdr_email"] == "test@example.com"
     
+    @pytest.mark.unit
+    def test_returns_copy_of_plain_payload(self, mock_env, encryption_key):
+        """Should return plain payloads as a copy without decrypting."""
+        mock_env({"CLIENT_TEST_ENCRYPTION_KEY": encryption_key})
+        data = {"dropbox_app_key": "already-plain", "listing_id": "123"}
+        
+        result = decrypt_credentials(data, "TEST")
+        
+        assert result == data
+        assert result is not data
+    
     @pytest.mark.unit
     def test_raises_on_missing_client_key(self):
         """Should raise ValueError if client key not in environment."""
-        from shared.config import decrypt_credentials
-        
         with pytest.raises(ValueError, match="No encryption key found"):
             decrypt_credentials({"some": "data"}, "UNKNOWN_CLIENT")
     
     @pytest.mark.unit
     def test_raises_on_empty_client_id(self):
         """Should raise ValueError if client_id is empty."""
-        from shared.config import decrypt_credentials
-        
         with pytest.raises(ValueError, match="client_id is required"):
             decrypt_credentials({"some": "data"}, "")
         
@@ -185,8 +199,6 @@ class TestMaskCredentials:
     @pytest.mark.unit
     def test_masks_sensitive_fields(self):
         """Should mask known sensitive fields."""
-        from shared.config import mask_credentials
-        
         data = {
             "dropbox_app_key": "abcdefghijklmnop",
             "dropbox_app_secret": "1234567890abcdef",
@@ -207,8 +219,6 @@ class TestMaskCredentials:
     @pytest.mark.unit
     def test_masks_short_values(self):
         """Short values should be fully masked."""
-        from shared.config import mask_credentials
-        
         data = {"api_key": "short"}
         
         masked = mask_credentials(data)
@@ -218,8 +228,6 @@ class TestMaskCredentials:
     @pytest.mark.unit
     def test_handles_nested_credentials(self):
         """Should mask nested credential dictionaries."""
-        from shared.config import mask_credentials
-        
         data = {
             "storage_credentials": {
                 "refresh_token": "very-long-refresh-token-value",
@@ -237,11 +245,19 @@ class TestMaskCredentials:
     @pytest.mark.unit
     def test_handles_non_dict_input(self):
         """Should return non-dict input unchanged."""
-        from shared.config import mask_credentials
-        
         assert mask_credentials("string") == "string"
         assert mask_credentials(123) == 123
         assert mask_credentials(None) is None
+    
+    @pytest.mark.unit
+    def test_leaves_input_and_empty_values_untouched(self):
+        """Should not mutate the input and should keep empty sensitive values."""
+        data = {"api_key": "", "refresh_token": "very-long-refresh-token-value"}
+        
+        masked = mask_credentials(data)
+        
+        assert masked == {"api_key": "", "refresh_token": "very...alue"}
+        assert data["refresh_token"] == "very-long-refresh-token-value"
 
 
 class TestGetClientEncryptionKey:
@@ -250,8 +266,6 @@ class TestGetClientEncryptionKey:
     @pytest.mark.unit
     def test_gets_key_from_environment(self, mock_env):
         """Should retrieve key from environment variable."""
-        from shared.config import get_client_encryption_key
-        
         mock_env({"CLIENT_MYTEST_ENCRYPTION_KEY": "test-key-value"})
         
         key = get_client_encryption_key("MYTEST")
@@ -261,8 +275,6 @@ class TestGetClientEncryptionKey:
     @pytest.mark.unit
     def test_case_insensitive_client_id(self, mock_env):
         """Client ID should be case-insensitive."""
-        from shared.config import get_client_encryption_key
-        
         mock_env({"CLIENT_ABC_ENCRYPTION_KEY": "the-key"})
         
         assert get_client_encryption_key("abc") == "the-key"
@@ -272,8 +284,6 @@ class TestGetClientEncryptionKey:
     @pytest.mark.unit
     def test_lists_available_clients_on_error(self, mock_env):
         """Error message should list available clients."""
-        from shared.config import get_client_encryption_key
-        
         mock_env({
             "CLIENT_001_ENCRYPTION_KEY": "key1",
             "CLIENT_002_ENCRYPTION_KEY": "key2",
@@ -285,3 +295,14 @@ class TestGetClientEncryptionKey:
         error_msg = str(exc_info.value)
         assert "001" in error_msg
         assert "002" in error_msg
+    
+    @pytest.mark.unit
+    def test_caches_key_lookup(self, mock_env, monkeypatch):
+        """Should read each client's key from the environment only once."""
+        import os
+        
+        mock_env({"CLIENT_CACHED_ENCRYPTION_KEY": "cached-key"})
+        get_client_encryption_key("cached")
+        monkeypatch.setattr(os, "environ", {})
+        
+        assert get_client_encryption_key("cached") == "cached-key"
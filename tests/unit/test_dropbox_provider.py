@@ -0,0 +1,160 @@
+"""
+Unit Tests: Dropbox Provider
+============================
+Tests for HTTP connection reuse, streaming, batch deletes and uploads.
+No external API calls - runs fast.
+"""
+
+import pytest
+
+
+class TestHttpSession:
+    """Tests for the pooled content API session."""
+
+    @pytest.mark.unit
+    def test_reuses_session_across_calls(self):
+        """Should create the HTTP session once and reuse it."""
+        from shared.providers.storage import DropboxProvider
+
+        provider = DropboxProvider()
+
+        assert provider._get_http_session() is provider._get_http_session()
+
+    @pytest.mark.unit
+    def test_partial_download_uses_pooled_session(self):
+        """Should send range requests through the pooled session."""
+        from unittest.mock import MagicMock
+        from shared.providers.storage import DropboxProvider
+
+        provider = DropboxProvider()
+        provider._connected = True
+        provider._access_token = "token"
+        provider._http = MagicMock()
+        provider._http.post.return_value.content = b"header"
+
+        data = provider.download_file_partial("/Photos/IMG_0001.CR2", 0, 1024)
+
+        assert data == b"header"
+        headers = provider._http.post.call_args.kwargs["headers"]
+        assert headers["Range"] == "bytes=0-1023"
+
+
+class TestDownloadStream:
+    """Tests for chunked downloads."""
+
+    @pytest.mark.unit
+    def test_yields_response_chunks(self):
+        """Should yield the download response body chunk by chunk."""
+        from unittest.mock import MagicMock
+        from shared.providers.storage import DropboxProvider
+
+        provider = DropboxProvider()
+        provider._connected = True
+        provider.client = MagicMock()
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = iter([b"ab", b"cd"])
+        provider.client.files_download.return_value = (None, response)
+
+        chunks = list(provider.download_stream("/Photos/IMG_0001.CR2", chunk_size=2))
+
+        assert chunks == [b"ab", b"cd"]
+        response.iter_content.assert_called_once_with(chunk_size=2)
+        response.__exit__.assert_called_once()
+
+
+class TestDeleteFilesBatch:
+    """Tests for batched deletion."""
+
+    @pytest.mark.unit
+    def test_polls_async_job_until_complete(self, monkeypatch):
+        """Should delete all paths in one batch and wait for the job."""
+        from unittest.mock import MagicMock
+        from shared.providers.storage import DropboxProvider
+
+        monkeypatch.setattr(DropboxProvider, "DELETE_BATCH_POLL_SECONDS", 0)
+        provider = DropboxProvider()
+        provider._connected = True
+        provider.client = MagicMock()
+        provider.client.files_delete_batch.return_value.is_complete.return_value = False
+        in_progress = MagicMock()
+        in_progress.is_in_progress.return_value = True
+        done = MagicMock()
+        done.is_in_progress.return_value = False
+        done.is_failed.return_value = False
+        done.get_complete.return_value.entries = [
+            MagicMock(**{"is_success.return_value": True}),
+            MagicMock(**{"is_success.return_value": False}),
+        ]
+        provider.client.files_delete_batch_check.side_effect = [in_progress, done]
+
+        deleted = provider.delete_files_batch(["/Tests/a.jpg", "/Tests/b.jpg"])
+
+        assert deleted == 1
+        provider.client.files_delete_batch.assert_called_once()
+        entries = provider.client.files_delete_batch.call_args.args[0]
+        assert [entry.path for entry in entries] == ["/tests/a.jpg", "/tests/b.jpg"]
+
+    @pytest.mark.unit
+    def test_gives_up_on_stuck_job(self, monkeypatch):
+        """Should raise IOError once the async job exceeds the poll limit."""
+        from unittest.mock import MagicMock
+        from shared.providers.storage import DropboxProvider
+
+        monkeypatch.setattr(DropboxProvider, "DELETE_BATCH_POLL_SECONDS", 0)
+        monkeypatch.setattr(DropboxProvider, "DELETE_BATCH_MAX_POLLS", 3)
+        provider = DropboxProvider()
+        provider._connected = True
+        provider.client = MagicMock()
+        provider.client.files_delete_batch.return_value.is_complete.return_value = False
+        provider.client.files_delete_batch_check.return_value.is_in_progress.return_value = True
+
+        with pytest.raises(IOError, match="still in progress"):
+            provider.delete_files_batch(["/Tests/a.jpg"])
+
+        assert provider.client.files_delete_batch_check.call_count == 4
+
+
+class TestUploadStream:
+    """Tests for streamed uploads."""
+
+    @staticmethod
+    def _provider():
+        from unittest.mock import MagicMock
+        from shared.providers.storage import DropboxProvider
+
+        provider = DropboxProvider()
+        provider._connected = True
+        provider.client = MagicMock()
+        provider.client.files_upload_session_start.return_value.session_id = "sid"
+        return provider
+
+    @pytest.mark.unit
+    def test_small_stream_uses_simple_upload(self):
+        """Should send content that fits one piece with files_upload."""
+        provider = self._provider()
+
+        provider.upload_stream("/Tests/out.jpg", iter([b"ab", b"cd"]))
+
+        assert provider.client.files_upload.call_args.args[0] == b"abcd"
+        provider.client.files_upload_session_start.assert_not_called()
+
+    @pytest.mark.unit
+    def test_large_stream_uses_upload_session(self, monkeypatch):
+        """Should regroup chunks into fixed pieces sent through a session."""
+        from shared.providers.storage import dropbox_provider
+
+        monkeypatch.setattr(dropbox_provider, "UPLOAD_CHUNK_SIZE", 4)
+        provider = self._provider()
+        appended = []
+        provider.client.files_upload_session_append_v2.side_effect = (
+            lambda piece, cursor: appended.append((piece, cursor.offset))
+        )
+
+        provider.upload_stream("/Tests/out.jpg", iter([b"abc", b"defgh", b"ijk"]))
+
+        provider.client.files_upload_session_start.assert_called_once_with(b"abcd")
+        assert appended == [(b"efgh", 4)]
+        finish_args = provider.client.files_upload_session_finish.call_args.args
+        assert finish_args[0] == b"ijk"
+        assert finish_args[1].offset == 8
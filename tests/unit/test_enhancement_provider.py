@@ -0,0 +1,270 @@
+"""
+Unit Tests: Enhancement Provider Base
+=====================================
+Tests for batched status checks.
+No external API calls - runs fast.
+"""
+
+import pytest
+
+
+class TestCheckStatuses:
+    """Tests for BaseEnhancementProvider.check_statuses."""
+
+    @pytest.mark.unit
+    def test_maps_each_id_to_its_status(self, monkeypatch):
+        """Should return one check_status result per unique ID."""
+        from shared.providers.enhancement import FotelloProvider
+
+        provider = FotelloProvider("test-key")
+        calls = []
+
+        def fake_check_status(enhancement_id):
+            calls.append(enhancement_id)
+            return {'status': 'completed', 'enhancement_id': enhancement_id}
+
+        monkeypatch.setattr(provider, "check_status", fake_check_status)
+
+        statuses = provider.check_statuses(["a", "b", "a"])
+
+        assert sorted(calls) == ["a", "b"]
+        assert statuses["b"] == {'status': 'completed', 'enhancement_id': 'b'}
+
+    @pytest.mark.unit
+    def test_captures_lookup_errors(self, monkeypatch):
+        """Should report a failed lookup as an error status instead of raising."""
+        from shared.providers.enhancement import FotelloProvider
+
+        provider = FotelloProvider("test-key")
+
+        def failing_check_status(enhancement_id):
+            raise IOError("boom")
+
+        monkeypatch.setattr(provider, "check_status", failing_check_status)
+
+        statuses = provider.check_statuses(["a"])
+
+        assert statuses["a"]["status"] == "error"
+        assert statuses["a"]["error"] == "boom"
+
+    @pytest.mark.unit
+    def test_stops_requesting_after_repeated_failures(self, monkeypatch):
+        """Should skip remaining lookups once the failure threshold is hit."""
+        from shared.providers.enhancement import FotelloProvider
+
+        provider = FotelloProvider("test-key")
+        calls = []
+
+        def failing_check_status(enhancement_id):
+            calls.append(enhancement_id)
+            raise IOError("connection refused")
+
+        monkeypatch.setattr(provider, "check_status", failing_check_status)
+
+        statuses = provider.check_statuses(
+            [f"id-{i}" for i in range(10)], max_workers=1, failure_threshold=3
+        )
+
+        assert len(calls) == 3
+        assert all(s["status"] == "error" for s in statuses.values())
+        assert "skipped" in statuses["id-9"]["error"]
+
+
+class TestFotelloUpload:
+    """Tests for uploading from bytes or file objects."""
+
+    @pytest.mark.unit
+    def test_payload_size_of_file_object(self):
+        """Should measure a file object from its current position without moving it."""
+        import io
+        from shared.providers.enhancement.fotello_provider import _payload_size
+
+        data = io.BytesIO(b"0123456789")
+        data.seek(2)
+
+        assert _payload_size(data) == 8
+        assert data.tell() == 2
+        assert _payload_size(b"abc") == 3
+
+    @pytest.mark.unit
+    def test_uploads_file_object(self, monkeypatch):
+        """Should stream a file object to the presigned URL."""
+        import io
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import FotelloProvider
+
+        session = MagicMock()
+        provider = FotelloProvider("test-key", session=session)
+        monkeypatch.setattr(
+            provider, "_get_presigned_url",
+            lambda filename: {'url': 'https://upload.example', 'id': 'up-1'}
+        )
+        put = session.put
+        data = io.BytesIO(b"jpeg-bytes")
+
+        assert provider.upload_image("IMG_0001.jpg", data) == 'up-1'
+        assert put.call_args.kwargs["data"] is data
+
+
+class TestUploadImages:
+    """Tests for bracket uploads."""
+
+    @pytest.mark.unit
+    def test_default_uploads_each_image_and_skips_failures(self, monkeypatch):
+        """Should upload images one by one and drop the ones that fail."""
+        from shared.providers.enhancement import FotelloProvider
+
+        provider = FotelloProvider("test-key")
+
+        def fake_upload_image(filename, data):
+            if filename == "bad.jpg":
+                raise IOError("boom")
+            return f"id-{filename}"
+
+        monkeypatch.setattr(provider, "upload_image", fake_upload_image)
+
+        upload_ids = provider.upload_images([("a.jpg", b"1"), ("bad.jpg", b"2"), ("c.jpg", b"3")])
+
+        assert provider.supports_batch_upload is False
+        assert upload_ids == ["id-a.jpg", "id-c.jpg"]
+
+    @pytest.mark.unit
+    def test_autohdr_uploads_bracket_as_one_photoshoot(self, monkeypatch):
+        """Should send the whole bracket through a single upload_batch call."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import AutoHDRProvider
+
+        provider = AutoHDRProvider("test-key", email="agent@example.com")
+        upload_batch = MagicMock(return_value={
+            'success': True, 'listing_id': 'shoot-1', 'successful_uploads': 3
+        })
+        monkeypatch.setattr(provider, "upload_batch", upload_batch)
+
+        images = [("a.jpg", b"1"), ("b.jpg", b"2"), ("c.jpg", b"3")]
+        upload_ids = provider.upload_images(images)
+
+        assert provider.supports_batch_upload is True
+        assert upload_ids == ["shoot-1"] * 3
+        assert upload_batch.call_count == 1
+        assert upload_batch.call_args.kwargs["images"] == images
+
+
+    @pytest.mark.unit
+    def test_autohdr_empty_bracket_uploads_nothing(self, monkeypatch):
+        """Should return no upload IDs for an empty bracket without calling the API."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import AutoHDRProvider
+
+        provider = AutoHDRProvider("test-key", email="agent@example.com")
+        upload_batch = MagicMock()
+        monkeypatch.setattr(provider, "upload_batch", upload_batch)
+
+        assert provider.upload_images([]) == []
+        upload_batch.assert_not_called()
+
+    @pytest.mark.unit
+    def test_autohdr_raises_on_partial_bracket(self, monkeypatch):
+        """Should raise instead of returning IDs for a bracket missing exposures."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import AutoHDRProvider
+
+        provider = AutoHDRProvider("test-key", email="agent@example.com")
+        monkeypatch.setattr(provider, "upload_batch", MagicMock(return_value={
+            'success': False, 'listing_id': 'shoot-1', 'successful_uploads': 2
+        }))
+
+        with pytest.raises(IOError, match="2/3"):
+            provider.upload_images([("a.jpg", b"1"), ("b.jpg", b"2"), ("c.jpg", b"3")])
+
+
+class TestSharedSession:
+    """Tests for HTTP session injection."""
+
+    @pytest.mark.unit
+    def test_factory_passes_session_to_provider(self):
+        """Should build providers around the injected session."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import EnhancementFactory
+
+        session = MagicMock()
+        fotello = EnhancementFactory.create("fotello", "key", session=session)
+        autohdr = EnhancementFactory.create(
+            "autohdr", "key", email="agent@example.com", session=session
+        )
+
+        assert fotello._http is session
+        assert autohdr.session is session
+
+    @pytest.mark.unit
+    def test_autohdr_sends_auth_per_request(self):
+        """Should not put credentials on a session other providers share."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import AutoHDRProvider
+
+        session = MagicMock()
+        session.post.return_value.status_code = 200
+        provider = AutoHDRProvider("test-key", email="agent@example.com", session=session)
+
+        assert provider.finalize_photoshoot("shoot-1") is True
+        headers = session.post.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer test-key"
+        assert not session.headers.update.called
+
+
+class TestDeliveryMode:
+    """Tests for webhook vs polling result delivery."""
+
+    @pytest.mark.unit
+    def test_autohdr_is_webhook_based(self):
+        """Should report webhook delivery without calling the API."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import AutoHDRProvider
+
+        session = MagicMock()
+        provider = AutoHDRProvider("test-key", email="agent@example.com", session=session)
+
+        assert provider.webhook_based is True
+        assert provider.check_status("listing-1")['status'] == 'webhook_based'
+        assert not session.method_calls
+
+    @pytest.mark.unit
+    def test_fotello_is_polled(self):
+        """Should report polling delivery for Fotello."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import FotelloProvider
+
+        assert FotelloProvider("key", session=MagicMock()).webhook_based is False
+
+
+class TestAutoHDRUploadBatch:
+    """Tests for presigned S3 uploads."""
+
+    @pytest.mark.unit
+    def test_puts_files_concurrently_and_counts_results(self):
+        """Should PUT every file to its own URL and tally failures."""
+        from unittest.mock import MagicMock
+        from shared.providers.enhancement import AutoHDRProvider
+
+        session = MagicMock()
+        session.post.return_value.status_code = 200
+        session.post.return_value.json.return_value = {
+            'id': 'shoot-1', 'uploaded_files': ['https://s3/a', 'https://s3/b', 'https://s3/c']
+        }
+
+        def put(url, data, headers, timeout):
+            return MagicMock(status_code=500 if url.endswith('/b') else 200, text='err')
+        session.put.side_effect = put
+        provider = AutoHDRProvider("test-key", email="agent@example.com", session=session)
+
+        result = provider.upload_batch(
+            [("a.jpg", b"1"), ("b.jpg", b"2"), ("c.jpg", b"3")],
+            unique_identifier="uid",
+            address="1 Main St",
+            auto_finalize=False,
+        )
+
+        assert result['successful_uploads'] == 2
+        assert result['failed_files'] == ["b.jpg"]
+        assert [r['filename'] for r in result['upload_results']] == ["a.jpg", "b.jpg", "c.jpg"]
+        assert provider._active_photoshoots["uid"]['uploaded'] == 2
+        assert session.put.call_count == 3
@@ -0,0 +1,156 @@
+"""
+Unit Tests: Google Drive Provider
+=================================
+Tests for query building and metadata caching.
+No external API calls - runs fast.
+"""
+
+import pytest
+
+
+class TestNameQuery:
+    """Tests for Drive name query construction."""
+
+    @pytest.mark.unit
+    def test_escapes_single_quotes(self):
+        """Should escape single quotes in filenames."""
+        from shared.providers.storage.google_drive_provider import _name_query
+
+        query = _name_query("folder123", "O'Brien.jpg")
+
+        assert "name='O\\'Brien.jpg'" in query
+
+    @pytest.mark.unit
+    def test_escapes_backslashes(self):
+        """Should escape backslashes before quotes."""
+        from shared.providers.storage.google_drive_provider import _escape_query_value
+
+        assert _escape_query_value("a\\b'c") == "a\\\\b\\'c"
+
+
+class TestNameCache:
+    """Tests for the (folder_id, name) metadata cache."""
+
+    @staticmethod
+    def _provider_with_cached(current):
+        from unittest.mock import MagicMock
+        from shared.providers.storage import GoogleDriveProvider
+
+        provider = GoogleDriveProvider()
+        provider._connected = True
+        provider.service = MagicMock()
+        provider.service.files().get().execute.return_value = current
+        provider.service.files().list().execute.return_value = {'files': []}
+        provider._cache_file("folder123", {'id': 'abc', 'name': 'Photo.JPG'})
+        return provider
+
+    @pytest.mark.unit
+    def test_get_file_by_name_validates_cache_hit(self):
+        """Should return a cached hit after a files.get instead of a name query."""
+        provider = self._provider_with_cached({'id': 'abc', 'name': 'Photo.JPG', 'trashed': False})
+        provider.service.files().list.reset_mock()
+
+        assert provider.get_file_by_name("folder123", "Photo.JPG") == {
+            'id': 'abc', 'name': 'Photo.JPG', 'mimeType': None,
+            'size': None, 'createdTime': None, 'modifiedTime': None,
+        }
+        provider.service.files().list.assert_not_called()
+
+    @pytest.mark.unit
+    def test_drops_trashed_cache_hit(self):
+        """Should evict a hit trashed outside this provider and query by name."""
+        provider = self._provider_with_cached({'id': 'abc', 'name': 'Photo.JPG', 'trashed': True})
+
+        assert provider.get_file_by_name("folder123", "Photo.JPG") is None
+        assert provider._get_cached_file("folder123", "Photo.JPG") is None
+
+    @pytest.mark.unit
+    def test_keys_by_exact_name(self):
+        """Should keep files differing only in case as separate entries."""
+        from shared.providers.storage import GoogleDriveProvider
+
+        provider = GoogleDriveProvider()
+        provider._cache_file("f", {'id': '1', 'name': 'A.jpg'})
+        provider._cache_file("f", {'id': '2', 'name': 'a.jpg'})
+
+        assert provider._get_cached_file("f", "A.jpg")['id'] == '1'
+        assert provider._get_cached_file("f", "a.jpg")['id'] == '2'
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self, monkeypatch):
+        """Should drop the oldest entry once the cache is full."""
+        from shared.providers.storage import GoogleDriveProvider
+
+        monkeypatch.setattr(GoogleDriveProvider, "NAME_CACHE_SIZE", 2)
+        provider = GoogleDriveProvider()
+        provider._cache_file("f", {'id': '1', 'name': 'a.jpg'})
+        provider._cache_file("f", {'id': '2', 'name': 'b.jpg'})
+        provider._get_cached_file("f", "a.jpg")
+        provider._cache_file("f", {'id': '3', 'name': 'c.jpg'})
+
+        assert provider._get_cached_file("f", "b.jpg") is None
+        assert provider._get_cached_file("f", "a.jpg")['id'] == '1'
+
+
+class TestStat:
+    """Tests for single-request file stat."""
+
+    @staticmethod
+    def _provider_raising(status):
+        from unittest.mock import MagicMock
+        import httplib2
+        from googleapiclient.errors import HttpError
+        from shared.providers.storage import GoogleDriveProvider
+
+        provider = GoogleDriveProvider()
+        provider._connected = True
+        provider.service = MagicMock()
+        error = HttpError(httplib2.Response({'status': status}), b'')
+        provider.service.files().get().execute.side_effect = error
+        return provider
+
+    @pytest.mark.unit
+    def test_returns_none_when_not_found(self):
+        """Should return None for a 404 instead of raising."""
+        provider = self._provider_raising(404)
+
+        assert provider.stat("missing-file-id") is None
+
+    @pytest.mark.unit
+    def test_raises_other_http_errors(self):
+        """Should propagate non-404 API errors."""
+        from googleapiclient.errors import HttpError
+
+        provider = self._provider_raising(500)
+
+        with pytest.raises(HttpError):
+            provider.stat("some-file-id")
+
+
+class TestDeleteFilesBatch:
+    """Tests for batched deletion."""
+
+    @pytest.mark.unit
+    def test_batches_deletes_and_evicts_cache(self):
+        """Should send deletes in one batch request and drop cached entries."""
+        from unittest.mock import MagicMock
+        from shared.providers.storage import GoogleDriveProvider
+
+        provider = GoogleDriveProvider()
+        provider._connected = True
+        provider.service = MagicMock()
+        provider._cache_file("f", {'id': 'abc', 'name': 'a.jpg'})
+        batch = provider.service.new_batch_http_request.return_value
+
+        def execute():
+            callback = provider.service.new_batch_http_request.call_args.kwargs["callback"]
+            callback("abc", None, None)
+            callback("def", None, Exception("404"))
+        batch.execute.side_effect = execute
+
+        deleted = provider.delete_files_batch(["abc", "def"])
+
+        assert deleted == 1
+        assert batch.add.call_count == 2
+        batch.execute.assert_called_once()
+        assert provider._get_cached_file("f", "a.jpg") is None
@@ -0,0 +1,30 @@
+"""
+Unit Tests: HTTP Utilities
+==========================
+Tests for the shared provider session.
+No external API calls - runs fast.
+"""
+
+import pytest
+
+
+class TestHttpSession:
+    """Tests for the pooled provider session."""
+
+    @pytest.mark.unit
+    def test_returns_same_session(self):
+        """Should create the shared session once and reuse it."""
+        from shared.utils.http_utils import get_http_session
+
+        assert get_http_session() is get_http_session()
+
+    @pytest.mark.unit
+    def test_retries_idempotent_requests_only(self):
+        """Should retry transient statuses without retrying POSTs."""
+        from shared.utils.http_utils import create_http_session
+
+        retries = create_http_session().get_adapter("https://example.com").max_retries
+
+        assert 503 in retries.status_forcelist
+        assert retries.is_retry("GET", 503)
+        assert not retries.is_retry("POST", 503)
@@ -0,0 +1,176 @@
+"""
+Unit Tests: Webhook Notifier
+============================
+Tests for notifier construction and payloads.
+No external API calls - runs fast.
+"""
+
+import pytest
+
+
+class TestDebugPayload:
+    """Tests for debug notification payloads."""
+
+    @pytest.mark.unit
+    def test_includes_client_id(self, monkeypatch):
+        """Should accept client_id and send it with debug notifications."""
+        from unittest.mock import MagicMock
+        from shared.notifications import webhook_notifier
+        from shared import WebhookNotifier
+
+        post = MagicMock()
+        post.return_value.status_code = 200
+        monkeypatch.setattr(webhook_notifier.requests, "post", post)
+        notifier = WebhookNotifier(
+            callback_webhook="https://hooks.example",
+            job_id="job-1",
+            client_id="client-1",
+        )
+
+        assert notifier.send_error("job_failed", "boom") is True
+        assert post.call_args.kwargs["json"]["client_id"] == "client-1"
+
+    @pytest.mark.unit
+    def test_skips_without_webhook(self, monkeypatch):
+        """Should not make any request when no webhook is configured."""
+        from unittest.mock import MagicMock
+        from shared.notifications import webhook_notifier
+        from shared import WebhookNotifier
+
+        post = MagicMock()
+        monkeypatch.setattr(webhook_notifier.requests, "post", post)
+
+        assert WebhookNotifier(callback_webhook=None).send_error("job_failed", "boom") is False
+        assert not post.called
+
+    @pytest.mark.unit
+    def test_accepts_level_enum(self):
+        """Should keep a NotificationLevel passed instead of a string."""
+        from shared import WebhookNotifier, NotificationLevel
+
+        notifier = WebhookNotifier(
+            callback_webhook="https://hooks.example",
+            notification_level=NotificationLevel.VERBOSE,
+        )
+
+        assert notifier.notification_level is NotificationLevel.VERBOSE
+
+
+class TestBufferedDebug:
+    """Tests for batched debug notifications."""
+
+    @staticmethod
+    def _notifier(monkeypatch):
+        from unittest.mock import MagicMock
+        from shared.notifications import webhook_notifier
+        from shared import WebhookNotifier
+
+        post = MagicMock()
+        post.return_value.status_code = 200
+        monkeypatch.setattr(webhook_notifier.requests, "post", post)
+        notifier = WebhookNotifier(
+            callback_webhook="https://hooks.example",
+            notification_level="verbose",
+            batch_debug=True,
+        )
+        return notifier, post
+
+    @pytest.mark.unit
+    def test_sends_objects_without_opt_in(self, monkeypatch):
+        """Should send one JSON object per POST unless batch_debug is set."""
+        notifier, post = self._notifier(monkeypatch)
+        notifier.batch_debug = False
+
+        notifier.send_debug_buffered("storage_connecting", {'provider': 'dropbox'})
+
+        assert post.call_count == 1
+        assert post.call_args.kwargs["json"]['debug_status'] == 'storage_connecting'
+
+    @pytest.mark.unit
+    def test_single_sends_do_not_hold_send_lock(self, monkeypatch):
+        """Should POST single objects without serializing on the send lock."""
+        notifier, post = self._notifier(monkeypatch)
+        lock_free = []
+
+        def check_lock(url, json, **kwargs):
+            lock_free.append(notifier._send_lock.acquire(blocking=False))
+            if lock_free[-1]:
+                notifier._send_lock.release()
+            return post.return_value
+        post.side_effect = check_lock
+
+        notifier.send_debug("storage_connecting")
+        notifier.send_business("job_completed", {})
+
+        assert lock_free == [True, True]
+
+    @pytest.mark.unit
+    def test_flush_sends_one_array(self, monkeypatch):
+        """Should hold queued events until flushed, then POST them together."""
+        notifier, post = self._notifier(monkeypatch)
+
+        notifier.send_debug_buffered("storage_connecting", {'provider': 'dropbox'})
+        notifier.send_debug_buffered("storage_connected")
+        assert not post.called
+
+        assert notifier.flush() is True
+        batch = post.call_args.kwargs["json"]
+        assert [event['debug_status'] for event in batch] == [
+            'storage_connecting', 'storage_connected'
+        ]
+        assert batch[0]['provider'] == 'dropbox'
+
+    @pytest.mark.unit
+    def test_flushes_when_batch_is_full(self, monkeypatch):
+        """Should send automatically once DEBUG_BATCH_SIZE events are queued."""
+        notifier, post = self._notifier(monkeypatch)
+        monkeypatch.setattr(notifier, "DEBUG_BATCH_SIZE", 3)
+
+        for _ in range(3):
+            notifier.send_debug_buffered("processing_bracket_started")
+
+        assert post.call_count == 1
+        assert len(post.call_args.kwargs["json"]) == 3
+
+    @pytest.mark.unit
+    def test_errors_bypass_queue_in_order(self, monkeypatch):
+        """Should flush queued events before sending an error immediately."""
+        notifier, post = self._notifier(monkeypatch)
+
+        notifier.send_debug_buffered("storage_connecting")
+        notifier.send_error("storage_connection_failed", "boom")
+
+        first, second = (call.kwargs["json"] for call in post.call_args_list)
+        assert first[0]['debug_status'] == 'storage_connecting'
+        assert second['debug_status'] == 'storage_connection_failed'
+
+    @pytest.mark.unit
+    def test_error_from_other_thread_waits_for_batch(self, monkeypatch):
+        """Should deliver a batch being sent before an error raised on another thread."""
+        import threading
+        import time
+
+        notifier, post = self._notifier(monkeypatch)
+        monkeypatch.setattr(notifier, "DEBUG_BATCH_SIZE", 1)
+        batch_posting = threading.Event()
+        delivered = []
+
+        def slow_post(url, json, **kwargs):
+            if isinstance(json, list):
+                batch_posting.set()
+                time.sleep(0.1)
+                delivered.append('batch')
+            else:
+                delivered.append(json['debug_status'])
+            return post.return_value
+        post.side_effect = slow_post
+
+        worker = threading.Thread(
+            target=notifier.send_debug_buffered, args=("processing_bracket_started",)
+        )
+        worker.start()
+        batch_posting.wait(timeout=5)
+        notifier.send_error("bracket_upload_failed", "boom")
+        worker.join()
+
+        assert delivered == ['batch', 'bracket_upload_failed']